@@ -1,27 +1,68 @@
 import argparse
+import itertools
+import operator
 import os
+import random
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-from random_data_generation.currency import generate_currencies
-from random_data_generation.numeric import generate_numerics
-from random_data_generation.date import generate_dates
-from random_data_generation.phone_number import generate_phone_numbers
-from random_data_generation.license_plate import generate_license_plates
+from random_data_generation.mixed import iter_mixed, parse_ratios
+from random_data_generation.binary_format import write_binary
+from random_data_generation.histograms import (
+    DRIFT_ALPHA,
+    HISTOGRAM_EXTENSION,
+    OptionHistograms,
+    format_check,
+)
+from random_data_generation.stream import (
+    build_sampler,
+    iter_chunks,
+    iter_unique_samples,
+)
+from random_data_generation.shards import iter_parallel_unique, write_shards
+from random_data_generation.partition import parse_partition, partition_size
+from random_data_generation.stratified import iter_stratified, plan_strata
+from random_data_generation.records import (
+    RECORD_FORMATS,
+    iter_unique_records,
+    write_records,
+)
+from random_data_generation.profile import get_profile, load_profile, set_profile
+from random_data_generation.registry import (
+    get_generator_types,
+    is_generator_type,
+    load_generator,
+    set_import_debug,
+)
+from random_data_generation.checkpoint import CHECKPOINT_EVERY, write_resumable
+from random_data_generation.append import append_unique
+from random_data_generation.dedup_store import iter_store_unique
+from random_data_generation.splits import parse_splits, write_splits
+from random_data_generation.writer import (
+    COMPRESSION_EXTENSIONS,
+    WRITER_MAX_QUEUED_CHUNKS,
+    BackgroundWriter,
+)
 
+# Number of entries handed to the background writer at a time
+WRITE_CHUNK_SIZE = 65536
 
-def create_output_dir(base_path, data_type):
+
+def create_output_dir(base_path, data_type, extension="txt"):
     """
     Creates an output directory and file path for saving generated data.
 
     Args:
         base_path (str): The base output directory path.
         data_type (str): The type of data being generated (e.g., "currency").
+        extension (str): The file extension of the output format (e.g., "txt", "bin").
 
     Returns:
         str: The full path to the file where data will be saved.
     """
 
-    filename = f"{data_type}.txt"
+    filename = f"{data_type}.{extension}"
     output_path = os.path.join(base_path, filename)
 
     # Ensure the directory exists
@@ -46,6 +87,443 @@ def write_to_file(data, file_path):
         f.write(content)
 
 
+def write_stream(
+    data,
+    number_of_generated_sample,
+    file_path,
+    compression=None,
+    chunk_size=WRITE_CHUNK_SIZE,
+    max_queued_chunks=WRITER_MAX_QUEUED_CHUNKS,
+):
+    """
+    Writes lazily generated data to a file through a background writer thread.
+
+    Entries are taken from `data` in fixed-size chunks and queued to the writer, so encoding,
+    compression and disk writes overlap with generation. The bounded queue applies backpressure,
+    keeping at most `max_queued_chunks` chunks in memory besides the deduplication set.
+
+    Args:
+        data (iterator): The entries to be written, generated lazily.
+        number_of_generated_sample (int): The number of entries to write.
+        file_path (str): The path to the file where data will be written.
+        compression (str): None for plain text, or one of `COMPRESSION_EXTENSIONS`.
+        chunk_size (int): The number of entries in each chunk.
+        max_queued_chunks (int): The number of chunks that may wait for the writer thread.
+
+    Returns:
+        int: The number of entries written.
+    """
+
+    with BackgroundWriter(file_path, compression, max_queued_chunks) as writer:
+        for chunk in iter_chunks(data, number_of_generated_sample, chunk_size):
+            writer.write(chunk)
+
+    return writer.rows_written
+
+
+# Output formats, mapped to their file extension and writer; record formats are streamed by `write_records`
+output_formats = {
+    "text": ("txt", write_to_file),
+    "binary": ("bin", write_binary),
+    **{
+        record_format: (extension, None)
+        for record_format, extension in RECORD_FORMATS.items()
+    },
+}
+
+
+def parse_types(value):
+    """
+    Parses the `--type` argument into a list of data types.
+
+    Args:
+        value (str): A comma-separated list of data types, or "all" for every type.
+
+    Returns:
+        list: The requested data types, without duplicates and in the given order.
+    """
+
+    if value == "all":
+        return get_generator_types()
+
+    generated_types = []
+    for data_type in value.split(","):
+        data_type = data_type.strip()
+        if data_type and data_type not in generated_types:
+            generated_types.append(data_type)
+    return generated_types
+
+
+def parse_numbers(value, generated_types):
+    """
+    Parses the `--number` argument into the number of entries for each data type.
+
+    Args:
+        value (str): A comma-separated list holding a default count and/or per-type
+            overrides, e.g. "250000" or "100000,date=500000".
+        generated_types (list): The data types being generated.
+
+    Returns:
+        dict: The number of entries to generate for each data type.
+    """
+
+    default_number = 250000
+    overrides = {}
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if "=" in item:
+            data_type, number = item.split("=", 1)
+            overrides[data_type.strip()] = int(number)
+        else:
+            default_number = int(item)
+
+    for data_type in overrides:
+        assert (
+            data_type in generated_types
+        ), f"Number given for a type that is not generated: {data_type}"
+
+    return {
+        data_type: overrides.get(data_type, default_number)
+        for data_type in generated_types
+    }
+
+
+def parse_strata_fields(value):
+    """
+    Parses the `--stratify` argument into the options to stratify on.
+
+    Args:
+        value (str): A comma-separated list of options, or "all" for every option of each type.
+
+    Returns:
+        list: The options, or None for every option.
+    """
+
+    if value == "all":
+        return None
+    return [field.strip() for field in value.split(",") if field.strip()]
+
+
+def iter_rows(generated_type, args, jobs=1, limit=None, histograms=None):
+    """
+    Lazily generates the unique entries of a data type, in generation order.
+
+    Args:
+        generated_type (str): The type of data to generate, or "mixed" for the `--mix` stream.
+        args (argparse.Namespace): The parsed command-line arguments.
+        jobs (int): The number of worker processes generating samples, 1 to generate in this process.
+        limit (int): The number of entries that will be taken, or None if unknown.
+        histograms (OptionHistograms): Histograms counting the options of every draw, or None.
+
+    Returns:
+        iterator: The entries to write.
+    """
+
+    partition = parse_partition(args.shard) if args.shard else None
+    key = None
+    if args.stratify:
+        samples = iter_stratified(
+            generated_type,
+            limit,
+            parse_strata_fields(args.stratify),
+            args.min_per_stratum,
+        )
+    elif generated_type == "mixed":
+        samples = iter_mixed(parse_ratios(args.mix), partition)
+        key = operator.itemgetter(1)
+    elif histograms is not None:
+        # Records carry the options each sample was drawn with, from the same random stream
+        samples = iter_unique_records(
+            generated_type, partition=partition, histograms=histograms
+        )
+        key = operator.itemgetter("text")
+    elif jobs > 1:
+        samples = iter_parallel_unique(generated_type, jobs, partition=partition)
+    else:
+        samples = iter_unique_samples(generated_type, partition=partition)
+
+    if args.dedup_store:
+        # Skip the samples already claimed by previous or concurrent runs
+        samples = iter_store_unique(samples, args.dedup_store, key, limit)
+
+    if histograms is not None:
+        samples = map(key, samples)
+
+    if args.noise:
+        # Corrupt the unique samples in batches as they are generated, never beyond the ones taken;
+        # the noise stage pulls in NumPy, so it is only imported when used
+        from random_data_generation.augment import (
+            compile_noise,
+            iter_augmented,
+            iter_augmented_pairs,
+            parse_noise,
+        )
+
+        noise = compile_noise(**parse_noise(args.noise))
+        generator = build_noise_generator(generated_type, args)
+        if limit is not None:
+            samples = itertools.islice(samples, limit)
+        if generated_type == "mixed":
+            samples = iter_augmented_pairs(samples, noise, generator=generator)
+        else:
+            samples = iter_augmented(samples, noise, generator=generator)
+
+    if generated_type == "mixed":
+        return (f"{data_type}\t{sample}" for data_type, sample in samples)
+    return samples
+
+
+def build_noise_generator(generated_type, args):
+    """
+    Creates the random generator of the noise stage of an output.
+
+    With `--seed`, the generator is seeded from its own key, so the noise is reproducible and the
+    generator of the samples is left untouched.
+
+    Args:
+        generated_type (str): The type of data to generate, or "mixed" for the `--mix` stream.
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        random.Random: The generator, or None for one seeded from system entropy.
+    """
+
+    if args.seed is None:
+        return None
+    return random.Random(f"{args.seed}/{output_name(generated_type, args)}/noise")
+
+
+def output_name(generated_type, args):
+    """
+    Builds the base name of the output files of a data type.
+
+    Nodes generating one partition of a corpus (`--shard i/N`) get distinct names, e.g.
+    "currency.part-2-of-8", so their outputs can share a directory.
+
+    Args:
+        generated_type (str): The type of data to generate, or "mixed" for the `--mix` stream.
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        str: The base name of the output files.
+    """
+
+    if not args.shard:
+        return generated_type
+    partition_index, partition_count = parse_partition(args.shard)
+    return f"{generated_type}.part-{partition_index}-of-{partition_count}"
+
+
+def write_histograms(histograms, output_path, name):
+    """
+    Saves the option histograms of an output next to it, as `<name>.hist.json`.
+
+    Args:
+        histograms (OptionHistograms): The histograms, or None when the output is not validated.
+        output_path (str): The output directory path.
+        name (str): The base name of the output files.
+    """
+
+    if histograms is not None:
+        histograms.write(create_output_dir(output_path, name, HISTOGRAM_EXTENSION))
+
+
+def validate_histograms(generated_types, output_path, args):
+    """
+    Checks the option histograms of each generated type against the weights and reports drift.
+
+    Args:
+        generated_types (list): The generated data types.
+        output_path (str): The output directory path.
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        bool: Whether every option of every type honors its weights.
+    """
+
+    passed = True
+    for generated_type in generated_types:
+        name = output_name(generated_type, args)
+        histograms = OptionHistograms.read(
+            create_output_dir(output_path, name, HISTOGRAM_EXTENSION)
+        )
+        for check in histograms.check(args.drift_alpha, args.max_kl):
+            print(format_check(check, name))
+            passed = passed and not check.drifted
+    return passed
+
+
+def generate_and_write(generated_type, number_of_generated_sample, output_path, args):
+    """
+    Generates data of a single type and writes it to `<type>.<extension>` in the output directory.
+
+    Args:
+        generated_type (str): The type of data to generate, or "mixed" for the `--mix` stream.
+        number_of_generated_sample (int): The number of entries to generate.
+        output_path (str): The output directory path.
+        args (argparse.Namespace): The parsed command-line arguments selecting the output options.
+
+    Returns:
+        tuple: The data type, the number of entries written and the elapsed time in seconds.
+    """
+
+    start_time = time.perf_counter()
+
+    name = output_name(generated_type, args)
+    histograms = OptionHistograms(generated_type) if args.validate else None
+    if args.seed is not None:
+        # Seed each output separately, so it does not depend on the other types or on --jobs
+        random.seed(f"{args.seed}/{name}")
+    extension, writer = output_formats[args.format]
+    if args.compress:
+        extension = f"{extension}.{COMPRESSION_EXTENSIONS[args.compress]}"
+
+    if args.format in RECORD_FORMATS:
+        # Stream records holding each sample with the values it was formatted from
+        partition = parse_partition(args.shard) if args.shard else None
+        if args.stratify:
+            records = iter_stratified(
+                generated_type,
+                number_of_generated_sample,
+                parse_strata_fields(args.stratify),
+                args.min_per_stratum,
+                records=True,
+            )
+        else:
+            records = iter_unique_records(
+                generated_type, partition=partition, histograms=histograms
+            )
+        if args.noise:
+            from random_data_generation.augment import (
+                compile_noise,
+                iter_augmented_records,
+                parse_noise,
+            )
+
+            records = itertools.islice(records, number_of_generated_sample)
+            records = iter_augmented_records(
+                records,
+                compile_noise(**parse_noise(args.noise)),
+                generator=build_noise_generator(generated_type, args),
+            )
+        number_written = write_records(
+            records,
+            number_of_generated_sample,
+            create_output_dir(output_path, name, extension),
+            args.format,
+            args.compress,
+            args.chunk_size,
+            args.queue_size,
+        )
+        write_histograms(histograms, output_path, name)
+        return generated_type, number_written, time.perf_counter() - start_time
+
+    if args.shard_size:
+        # Rotate across shard files, generating samples in worker processes
+        manifest = write_shards(
+            iter_rows(generated_type, args, args.jobs, number_of_generated_sample),
+            name,
+            number_of_generated_sample,
+            output_path,
+            args.shard_size,
+            args.compress,
+            extension,
+        )
+        return generated_type, manifest["rows"], time.perf_counter() - start_time
+
+    if args.splits:
+        # Assign each sample to a disjoint split as it is generated
+        split_rows = write_splits(
+            iter_rows(
+                generated_type,
+                args,
+                limit=number_of_generated_sample,
+                histograms=histograms,
+            ),
+            name,
+            number_of_generated_sample,
+            output_path,
+            parse_splits(args.splits),
+            args.compress,
+            extension,
+        )
+        write_histograms(histograms, output_path, name)
+        return (
+            generated_type,
+            sum(split_rows.values()),
+            time.perf_counter() - start_time,
+        )
+
+    file_path = create_output_dir(output_path, name, extension)
+    if args.append_unique:
+        # Top up the existing output with rows it does not hold yet
+        partition = parse_partition(args.shard) if args.shard else None
+        number_written = append_unique(
+            build_sampler(generated_type, partition),
+            number_of_generated_sample,
+            file_path,
+        )
+        return generated_type, number_written, time.perf_counter() - start_time
+
+    if args.checkpoint_every or args.resume:
+        # Checkpoint periodically so a failed run can continue where it stopped
+        partition = parse_partition(args.shard) if args.shard else None
+        number_written = write_resumable(
+            build_sampler(generated_type, partition),
+            number_of_generated_sample,
+            file_path,
+            args.checkpoint_every or CHECKPOINT_EVERY,
+            args.resume,
+        )
+        return generated_type, number_written, time.perf_counter() - start_time
+
+    if args.pipeline or args.compress:
+        # Write on a background thread while the samples are being generated
+        number_written = write_stream(
+            iter_rows(
+                generated_type,
+                args,
+                limit=number_of_generated_sample,
+                histograms=histograms,
+            ),
+            number_of_generated_sample,
+            file_path,
+            args.compress,
+            args.chunk_size,
+            args.queue_size,
+        )
+        write_histograms(histograms, output_path, name)
+        return generated_type, number_written, time.perf_counter() - start_time
+
+    if (
+        generated_type == "mixed"
+        or args.shard
+        or args.dedup_store
+        or args.noise
+        or args.stratify
+        or histograms is not None
+    ):
+        result = list(
+            itertools.islice(
+                iter_rows(
+                    generated_type,
+                    args,
+                    limit=number_of_generated_sample,
+                    histograms=histograms,
+                ),
+                number_of_generated_sample,
+            )
+        )
+    else:
+        result = load_generator(generated_type).generate(number_of_generated_sample)
+    writer(result, file_path)
+    write_histograms(histograms, output_path, name)
+
+    return generated_type, len(result), time.perf_counter() - start_time
+
+
 def main():
     """
     Main function to parse arguments, generate data, and save it to a file.
@@ -60,48 +538,319 @@ def main():
     parser.add_argument(
         "--type",
         type=str,
-        help="Type to execute (e.g., 'currency, numeric, date, license_plate, phone_number')",
+        help="Comma-separated types to execute, or 'all' (e.g., 'currency, numeric, date, license_plate, phone_number')",
     )
     parser.add_argument(
         "--number",
-        type=int,
-        default=250000,
-        help="Number of entires to generate (default: 250000)",
+        type=str,
+        default="250000",
+        help="Number of entires to generate, optionally with per-type overrides such as '100000,date=500000' (default: 250000)",
     )
     parser.add_argument("--output", type=str, help="Path to the output directory")
+    parser.add_argument(
+        "--mix",
+        type=str,
+        help="Write one shuffled, type-tagged stream to mixed.txt with the given ratios (e.g., 'currency=5,date=2' or 'all')",
+    )
+    parser.add_argument(
+        "--profile-file",
+        type=str,
+        help="JSON or TOML file overriding generation constants such as weights, ranges and choice lists (e.g., '{\"DATE_FORMAT_WEIGHTS\": [1, 1, 1, 1, 1, 1, 1]}')",
+    )
+    parser.add_argument(
+        "--table-cache",
+        type=str,
+        help="Directory where compiled lookup tables are cached and memory-mapped by later runs and worker processes (default: $RANDOM_DATA_TABLE_CACHE)",
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        default="text",
+        choices=list(output_formats),
+        help="Output format: newline-separated text, binary with an offsets index for memory-mapped random access, or JSONL/CSV records holding each sample with the values it was formatted from (default: text)",
+    )
+    parser.add_argument(
+        "--stratify",
+        type=str,
+        nargs="?",
+        const="all",
+        help="Allocate an exact quota to every combination of options, in proportion to their weights, instead of drawing options independently; optionally limited to a comma-separated list of options (e.g., 'format,year_type,year_digit')",
+    )
+    parser.add_argument(
+        "--min-per-stratum",
+        type=int,
+        default=1,
+        help="Smallest number of entries of each combination of options with --stratify (default: 1)",
+    )
+    parser.add_argument(
+        "--noise",
+        type=str,
+        help="Corrupt the samples with OCR-style noise as they are generated, given as rule=probability pairs (e.g., 'digit_confusion=0.05,drop_separator=0.1,space_jitter=0.02'); record output keeps the clean text and adds a noisy_text field",
+    )
+    parser.add_argument(
+        "--compress",
+        type=str,
+        choices=list(COMPRESSION_EXTENSIONS),
+        help="Compress text or record output with a standard-library codec on a background thread (e.g., 'gzip', 'xz', 'bz2')",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Overlap generation with file writing by streaming fixed-size chunks to a background writer thread",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=WRITE_CHUNK_SIZE,
+        help=f"Number of entries per chunk in pipelined mode (default: {WRITE_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=WRITER_MAX_QUEUED_CHUNKS,
+        help=f"Maximum number of chunks waiting to be written in pipelined mode (default: {WRITER_MAX_QUEUED_CHUNKS})",
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        help="Split each type into files of this many entries (<type>-00000.txt, ...) with a <type>-manifest.json",
+    )
+    parser.add_argument(
+        "--shard",
+        type=str,
+        help="Generate only partition i of N (e.g., '2/8') by stable hash, so the outputs of N nodes are disjoint; --number stays the total across nodes",
+    )
+    parser.add_argument(
+        "--splits",
+        type=str,
+        help="Write disjoint <type>.train.txt, <type>.val.txt and <type>.test.txt files with these ratios of --number (e.g., '0.9,0.05,0.05')",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        help=f"Checkpoint the random generator state, row count and deduplication state every this many entries, next to the output (default with --resume: {CHECKPOINT_EVERY})",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the last checkpoint of an interrupted run, appending to its partially written output",
+    )
+    parser.add_argument(
+        "--append-unique",
+        action="store_true",
+        help="Append --number new entries to the existing output file, skipping entries it already holds",
+    )
+    parser.add_argument(
+        "--dedup-store",
+        type=str,
+        help="SQLite file of sample fingerprints shared across runs and concurrent jobs; entries already in it are skipped and new entries are recorded",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Maximum number of types generated concurrently, or of worker processes generating a sharded type (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed of the random generator; the same seed and options write byte-identical output",
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Count the sampled options of each type, save them to <type>.hist.json and fail on drift from the weights",
+    )
+    parser.add_argument(
+        "--drift-alpha",
+        type=float,
+        default=DRIFT_ALPHA,
+        help=f"Chi-square p-value below which --validate reports drift (default: {DRIFT_ALPHA:g})",
+    )
+    parser.add_argument(
+        "--max-kl",
+        type=float,
+        help="Largest KL divergence of the sampled options from their weights, in nats, allowed by --validate",
+    )
+    parser.add_argument(
+        "--debug-imports",
+        action="store_true",
+        help="Report on stderr how long each generator module takes to import",
+    )
 
     args = parser.parse_args()
 
-    generated_type = args.type
-    number_of_generated_sample = args.number
     output_path = args.output
 
-    # Generate data based on specified type
-    data_generators = {
-        "currency": generate_currencies,
-        "numeric": generate_numerics,
-        "date": generate_dates,
-        "phone_number": generate_phone_numbers,
-        "license_plate": generate_license_plates,
-    }
+    if args.debug_imports:
+        set_import_debug(True)
+    # Share compiled tables with later runs, and compile the profile once, before any sampler is built
+    if args.table_cache:
+        # The table cache pulls in NumPy, so it is only imported when used
+        from random_data_generation.table_cache import set_cache_dir
+
+        set_cache_dir(args.table_cache)
+    if args.profile_file:
+        set_profile(load_profile(args.profile_file))
 
     # Validate arguments
-    assert generated_type in data_generators, f"Unknown data type: {generated_type}"
-    assert number_of_generated_sample >= 0, "Number of entries must be non-negative"
+    if args.mix:
+        parse_ratios(args.mix)
+        generated_types = ["mixed"]
+    else:
+        generated_types = parse_types(args.type or "")
+        assert generated_types, "No data type given"
+        for generated_type in generated_types:
+            assert is_generator_type(
+                generated_type
+            ), f"Unknown data type: {generated_type}"
+    numbers_of_generated_sample = parse_numbers(args.number, generated_types)
+    for number_of_generated_sample in numbers_of_generated_sample.values():
+        assert number_of_generated_sample >= 0, "Number of entries must be non-negative"
+    if args.shard:
+        # Each node writes its share of the total number of entries
+        partition_index, partition_count = parse_partition(args.shard)
+        numbers_of_generated_sample = {
+            generated_type: partition_size(
+                number_of_generated_sample, partition_index, partition_count
+            )
+            for generated_type, number_of_generated_sample in numbers_of_generated_sample.items()
+        }
+    assert args.jobs >= 1, "Number of jobs must be positive"
+    assert not (
+        args.compress and args.format == "binary"
+    ), "Compression is only supported for text and record output"
+    if args.stratify:
+        assert not args.mix, "Stratification is not supported with --mix"
+        assert args.min_per_stratum >= 0, "Minimum per stratum must be non-negative"
+        assert not (
+            args.shard
+            or args.dedup_store
+            or args.checkpoint_every
+            or args.resume
+            or args.append_unique
+        ), "Stratification cannot be combined with --shard, a deduplication store, checkpointing or appending"
+        for generated_type in generated_types:
+            # Fail early on options a type lacks or quotas that cannot be met
+            plan_strata(
+                generated_type,
+                numbers_of_generated_sample[generated_type],
+                parse_strata_fields(args.stratify),
+                args.min_per_stratum,
+            )
+    if args.noise:
+        from random_data_generation.augment import compile_noise, parse_noise
+
+        compile_noise(**parse_noise(args.noise))
+        assert not (
+            args.checkpoint_every or args.resume or args.append_unique
+        ), "Noise cannot be combined with checkpointing or appending"
+    if args.validate:
+        assert not args.mix, "Validation is not supported with --mix"
+        assert not (
+            args.stratify
+            or args.shard_size
+            or args.checkpoint_every
+            or args.resume
+            or args.append_unique
+        ), "Validation cannot be combined with --stratify, --shard-size, checkpointing or appending"
+        assert 0 <= args.drift_alpha <= 1, "Drift significance level must be in [0, 1]"
+        for generated_type in generated_types:
+            # Fail early on types without sampled options
+            OptionHistograms(generated_type)
+    if args.format in RECORD_FORMATS:
+        assert not args.mix, "Record output is not supported with --mix"
+        assert (
+            not args.dedup_store
+        ), "Record output cannot be combined with a deduplication store"
+    assert not (
+        args.pipeline and args.format != "text"
+    ), "Pipelined mode is only supported for text output"
+    assert not (
+        args.shard_size and args.format != "text"
+    ), "Sharding is only supported for text output"
+    assert args.chunk_size >= 1, "Chunk size must be positive"
+    assert args.queue_size >= 1, "Queue size must be positive"
+    assert (
+        args.shard_size is None or args.shard_size >= 1
+    ), "Shard size must be positive"
+    if args.splits:
+        parse_splits(args.splits)
+        assert not (
+            args.shard_size or args.format != "text"
+        ), "Splits are only supported for unsharded text output"
+        assert not (
+            args.checkpoint_every or args.resume or args.append_unique
+        ), "Splits cannot be combined with checkpointing or appending"
+    if args.checkpoint_every or args.resume:
+        assert (
+            args.checkpoint_every is None or args.checkpoint_every >= 1
+        ), "Checkpoint interval must be positive"
+        assert not args.mix, "Checkpointing is not supported with --mix"
+        assert not (
+            args.compress or args.shard_size or args.format != "text"
+        ), "Checkpointing is only supported for uncompressed, unsharded text output"
+    if args.append_unique:
+        assert not args.mix, "Appending is not supported with --mix"
+        assert not (
+            args.compress or args.shard_size or args.format != "text"
+        ), "Appending is only supported for uncompressed, unsharded text output"
+        assert not (
+            args.checkpoint_every or args.resume
+        ), "Appending cannot be combined with checkpointing"
+    if args.dedup_store:
+        assert not (
+            args.checkpoint_every or args.resume or args.append_unique
+        ), "The deduplication store cannot be combined with checkpointing or appending"
 
     # Ensure the output directory exists
     output_dir = os.path.dirname(output_path)
     os.makedirs(output_dir, exist_ok=True)
 
-    file_path = create_output_dir(output_path, generated_type)
-    result = data_generators[generated_type](number_of_generated_sample)
-    write_to_file(result, file_path)
+    # Generate each type in its own process when more than one type is requested,
+    # sharded output instead spends the processes on generating a single type at a time
+    reports = []
+    jobs = 1 if args.shard_size else min(args.jobs, len(generated_types))
+    if jobs == 1:
+        for generated_type in generated_types:
+            reports.append(
+                generate_and_write(
+                    generated_type,
+                    numbers_of_generated_sample[generated_type],
+                    output_path,
+                    args,
+                )
+            )
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=set_profile, initargs=(get_profile(),)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    generate_and_write,
+                    generated_type,
+                    numbers_of_generated_sample[generated_type],
+                    output_path,
+                    args,
+                )
+                for generated_type in generated_types
+            ]
+            for future in as_completed(futures):
+                reports.append(future.result())
 
     # Measure processing time
     end_time = time.perf_counter()
     elapsed_time = end_time - start_time
+    if len(reports) > 1:
+        for generated_type, number_written, type_elapsed_time in sorted(reports):
+            print(
+                f"{generated_type}: {number_written} entries in {type_elapsed_time:.2f} seconds."
+            )
     print(f"Processing completed in {elapsed_time:.2f} seconds.")
 
+    if args.validate and not validate_histograms(generated_types, output_path, args):
+        sys.exit("Sampled options drifted from their weights")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,195 @@
+import argparse
+import asyncio
+import contextlib
+import os
+
+from random_data_generation.profile import load_profile, set_profile
+from random_data_generation.registry import is_generator_type, set_import_debug
+from random_data_generation.server import (
+    SERVER_BATCH_SIZE,
+    SERVER_PREFETCH_BATCHES,
+    GenerationServer,
+)
+from random_data_generation.shared_ring import (
+    RING_BATCH_SIZE,
+    RING_SLOT_COUNT,
+    RING_SLOT_SIZE,
+    RING_TIMEOUT,
+    SharedRing,
+    produce,
+)
+
+
+async def serve(args):
+    """
+    Runs the generation server until it is interrupted.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+
+    async with GenerationServer(args.jobs, args.batch_size, args.prefetch) as server:
+        listener = await server.start(args.socket, args.host, args.port)
+        address = args.socket or "{}:{}".format(*listener.sockets[0].getsockname()[:2])
+        print(f"Serving on {address}")
+        await server.serve_forever()
+
+
+def produce_rings(args):
+    """
+    Fills one shared-memory ring per consumer until `--number` samples are put or it is interrupted.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        int: The number of samples put.
+    """
+
+    with contextlib.ExitStack() as stack:
+        rings = [
+            stack.enter_context(
+                SharedRing.create(
+                    f"{args.ring}-{index}", args.slot_count, args.slot_size
+                )
+            )
+            for index in range(args.consumers)
+        ]
+        print(f"Producing {args.type} into {', '.join(ring.name for ring in rings)}")
+        return produce(
+            args.type,
+            rings,
+            args.number,
+            args.batch_size or RING_BATCH_SIZE,
+            args.timeout,
+        )
+
+
+def main():
+    """
+    Main function to parse arguments and serve generated data to local clients.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Serve batches of random formatted data to local clients, such as training jobs."
+    )
+    parser.add_argument("--socket", type=str, help="Path of a Unix socket to listen on")
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="TCP host to listen on when no socket is given (default: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=0,
+        help="TCP port to listen on when no socket is given (default: a free port)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes generating samples (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help=f"Number of samples a worker generates per task (default: {SERVER_BATCH_SIZE}, or {RING_BATCH_SIZE} with --ring)",
+    )
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=SERVER_PREFETCH_BATCHES,
+        help=f"Number of batches generated ahead of each client, per type (default: {SERVER_PREFETCH_BATCHES})",
+    )
+    parser.add_argument(
+        "--profile-file",
+        type=str,
+        help="JSON or TOML file overriding generation constants such as weights, ranges and choice lists",
+    )
+    parser.add_argument(
+        "--table-cache",
+        type=str,
+        help="Directory where compiled lookup tables are cached and memory-mapped by later runs and worker processes (default: $RANDOM_DATA_TABLE_CACHE)",
+    )
+
+    parser.add_argument(
+        "--ring",
+        type=str,
+        help="Instead of serving over a socket, write samples into shared-memory rings named <ring>-0, <ring>-1, ... for co-located consumer processes",
+    )
+    parser.add_argument(
+        "--type",
+        type=str,
+        help="Type of data written into the rings (e.g., 'date')",
+    )
+    parser.add_argument(
+        "--consumers",
+        type=int,
+        default=1,
+        help="Number of rings, one per consumer process (default: 1)",
+    )
+    parser.add_argument(
+        "--number",
+        type=int,
+        help="Total number of samples written into the rings (default: until interrupted)",
+    )
+    parser.add_argument(
+        "--slot-count",
+        type=int,
+        default=RING_SLOT_COUNT,
+        help=f"Number of slots per ring (default: {RING_SLOT_COUNT})",
+    )
+    parser.add_argument(
+        "--slot-size",
+        type=int,
+        default=RING_SLOT_SIZE,
+        help=f"Size of a ring slot in bytes (default: {RING_SLOT_SIZE})",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=RING_TIMEOUT,
+        help=f"Seconds to wait for a consumer to read before giving up (default: {RING_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--debug-imports",
+        action="store_true",
+        help="Report on stderr how long each generator module takes to import",
+    )
+
+    args = parser.parse_args()
+    if args.debug_imports:
+        set_import_debug(True)
+    if args.table_cache:
+        # The table cache pulls in NumPy, so it is only imported when used
+        from random_data_generation.table_cache import set_cache_dir
+
+        set_cache_dir(args.table_cache)
+    if args.profile_file:
+        set_profile(load_profile(args.profile_file))
+    assert args.jobs >= 1, "Number of jobs must be positive"
+    assert (
+        args.batch_size is None or args.batch_size >= 1
+    ), "Batch size must be positive"
+    assert args.prefetch >= 1, "Prefetch must be positive"
+    if args.ring:
+        assert is_generator_type(args.type), f"Unknown data type: {args.type}"
+        assert args.consumers >= 1, "Number of consumers must be positive"
+        assert (
+            args.number is None or args.number >= 0
+        ), "Number of entries must be non-negative"
+
+    try:
+        if args.ring:
+            produce_rings(args)
+        else:
+            args.batch_size = args.batch_size or SERVER_BATCH_SIZE
+            asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
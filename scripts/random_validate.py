@@ -0,0 +1,70 @@
+import argparse
+import os
+import sys
+
+from random_data_generation.histograms import (
+    DRIFT_ALPHA,
+    HISTOGRAM_EXTENSION,
+    OptionHistograms,
+    format_check,
+)
+from random_data_generation.profile import load_profile, set_profile
+
+
+def main():
+    """
+    Main function to check saved option histograms against the weights and fail on drift.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Check the option histograms saved by random_generator.py --validate against the configured weights."
+    )
+    parser.add_argument(
+        "histograms",
+        nargs="+",
+        help=f"Histogram files (<type>.{HISTOGRAM_EXTENSION}); files of the same type, such as the parts of a sharded run, are merged",
+    )
+    parser.add_argument(
+        "--profile-file",
+        type=str,
+        help="Path to the JSON or TOML generation profile the output was generated with",
+    )
+    parser.add_argument(
+        "--drift-alpha",
+        type=float,
+        default=DRIFT_ALPHA,
+        help=f"Chi-square p-value below which an option counts as drifted (default: {DRIFT_ALPHA:g})",
+    )
+    parser.add_argument(
+        "--max-kl",
+        type=float,
+        help="Largest KL divergence of the sampled options from their weights, in nats",
+    )
+
+    args = parser.parse_args()
+
+    if args.profile_file:
+        set_profile(load_profile(args.profile_file))
+    assert 0 <= args.drift_alpha <= 1, "Drift significance level must be in [0, 1]"
+
+    # Merge the histograms of each type before checking them
+    merged = {}
+    for file_path in args.histograms:
+        assert os.path.isfile(file_path), f"No such histogram file: {file_path}"
+        histograms = OptionHistograms.read(file_path)
+        if histograms.data_type in merged:
+            merged[histograms.data_type].merge(histograms)
+        else:
+            merged[histograms.data_type] = histograms
+
+    passed = True
+    for data_type, histograms in merged.items():
+        for check in histograms.check(args.drift_alpha, args.max_kl):
+            print(format_check(check, data_type))
+            passed = passed and not check.drifted
+    if not passed:
+        sys.exit("Sampled options drifted from their weights")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import mmap
+import os
+from .stream import iter_chunks
+from .writer import BackgroundWriter
+
+# Number of new rows handed to the background writer at a time
+APPEND_CHUNK_SIZE = 65536
+
+
+def line_key(sample):
+    """
+    Computes the key of a sample in a line index, matching the keys built by `build_line_index`.
+
+    Args:
+        sample (str): The sample.
+
+    Returns:
+        int: The key of the sample's line.
+    """
+
+    return hash(f"{sample}\n".encode("utf-8"))
+
+
+def build_line_index(file_path):
+    """
+    Builds a deduplication index of the lines of an existing output file.
+
+    The file is memory-mapped and its lines are hashed as raw bytes, without decoding them into
+    Python strings, so the index costs one integer per line and loads much faster than regenerating
+    the data. Keys are only meaningful within the current process.
+
+    Args:
+        file_path (str): The path to a newline-separated text file.
+
+    Returns:
+        set: The keys of the file's lines, as computed by `line_key`.
+    """
+
+    if not os.path.exists(file_path) or not os.path.getsize(file_path):
+        return set()
+
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            index = set(map(hash, iter(mm.readline, b"")))
+
+            # The last line has no trailing newline, index it the way `line_key` does
+            # (`rfind` is given a start because it searches from the current position by default)
+            if mm[-1:] != b"\n":
+                last_line_start = mm.rfind(b"\n", 0) + 1
+                last_line = mm[last_line_start:]
+                index.discard(hash(last_line))
+                index.add(hash(last_line + b"\n"))
+
+    return index
+
+
+def append_unique(
+    sampler, number_of_generated_sample, file_path, chunk_size=APPEND_CHUNK_SIZE
+):
+    """
+    Appends new samples to an existing output file, skipping any sample already in the file.
+
+    Args:
+        sampler (callable): A function taking no arguments that returns a sample. New samples are
+            deduplicated against the same index as the file, so no separate set of strings is kept.
+        number_of_generated_sample (int): The number of new samples to append.
+        file_path (str): The path to the newline-separated text file to top up.
+        chunk_size (int): The number of rows handed to the background writer at a time.
+
+    Returns:
+        int: The number of rows appended.
+    """
+
+    index = build_line_index(file_path)
+    index_add = index.add
+
+    def iter_new_samples():
+        for sample in iter(sampler, None):
+            key = line_key(sample)
+            if key not in index:
+                index_add(key)
+                yield sample
+
+    with BackgroundWriter(file_path, append=True) as writer:
+        for chunk in iter_chunks(
+            iter_new_samples(), number_of_generated_sample, chunk_size
+        ):
+            writer.write(chunk)
+
+    return writer.rows_written
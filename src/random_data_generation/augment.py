@@ -0,0 +1,259 @@
+import collections
+import itertools
+import random
+from .constants import ARABIC_DIGITS, THAI_DIGITS
+from .entropy import random_columns
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, batches fall back to the pure Python path
+    np = None
+
+# Characters a separator drop may remove
+NOISE_SEPARATORS = " -/.,"
+
+# Size of the per-character tables, covering the Basic Multilingual Plane; characters beyond it are never corrupted
+NOISE_TABLE_SIZE = 0x10000
+
+# Number of samples corrupted at a time by the streaming helpers
+AUGMENT_BATCH_SIZE = 65536
+
+# Corruption rules and their default probability, applied independently to every character
+NOISE_RULES = {
+    "digit_confusion": 0.0,
+    "drop_separator": 0.0,
+    "space_jitter": 0.0,
+}
+
+# Precompiled corruption rules, each a table indexed by code point: the character a digit is confused with,
+# and the probabilities of confusing a character, dropping it, and inserting a space after it
+NoiseTables = collections.namedtuple(
+    "NoiseTables", ["targets", "confusion", "drop", "jitter"]
+)
+
+
+def parse_noise(value):
+    """
+    Parses a noise specification such as "digit_confusion=0.05,drop_separator=0.1".
+
+    Args:
+        value (str): Comma-separated `rule=probability` pairs, with rules from `NOISE_RULES`.
+
+    Returns:
+        dict: The probability of each given rule.
+
+    Raises:
+        ValueError: If the specification is malformed or a rule is unknown.
+    """
+
+    probabilities = {}
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if "=" not in item:
+            raise ValueError(f"Noise rule must be given as rule=probability: {item}")
+        rule, probability = item.split("=", 1)
+        rule = rule.strip()
+        if rule not in NOISE_RULES:
+            raise ValueError(f"Unknown noise rule: {rule}")
+        probabilities[rule] = float(probability)
+    return probabilities
+
+
+def compile_noise(digit_confusion=0.0, drop_separator=0.0, space_jitter=0.0):
+    """
+    Compiles OCR-style corruption rules into per-character tables.
+
+    Args:
+        digit_confusion (float): The probability of reading a Thai digit as its Arabic counterpart, or the reverse.
+        drop_separator (float): The probability of dropping a separator (see `NOISE_SEPARATORS`).
+        space_jitter (float): The probability of inserting a space after a character.
+
+    Returns:
+        NoiseTables: The tables, as NumPy arrays when NumPy is installed and as lists otherwise.
+
+    Raises:
+        ValueError: If a probability is not in [0, 1].
+    """
+
+    for rule, probability in zip(
+        NOISE_RULES, (digit_confusion, drop_separator, space_jitter)
+    ):
+        if not 0 <= probability <= 1:
+            raise ValueError(f"Probability of {rule} must be in [0, 1]: {probability}")
+
+    targets = list(range(NOISE_TABLE_SIZE))
+    confusion = [0.0] * NOISE_TABLE_SIZE
+    for arabic_digit, thai_digit in zip(ARABIC_DIGITS, THAI_DIGITS):
+        targets[ord(arabic_digit)] = ord(thai_digit)
+        targets[ord(thai_digit)] = ord(arabic_digit)
+        confusion[ord(arabic_digit)] = confusion[ord(thai_digit)] = digit_confusion
+    drop = [0.0] * NOISE_TABLE_SIZE
+    for separator in NOISE_SEPARATORS:
+        drop[ord(separator)] = drop_separator
+    jitter = [space_jitter] * NOISE_TABLE_SIZE
+
+    if np is None:
+        return NoiseTables(targets, confusion, drop, jitter)
+    return NoiseTables(
+        np.array(targets, dtype=np.uint32),
+        np.array(confusion),
+        np.array(drop),
+        np.array(jitter),
+    )
+
+
+def augment_batch(samples, noise, generator=random):
+    """
+    Corrupts a batch of samples with OCR-style noise in bulk.
+
+    The random decisions of every character in the batch are drawn as one block of entropy, three per
+    character in the order confusion, drop, jitter, so the NumPy and pure Python paths produce the
+    same output from the same generator state. With NumPy, the whole batch is corrupted as a single
+    array of code points.
+
+    Args:
+        samples (list): The samples to corrupt.
+        noise (NoiseTables): The tables returned by `compile_noise`.
+        generator: The random generator, a `random.Random` instance or the `random` module itself.
+
+    Returns:
+        list: The corrupted samples, in the same order as `samples`.
+    """
+
+    lengths = list(map(len, samples))
+    confusion_draws, drop_draws, jitter_draws = random_columns(
+        sum(lengths), 3, generator
+    )
+
+    if np is None:
+        output = []
+        position = 0
+        for sample in samples:
+            chars = []
+            for char in sample:
+                index = min(ord(char), NOISE_TABLE_SIZE - 1)
+                if confusion_draws[position] < noise.confusion[index]:
+                    char = chr(noise.targets[index])
+                if drop_draws[position] >= noise.drop[index]:
+                    chars.append(char)
+                if jitter_draws[position] < noise.jitter[index]:
+                    chars.append(" ")
+                position += 1
+            output.append("".join(chars))
+        return output
+
+    codes = np.frombuffer("".join(samples).encode("utf-32-le"), dtype="<u4")
+    index = np.minimum(codes, NOISE_TABLE_SIZE - 1)
+    codes = np.where(
+        confusion_draws < noise.confusion[index], noise.targets[index], codes
+    )
+
+    # Each character emits itself unless dropped, then a space if jittered, in row-major order
+    emitted = np.stack([codes, np.full_like(codes, ord(" "))], axis=1)
+    mask = np.stack(
+        [drop_draws >= noise.drop[index], jitter_draws < noise.jitter[index]], axis=1
+    )
+    text = emitted[mask].astype("<u4").tobytes().decode("utf-32-le")
+
+    # Locate each sample in the output from the number of characters emitted before it
+    emitted_counts = np.concatenate([[0], np.cumsum(mask.sum(axis=1))])
+    bounds = emitted_counts[np.cumsum([0, *lengths])].tolist()
+    return [text[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def _iter_batches(items, batch_size):
+    """
+    Groups an iterable into lists of at most `batch_size` items.
+
+    Args:
+        items (iterable): The items to group.
+        batch_size (int): The maximum number of items in each list.
+
+    Yields:
+        list: The next batch.
+    """
+
+    items = iter(items)
+    return iter(lambda: list(itertools.islice(items, batch_size)), [])
+
+
+def _noise_generator():
+    """
+    Creates the random generator of a noise stream that is not given one, seeded from system entropy.
+
+    The stream never draws from, or seeds itself from, the module-level generator, so corrupting
+    samples does not change which samples are generated. Seeded runs pass their own generator,
+    derived from their seed, to corrupt them identically.
+
+    Returns:
+        random.Random: The generator.
+    """
+
+    return random.Random()
+
+
+def iter_augmented(samples, noise, batch_size=AUGMENT_BATCH_SIZE, generator=None):
+    """
+    Lazily corrupts a stream of samples, a batch at a time, as they are generated.
+
+    Args:
+        samples (iterable): The samples to corrupt, e.g. the output of a `generate_*` function.
+        noise (NoiseTables): The tables returned by `compile_noise`.
+        batch_size (int): The number of samples corrupted at a time.
+        generator (random.Random): The random generator, or None for one seeded from system entropy.
+
+    Yields:
+        str: The corrupted samples, in order.
+    """
+
+    generator = generator or _noise_generator()
+    for batch in _iter_batches(samples, batch_size):
+        yield from augment_batch(batch, noise, generator)
+
+
+def iter_augmented_pairs(pairs, noise, batch_size=AUGMENT_BATCH_SIZE, generator=None):
+    """
+    Lazily corrupts the samples of a stream of `(data_type, sample)` pairs, such as a mixed stream.
+
+    Args:
+        pairs (iterable): The pairs whose samples are corrupted.
+        noise (NoiseTables): The tables returned by `compile_noise`.
+        batch_size (int): The number of pairs corrupted at a time.
+        generator (random.Random): The random generator, or None for one seeded from system entropy.
+
+    Yields:
+        tuple: The `(data_type, corrupted sample)` pairs, in order.
+    """
+
+    generator = generator or _noise_generator()
+    for batch in _iter_batches(pairs, batch_size):
+        data_types, samples = zip(*batch)
+        yield from zip(data_types, augment_batch(samples, noise, generator))
+
+
+def iter_augmented_records(
+    records, noise, batch_size=AUGMENT_BATCH_SIZE, generator=None
+):
+    """
+    Lazily adds a corrupted copy of the text of a stream of records under "noisy_text".
+
+    The clean text stays under "text", so a record pairs an OCR-like input with its ground truth.
+
+    Args:
+        records (iterable): The records to augment (see `records.iter_unique_records`).
+        noise (NoiseTables): The tables returned by `compile_noise`.
+        batch_size (int): The number of records augmented at a time.
+        generator (random.Random): The random generator, or None for one seeded from system entropy.
+
+    Yields:
+        dict: The records, in order.
+    """
+
+    generator = generator or _noise_generator()
+    for batch in _iter_batches(records, batch_size):
+        texts = [record["text"] for record in batch]
+        for record, noisy_text in zip(batch, augment_batch(texts, noise, generator)):
+            record["noisy_text"] = noisy_text
+            yield record
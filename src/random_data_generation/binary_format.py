@@ -0,0 +1,117 @@
+import itertools
+import mmap
+import struct
+import sys
+from array import array
+
+# File layout: header, (row_count + 1) little-endian uint64 offsets, packed UTF-8 rows
+BINARY_MAGIC = b"RDGB"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sHHQ")  # magic, version, offset width, row count
+BINARY_OFFSET = struct.Struct("<Q")
+BINARY_OFFSET_PAIR = struct.Struct("<QQ")
+
+
+def write_binary(data, file_path):
+    """
+    Writes rows to a binary file made of a small header, a fixed-width offsets array and a packed UTF-8 blob.
+
+    Row `i` spans bytes `offsets[i]` to `offsets[i + 1]` of the blob, so readers can fetch any row in O(1)
+    without parsing the file (see `BinaryRowReader`).
+
+    Args:
+        data (iterable): The rows to be written to the file.
+        file_path (str): The path to the file where data will be written.
+    """
+
+    encoded = [str(row).encode("utf-8") for row in data]
+    offsets = array("Q", [0])
+    offsets.extend(itertools.accumulate(map(len, encoded)))
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    with open(file_path, "wb") as f:
+        f.write(
+            BINARY_HEADER.pack(
+                BINARY_MAGIC, BINARY_VERSION, BINARY_OFFSET.size, len(encoded)
+            )
+        )
+        f.write(offsets)
+        f.write(b"".join(encoded))
+
+
+class BinaryRowReader:
+    """
+    Memory-maps a file written by `write_binary` and reads rows by index without parsing it.
+
+    Example:
+        with BinaryRowReader("currency.bin") as reader:
+            sample = reader[42]
+    """
+
+    def __init__(self, file_path):
+        """
+        Opens and memory-maps a binary row file.
+
+        Args:
+            file_path (str): The path to a file written by `write_binary`.
+
+        Raises:
+            ValueError: If the file is not a supported binary row file.
+        """
+
+        with open(file_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < BINARY_HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"Not a binary row file: {file_path}")
+        magic, version, offset_width, row_count = BINARY_HEADER.unpack_from(self._mmap)
+        if (
+            magic != BINARY_MAGIC
+            or version != BINARY_VERSION
+            or offset_width != BINARY_OFFSET.size
+        ):
+            self._mmap.close()
+            raise ValueError(f"Not a binary row file: {file_path}")
+
+        self._row_count = row_count
+        self._offsets_start = BINARY_HEADER.size
+        self._data_start = self._offsets_start + (row_count + 1) * BINARY_OFFSET.size
+
+    def __len__(self):
+        return self._row_count
+
+    def __getitem__(self, index):
+        """
+        Returns the row at `index`, supporting negative indices like a list.
+        """
+
+        if index < 0:
+            index += self._row_count
+        if not 0 <= index < self._row_count:
+            raise IndexError("row index out of range")
+
+        start, end = BINARY_OFFSET_PAIR.unpack_from(
+            self._mmap, self._offsets_start + index * BINARY_OFFSET.size
+        )
+        return self._mmap[self._data_start + start : self._data_start + end].decode(
+            "utf-8"
+        )
+
+    def __iter__(self):
+        for index in range(self._row_count):
+            yield self[index]
+
+    def close(self):
+        """
+        Closes the memory map.
+        """
+
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
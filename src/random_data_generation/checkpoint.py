@@ -0,0 +1,270 @@
+import hashlib
+import os
+import random
+import struct
+import sys
+from array import array
+
+# Number of rows written between two checkpoints
+CHECKPOINT_EVERY = 1000000
+
+# Checkpoint layout: header, Mersenne Twister state words, optional Gaussian carry-over
+CHECKPOINT_MAGIC = b"RDGC"
+CHECKPOINT_VERSION = 1
+CHECKPOINT_HEADER = struct.Struct("<4sHHQQQI")
+CHECKPOINT_GAUSS = struct.Struct("<Bd")
+
+
+def fingerprint(sample):
+    """
+    Computes a 64-bit fingerprint of a sample, stable across processes and runs.
+
+    Args:
+        sample (str): The sample to fingerprint.
+
+    Returns:
+        int: An unsigned 64-bit fingerprint.
+    """
+
+    return int.from_bytes(
+        hashlib.blake2b(sample.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+
+def save_checkpoint(
+    checkpoint_path, rows_written, output_bytes, fingerprint_count, rng_state
+):
+    """
+    Atomically writes a checkpoint in a compact binary form.
+
+    Args:
+        checkpoint_path (str): The path to the checkpoint file.
+        rows_written (int): The number of rows written to the output so far.
+        output_bytes (int): The size of the output file holding those rows.
+        fingerprint_count (int): The number of fingerprints in the deduplication file.
+        rng_state (tuple): The state of the random generator, as returned by `random.getstate()`.
+    """
+
+    version, words, gauss_next = rng_state
+    words = array("I", words)
+    if sys.byteorder != "little":
+        words.byteswap()
+
+    temporary_path = f"{checkpoint_path}.tmp"
+    with open(temporary_path, "wb") as f:
+        f.write(
+            CHECKPOINT_HEADER.pack(
+                CHECKPOINT_MAGIC,
+                CHECKPOINT_VERSION,
+                version,
+                rows_written,
+                output_bytes,
+                fingerprint_count,
+                len(words),
+            )
+        )
+        f.write(words.tobytes())
+        f.write(CHECKPOINT_GAUSS.pack(gauss_next is not None, gauss_next or 0.0))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary_path, checkpoint_path)
+
+
+def load_checkpoint(checkpoint_path):
+    """
+    Reads a checkpoint written by `save_checkpoint`.
+
+    Args:
+        checkpoint_path (str): The path to the checkpoint file.
+
+    Returns:
+        dict: The `rows_written`, `output_bytes`, `fingerprint_count` and `rng_state` of the checkpoint.
+
+    Raises:
+        ValueError: If the file is not a supported checkpoint.
+    """
+
+    with open(checkpoint_path, "rb") as f:
+        content = f.read()
+
+    if len(content) < CHECKPOINT_HEADER.size:
+        raise ValueError(f"Not a checkpoint file: {checkpoint_path}")
+    (
+        magic,
+        checkpoint_version,
+        version,
+        rows_written,
+        output_bytes,
+        fingerprint_count,
+        word_count,
+    ) = CHECKPOINT_HEADER.unpack_from(content)
+    if magic != CHECKPOINT_MAGIC or checkpoint_version != CHECKPOINT_VERSION:
+        raise ValueError(f"Not a checkpoint file: {checkpoint_path}")
+
+    words = array("I")
+    words_end = CHECKPOINT_HEADER.size + word_count * words.itemsize
+    words.frombytes(content[CHECKPOINT_HEADER.size : words_end])
+    if sys.byteorder != "little":
+        words.byteswap()
+    has_gauss, gauss_next = CHECKPOINT_GAUSS.unpack_from(content, words_end)
+
+    return {
+        "rows_written": rows_written,
+        "output_bytes": output_bytes,
+        "fingerprint_count": fingerprint_count,
+        "rng_state": (version, tuple(words), gauss_next if has_gauss else None),
+    }
+
+
+def load_fingerprints(fingerprint_path, fingerprint_count):
+    """
+    Reads the first fingerprints of a deduplication file.
+
+    Args:
+        fingerprint_path (str): The path to the deduplication file.
+        fingerprint_count (int): The number of fingerprints to read.
+
+    Returns:
+        set: The fingerprints.
+    """
+
+    fingerprints = array("Q")
+    with open(fingerprint_path, "rb") as f:
+        fingerprints.frombytes(f.read(fingerprint_count * fingerprints.itemsize))
+    if sys.byteorder != "little":
+        fingerprints.byteswap()
+    return set(fingerprints)
+
+
+def count_rows(file_path):
+    """
+    Counts the newline-separated rows of a text output file.
+
+    Args:
+        file_path (str): The path to the output file.
+
+    Returns:
+        int: The number of rows.
+    """
+
+    newlines = 0
+    size = 0
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            newlines += block.count(b"\n")
+            size += len(block)
+    return newlines + 1 if size else 0
+
+
+def write_resumable(
+    sampler,
+    number_of_generated_sample,
+    file_path,
+    checkpoint_every=CHECKPOINT_EVERY,
+    resume=False,
+):
+    """
+    Generates unique samples and writes them to a file, checkpointing periodically so a failed run can resume.
+
+    Every `checkpoint_every` rows, the output and the 64-bit fingerprints of the written samples (kept in
+    `<file_path>.fp`) are flushed, then the random generator state and row count are saved to
+    `<file_path>.ckpt`. Resuming truncates both files back to the last checkpoint, restores the random
+    generator and the deduplication set, and appends the remaining rows, producing the same output as
+    an uninterrupted run. The checkpoint files are removed once the output is complete, so resuming a
+    completed run leaves its output untouched, and resuming a run that never reached a checkpoint
+    starts over.
+
+    Args:
+        sampler (callable): A function taking no arguments that returns a sample, drawing from the `random` module.
+        number_of_generated_sample (int): The total number of samples in the output.
+        file_path (str): The path to the output file.
+        checkpoint_every (int): The number of rows written between two checkpoints.
+        resume (bool): Whether to continue from an existing checkpoint instead of starting over.
+
+    Returns:
+        int: The number of rows in the output.
+
+    Raises:
+        ValueError: If resuming without a checkpoint while the output holds a different number of rows.
+    """
+
+    checkpoint_path = f"{file_path}.ckpt"
+    fingerprint_path = f"{file_path}.fp"
+
+    if (
+        resume
+        and not os.path.exists(checkpoint_path)
+        and not os.path.exists(fingerprint_path)
+        and os.path.exists(file_path)
+    ):
+        # A completed run removes its checkpoint files, keep its output instead of starting over
+        rows_written = count_rows(file_path)
+        if rows_written != number_of_generated_sample:
+            raise ValueError(
+                f"No checkpoint to resume from, and {file_path} holds {rows_written} rows "
+                f"instead of {number_of_generated_sample}"
+            )
+        return rows_written
+
+    if resume and os.path.exists(checkpoint_path):
+        checkpoint = load_checkpoint(checkpoint_path)
+        rows_written = checkpoint["rows_written"]
+        random.setstate(checkpoint["rng_state"])
+        seen = load_fingerprints(fingerprint_path, checkpoint["fingerprint_count"])
+
+        # Drop anything written after the last checkpoint
+        output_file = open(file_path, "r+b")
+        output_file.truncate(checkpoint["output_bytes"])
+        output_file.seek(0, os.SEEK_END)
+        fingerprint_file = open(fingerprint_path, "r+b")
+        fingerprint_file.truncate(checkpoint["fingerprint_count"] * 8)
+        fingerprint_file.seek(0, os.SEEK_END)
+    else:
+        rows_written = 0
+        seen = set()
+        output_file = open(file_path, "wb")
+        fingerprint_file = open(fingerprint_path, "wb")
+
+    try:
+        seen_add = seen.add
+        while rows_written < number_of_generated_sample:
+            target = min(checkpoint_every, number_of_generated_sample - rows_written)
+            chunk = []
+            fingerprints = array("Q")
+            while len(chunk) < target:
+                sample = sampler()
+                sample_fingerprint = fingerprint(sample)
+                if sample_fingerprint not in seen:
+                    seen_add(sample_fingerprint)
+                    chunk.append(sample)
+                    fingerprints.append(sample_fingerprint)
+
+            content = "\n".join(chunk).encode("utf-8")
+            output_file.write(b"\n" + content if rows_written else content)
+            if sys.byteorder != "little":
+                fingerprints.byteswap()
+            fingerprint_file.write(fingerprints.tobytes())
+            rows_written += len(chunk)
+
+            # Make the rows durable before the checkpoint refers to them
+            for f in (output_file, fingerprint_file):
+                f.flush()
+                os.fsync(f.fileno())
+
+            save_checkpoint(
+                checkpoint_path,
+                rows_written,
+                output_file.tell(),
+                len(seen),
+                random.getstate(),
+            )
+    finally:
+        output_file.close()
+        fingerprint_file.close()
+
+    # The output is complete, the checkpoint is no longer needed
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    os.remove(fingerprint_path)
+
+    return rows_written
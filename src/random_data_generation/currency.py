@@ -1,24 +1,42 @@
+import functools
+import itertools
 import random
-from .constants import (
-    ARABIC_DIGITS,
-    THAI_DIGITS,
-    CURRENCIES,
-    CURRENCY_MAX_AMOUNT,
-    CURRENCY_CHOICES,
-    CURRENCY_WEIGHTS,
-    CURRENCY_USE_DASH_WEIGHTS,
-    CURRENCY_USE_THAI_NUMERAL_WEIGHTS,
-    CURRENCY_USE_SUFFIX_WEIGHTS,
-    CURRENCY_SUFFIX_TH_WEIGHTS,
-)
+from .constants import CURRENCIES, CURRENCY_MAX_AMOUNT
+from .entropy import less_than, pick, random_columns, scale
 from .generate_weighted_list import generate_weighted_list
+from .number_format import (
+    FORMAT_BATCH_SIZE,
+    THAI_TRANSLATION_TABLE,
+    format_amounts,
+    get_format_spec,
+)
+from .profile import get_profile
+from .table_cache import load_object_table
+from .unique import UniqueCollector
 
-# Pre-compute translation table
-THAI_TRANSLATION_TABLE = str.maketrans(ARABIC_DIGITS, THAI_DIGITS)
+# Values a currency is formatted from, in the order of the `format_currency` arguments, stored in currency records
+CURRENCY_RECORD_FIELDS = (
+    "amount",
+    "currency",
+    "use_symbol",
+    "use_comma",
+    "show_cents",
+    "use_dash",
+    "use_space",
+    "use_thai_numeral",
+    "use_suffix",
+    "suffix_th",
+)
 
+# Options a stratified run allocates quotas to, mapped to the position of their weighted list in the
+# sampler arguments; the THB-only options are left out as they collapse to False for other currencies
+CURRENCY_STRATA = {
+    "currency": 0,
+    "use_dash": 1,
+}
 
-def format_currency(
-    amount,
+
+def compile_format_plan(
     currency,
     use_symbol=False,
     use_comma=False,
@@ -30,10 +48,12 @@ def format_currency(
     suffix_th=False,
 ):
     """
-    Formats a given amount of money according to specified currency formatting options.
+    Compiles a set of currency formatting options into a reusable format plan.
+
+    A format plan holds everything in the formatted string that does not depend on the amount,
+    so formatting a sample only needs to format the number and concatenate the pieces.
 
     Args:
-        amount (float): The amount of money to format.
         currency (str): The currency code (e.g., "USD", "THB").
         use_symbol (bool): Whether to use the currency symbol instead of the code.
         use_comma (bool): Whether to use commas for thousands separators.
@@ -45,49 +65,159 @@ def format_currency(
         suffix_th (bool): Whether to use the Thai suffix ("บาท") instead of the English suffix ("Baht").
 
     Returns:
-        str: The formatted currency string.
+        tuple: A `(head, format_spec, tail, translate)` tuple, where `head` and `tail` are the strings
+        placed around the formatted amount and `translate` tells whether to convert digits to Thai numerals.
     """
 
     # Retrieve the currency symbol and code from the CURRENCIES dictionary
     symbol, code = CURRENCIES[currency]
+    is_thb = currency == "THB"
 
     # Determine if the currency prefix should be a symbol or code, and skip for THB with suffix
     prefix = ""
-    if not (use_suffix and currency == "THB"):
+    if not (use_suffix and is_thb):
         prefix = symbol if use_symbol else code
 
     # Set decimal places (cents) based on currency, with 0 decimals for JPY
     decimals = 0 if currency == "JPY" else (2 if show_cents else 0)
+    format_spec = get_format_spec(use_comma, decimals)
+
+    # Determine the suffix for THB currency, either in English or Thai
+    suffix = ""
+    if use_suffix and is_thb:
+        suffix = "บาท" if suffix_th else "Baht"
+
+    # Spaces only separate non-empty parts, matching a stripped "prefix amount suffix" string
+    separator = " " if use_space else ""
+    head = f"{prefix}{separator}" if prefix else ""
+    tail = ".-" if use_dash else ""
+    if suffix:
+        tail += f"{separator}{suffix}"
+
+    return head, format_spec, tail, bool(use_thai_numeral and is_thb)
+
+
+def compile_format_plans():
+    """
+    Compiles a format plan for every reachable combination of formatting options.
+
+    Returns:
+        dict: The format plans, keyed by the `format_currency` arguments that follow `amount`.
+    """
+
+    return {
+        (currency, *options): compile_format_plan(currency, *options)
+        for currency in CURRENCIES
+        for options in itertools.product([True, False], repeat=8)
+    }
+
+
+# Pre-compiled format plans, loaded from the table cache when one is set
+CURRENCY_FORMAT_PLANS = load_object_table(
+    "currency-format-plans", CURRENCIES, compile_format_plans
+)
 
-    # Format the amount with or without commas for thousands separators
-    amount_str = f"{amount:,.{decimals}f}" if use_comma else f"{amount:.{decimals}f}"
 
-    # Convert digits to Thai numerals if applicable
-    if use_thai_numeral and currency == "THB":
+def format_currency(
+    amount,
+    currency,
+    use_symbol=False,
+    use_comma=False,
+    show_cents=False,
+    use_dash=False,
+    use_space=False,
+    use_thai_numeral=False,
+    use_suffix=False,
+    suffix_th=False,
+):
+    """
+    Formats a given amount of money according to specified currency formatting options.
+
+    Args:
+        amount (float): The amount of money to format.
+        currency (str): The currency code (e.g., "USD", "THB").
+        use_symbol (bool): Whether to use the currency symbol instead of the code.
+        use_comma (bool): Whether to use commas for thousands separators.
+        show_cents (bool): Whether to show decimal places (cents).
+        use_dash (bool): Whether to append a dash after the amount.
+        use_space (bool): Whether to include a space between the amount and the currency.
+        use_thai_numeral (bool): Whether to use Thai numerals (only applies to THB).
+        use_suffix (bool): Whether to add a currency suffix (e.g., "Baht").
+        suffix_th (bool): Whether to use the Thai suffix ("บาท") instead of the English suffix ("Baht").
+
+    Returns:
+        str: The formatted currency string.
+    """
+
+    plan_key = (
+        currency,
+        use_symbol,
+        use_comma,
+        show_cents,
+        use_dash,
+        use_space,
+        use_thai_numeral,
+        use_suffix,
+        suffix_th,
+    )
+    plan = CURRENCY_FORMAT_PLANS.get(plan_key)
+    if plan is None:
+        plan = compile_format_plan(*plan_key)
+    head, format_spec, tail, translate = plan
+
+    amount_str = format(amount, format_spec)
+    if translate:
         amount_str = amount_str.translate(THAI_TRANSLATION_TABLE)
 
-    if use_dash:
-        amount_str += ".-"
+    return f"{head}{amount_str}{tail}"
 
-    # Determine the suffix for THB currency, either in English or Thai
-    suffix = ""
-    if use_suffix and currency == "THB":
-        suffix = "บาท" if suffix_th else "Baht"
 
-    if use_space:
-        return f"{prefix} {amount_str} {suffix}".strip()
-    return f"{prefix}{amount_str}{suffix}".strip()
+def format_currency_batch(amounts, plan_keys):
+    """
+    Formats a batch of amounts, grouping them by number format so each group is formatted in bulk.
 
+    Args:
+        amounts (list): The amounts of money to format.
+        plan_keys (list): For each amount, a tuple of the `format_currency` arguments that follow `amount`
+            (currency, use_symbol, use_comma, show_cents, use_dash, use_space, use_thai_numeral, use_suffix, suffix_th).
 
-def generate_single_currency_sample(
+    Returns:
+        list: The formatted currency strings, in the same order as `amounts`.
+    """
+
+    # Group sample positions by the number format they share, whatever surrounds the number
+    groups = {}
+    plans = []
+    for index, plan_key in enumerate(plan_keys):
+        plan = CURRENCY_FORMAT_PLANS.get(plan_key)
+        if plan is None:
+            plan = compile_format_plan(*plan_key)
+        plans.append(plan)
+        _, format_spec, _, translate = plan
+        groups.setdefault((format_spec, translate), []).append(index)
+
+    output = [None] * len(amounts)
+    for (format_spec, translate), indices in groups.items():
+        formatted = format_amounts(
+            [amounts[index] for index in indices], format_spec, translate
+        )
+        for index, amount_str in zip(indices, formatted):
+            head, _, tail, _ = plans[index]
+            output[index] = f"{head}{amount_str}{tail}"
+
+    return output
+
+
+def draw_currency_options(
     currency_weighted,
     use_dash_weighted,
     use_thai_numeral_weighted,
     use_suffix_weighted,
     suffix_th_weighted,
+    max_amount=CURRENCY_MAX_AMOUNT,
 ):
     """
-    Generates a single formatted currency sample with random values.
+    Draws a random amount and random currency formatting options.
 
     Args:
         currency_weighted (list): A list of currency codes, weighted by their probabilities.
@@ -95,40 +225,31 @@ def generate_single_currency_sample(
         use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
         use_suffix_weighted (list): A list of boolean values indicating whether to use a currency suffix, weighted by their probabilities.
         suffix_th_weighted (list): A list of boolean values indicating whether to use the Thai suffix ("บาท") instead of the English suffix ("Baht"), weighted by their probabilities.
+        max_amount (int): The exclusive upper bound of the amounts.
 
     Returns:
-        str: A randomly generated formatted currency string based on the given weights and random selections.
+        tuple: The amount and the plan key, i.e. the `format_currency` arguments that follow `amount`.
     """
 
     # Randomly select currency and generate random formatting options
     currency = currency_weighted[int(random.random() * len(currency_weighted))]
-    amount = random.random() * CURRENCY_MAX_AMOUNT
+    amount = random.random() * max_amount
     use_symbol = random.random() < 0.5
     use_comma = random.random() < 0.5
     show_cents = random.random() < 0.5
     use_dash = use_dash_weighted[int(random.random() * len(use_dash_weighted))]
     use_space = random.random() < 0.5
 
-    # Specific random options for THB currency
-    use_thai_numeral = (
-        use_thai_numeral_weighted[int(random.random() * len(use_thai_numeral_weighted))]
-        if currency == "THB"
-        else False
-    )
-    use_suffix = (
-        use_suffix_weighted[int(random.random() * len(use_suffix_weighted))]
-        if currency == "THB"
-        else False
-    )
-    suffix_th = (
-        suffix_th_weighted[int(random.random() * len(suffix_th_weighted))]
-        if currency == "THB"
-        else False
-    )
+    # Specific random options for THB currency, always drawn so every sample takes the same number of draws
+    use_thai_numeral = use_thai_numeral_weighted[
+        int(random.random() * len(use_thai_numeral_weighted))
+    ]
+    use_suffix = use_suffix_weighted[int(random.random() * len(use_suffix_weighted))]
+    suffix_th = suffix_th_weighted[int(random.random() * len(suffix_th_weighted))]
+    if currency != "THB":
+        use_thai_numeral = use_suffix = suffix_th = False
 
-    # Generate formatted currency
-    formatted_currency = format_currency(
-        amount,
+    return amount, (
         currency,
         use_symbol,
         use_comma,
@@ -139,44 +260,261 @@ def generate_single_currency_sample(
         use_suffix,
         suffix_th,
     )
+
+
+def generate_single_currency_sample(
+    currency_weighted,
+    use_dash_weighted,
+    use_thai_numeral_weighted,
+    use_suffix_weighted,
+    suffix_th_weighted,
+    max_amount=CURRENCY_MAX_AMOUNT,
+):
+    """
+    Generates a single formatted currency sample with random values.
+
+    Args:
+        currency_weighted (list): A list of currency codes, weighted by their probabilities.
+        use_dash_weighted (list): A list of boolean values indicating whether to use a dash, weighted by their probabilities.
+        use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
+        use_suffix_weighted (list): A list of boolean values indicating whether to use a currency suffix, weighted by their probabilities.
+        suffix_th_weighted (list): A list of boolean values indicating whether to use the Thai suffix ("บาท") instead of the English suffix ("Baht"), weighted by their probabilities.
+        max_amount (int): The exclusive upper bound of the amounts.
+
+    Returns:
+        str: A randomly generated formatted currency string based on the given weights and random selections.
+    """
+
+    amount, plan_key = draw_currency_options(
+        currency_weighted,
+        use_dash_weighted,
+        use_thai_numeral_weighted,
+        use_suffix_weighted,
+        suffix_th_weighted,
+        max_amount,
+    )
+
+    # Generate formatted currency
+    formatted_currency = format_currency(amount, *plan_key)
     return formatted_currency
 
 
-def generate_currencies(number_of_generated_sample):
+def draw_currency_batch(
+    currency_weighted,
+    use_dash_weighted,
+    use_thai_numeral_weighted,
+    use_suffix_weighted,
+    suffix_th_weighted,
+    max_amount,
+    number_of_generated_sample,
+):
     """
-    Generates a specified number of currency samples and writes them to a file.
+    Draws the random amounts and formatting options of a batch of currency samples.
+
+    The random options are drawn as one block of entropy, row by row in the same order as repeated calls
+    to `generate_single_currency_sample`, so a seeded batch holds the same samples.
 
     Args:
-        number_of_generated_sample (int): The number of currency samples to generate.
+        currency_weighted (list): A list of currency codes, weighted by their probabilities.
+        use_dash_weighted (list): A list of boolean values indicating whether to use a dash, weighted by their probabilities.
+        use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
+        use_suffix_weighted (list): A list of boolean values indicating whether to use a currency suffix, weighted by their probabilities.
+        suffix_th_weighted (list): A list of boolean values indicating whether to use the Thai suffix ("บาท") instead of the English suffix ("Baht"), weighted by their probabilities.
+        max_amount (int): The exclusive upper bound of the amounts.
+        number_of_generated_sample (int): The number of samples in the batch.
+
+    Returns:
+        tuple: The amounts and, for each amount, its plan key (see `format_currency_batch`).
+    """
+
+    (
+        currency_draws,
+        amount_draws,
+        use_symbol_draws,
+        use_comma_draws,
+        show_cents_draws,
+        use_dash_draws,
+        use_space_draws,
+        use_thai_numeral_draws,
+        use_suffix_draws,
+        suffix_th_draws,
+    ) = random_columns(number_of_generated_sample, 10)
+
+    plan_keys = []
+    for plan_key in zip(
+        pick(currency_weighted, currency_draws),
+        less_than(use_symbol_draws, 0.5),
+        less_than(use_comma_draws, 0.5),
+        less_than(show_cents_draws, 0.5),
+        pick(use_dash_weighted, use_dash_draws),
+        less_than(use_space_draws, 0.5),
+        pick(use_thai_numeral_weighted, use_thai_numeral_draws),
+        pick(use_suffix_weighted, use_suffix_draws),
+        pick(suffix_th_weighted, suffix_th_draws),
+    ):
+        if plan_key[0] != "THB":
+            plan_key = (*plan_key[:6], False, False, False)
+        plan_keys.append(plan_key)
+
+    return scale(amount_draws, max_amount), plan_keys
+
+
+def generate_currency_batch(
+    currency_weighted,
+    use_dash_weighted,
+    use_thai_numeral_weighted,
+    use_suffix_weighted,
+    suffix_th_weighted,
+    max_amount,
+    number_of_generated_sample,
+):
+    """
+    Generates a batch of formatted currency samples with random values.
+
+    The options are drawn by `draw_currency_batch`, so a seeded batch holds the same samples as repeated
+    calls to `generate_single_currency_sample`, then the batch is formatted with `format_currency_batch`.
+
+    Args:
+        currency_weighted (list): A list of currency codes, weighted by their probabilities.
+        use_dash_weighted (list): A list of boolean values indicating whether to use a dash, weighted by their probabilities.
+        use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
+        use_suffix_weighted (list): A list of boolean values indicating whether to use a currency suffix, weighted by their probabilities.
+        suffix_th_weighted (list): A list of boolean values indicating whether to use the Thai suffix ("บาท") instead of the English suffix ("Baht"), weighted by their probabilities.
+        max_amount (int): The exclusive upper bound of the amounts.
+        number_of_generated_sample (int): The number of samples in the batch.
 
     Returns:
-        set: A set containing unique generated currency samples.
+        list: The randomly generated formatted currency strings.
     """
 
+    return format_currency_batch(
+        *draw_currency_batch(
+            currency_weighted,
+            use_dash_weighted,
+            use_thai_numeral_weighted,
+            use_suffix_weighted,
+            suffix_th_weighted,
+            max_amount,
+            number_of_generated_sample,
+        )
+    )
+
+
+def generate_currency_record_batch(*args):
+    """
+    Generates a batch of currency records, each holding a formatted currency and the values it was
+    formatted from.
+
+    The recorded amount is the value the string shows: rounded to 2 decimals when cents are shown,
+    and to an integer otherwise.
+
+    Args:
+        *args: The arguments of `generate_currency_batch`, ending with the number of samples in the batch.
+
+    Returns:
+        list: Dictionaries holding the formatted string under "text" and the `CURRENCY_RECORD_FIELDS`.
+    """
+
+    amounts, plan_keys = draw_currency_batch(*args)
+    records = []
+    for text, amount, plan_key in zip(
+        format_currency_batch(amounts, plan_keys), amounts, plan_keys
+    ):
+        currency, _, _, show_cents = plan_key[:4]
+        if show_cents and currency != "JPY":
+            amount = round(amount, 2)
+        else:
+            amount = round(amount)
+        record = {"text": text, "amount": amount}
+        record.update(zip(CURRENCY_RECORD_FIELDS[1:], plan_key))
+        records.append(record)
+    return records
+
+
+def build_currency_sampler():
+    """
+    Builds a sampler that generates a single currency sample per call.
+
+    The weights, choices and ranges are read from the active profile (see `profile.set_profile`).
+
+    Returns:
+        callable: A function taking no arguments that returns a formatted currency string.
+    """
+
+    profile = get_profile()
+
     # Precompute weighted lists for efficient sampling
-    currency_weighted = generate_weighted_list(CURRENCY_CHOICES, CURRENCY_WEIGHTS)
-    use_dash_weighted = generate_weighted_list([True, False], CURRENCY_USE_DASH_WEIGHTS)
+    currency_weighted = generate_weighted_list(
+        profile["CURRENCY_CHOICES"], profile["CURRENCY_WEIGHTS"]
+    )
+    use_dash_weighted = generate_weighted_list(
+        [True, False], profile["CURRENCY_USE_DASH_WEIGHTS"]
+    )
     use_thai_numeral_weighted = generate_weighted_list(
-        [True, False], CURRENCY_USE_THAI_NUMERAL_WEIGHTS
+        [True, False], profile["CURRENCY_USE_THAI_NUMERAL_WEIGHTS"]
     )
     use_suffix_weighted = generate_weighted_list(
-        [True, False], CURRENCY_USE_SUFFIX_WEIGHTS
+        [True, False], profile["CURRENCY_USE_SUFFIX_WEIGHTS"]
     )
     suffix_th_weighted = generate_weighted_list(
-        [True, False], CURRENCY_SUFFIX_TH_WEIGHTS
+        [True, False], profile["CURRENCY_SUFFIX_TH_WEIGHTS"]
+    )
+
+    return functools.partial(
+        generate_single_currency_sample,
+        currency_weighted,
+        use_dash_weighted,
+        use_thai_numeral_weighted,
+        use_suffix_weighted,
+        suffix_th_weighted,
+        profile["CURRENCY_MAX_AMOUNT"],
     )
 
-    # Generate unique currency samples
-    output = set()
+
+def build_currency_batch_sampler():
+    """
+    Builds a sampler that generates a batch of currency samples per call.
+
+    Returns:
+        callable: A function taking the batch size that returns a list of formatted currency strings.
+    """
+
+    return functools.partial(generate_currency_batch, *build_currency_sampler().args)
+
+
+def build_currency_record_sampler():
+    """
+    Builds a sampler that generates a batch of currency records per call.
+
+    Returns:
+        callable: A function taking the batch size that returns a list of currency records.
+    """
+
+    return functools.partial(
+        generate_currency_record_batch, *build_currency_sampler().args
+    )
+
+
+def generate_currencies(number_of_generated_sample):
+    """
+    Generates a specified number of currency samples and writes them to a file.
+
+    Args:
+        number_of_generated_sample (int): The number of currency samples to generate.
+
+    Returns:
+        list: The unique generated currency samples, in generation order.
+    """
+
+    batch_sampler = build_currency_batch_sampler()
+
+    # Generate unique currency samples, a batch at a time
+    output = UniqueCollector()
     while len(output) < number_of_generated_sample:
-        output.add(
-            generate_single_currency_sample(
-                currency_weighted,
-                use_dash_weighted,
-                use_thai_numeral_weighted,
-                use_suffix_weighted,
-                suffix_th_weighted,
+        output.update(
+            batch_sampler(
+                min(number_of_generated_sample - len(output), FORMAT_BATCH_SIZE)
             )
         )
 
-    return output
+    return output.to_list()
@@ -0,0 +1,121 @@
+import collections
+import random
+import sys
+from .mixed import build_mixed_sampler, iter_mixed
+from .partition import partition_size
+
+# Number of samples generated ahead of the consumer each time the buffer runs dry
+DATASET_PREFETCH_SIZE = 4096
+
+
+def get_worker_info():
+    """
+    Detects the worker that is iterating the dataset.
+
+    A PyTorch `DataLoader` worker is recognized when PyTorch is already imported, so PyTorch is never
+    a dependency. Outside of a worker process the dataset is iterated by a single worker.
+
+    Returns:
+        tuple: The zero-based `(worker_id, worker_count)` pair.
+    """
+
+    data = sys.modules.get("torch.utils.data")
+    info = data.get_worker_info() if data is not None else None
+    if info is None:
+        return 0, 1
+    return info.id, info.num_workers
+
+
+class GeneratedDataset:
+    """
+    An iterable dataset that generates `(text, data_type)` samples on the fly instead of reading
+    them back from pre-generated files.
+
+    Each worker iterating the dataset gets its own hash partition of the samples and its own random
+    generator seeded from `seed` and the worker id, so workers never repeat each other's samples and
+    every epoch replays the same streams. Samples are generated `prefetch` at a time into a buffer.
+
+    The class only needs `__iter__` and `__len__`, so it can be wrapped by any framework; with PyTorch
+    installed it can be passed to a `DataLoader` as is.
+    """
+
+    def __init__(self, ratios, length=None, seed=0, prefetch=DATASET_PREFETCH_SIZE):
+        """
+        Args:
+            ratios (dict): The relative weight of each data type, e.g. {"currency": 5, "date": 2},
+                or a single data type name.
+            length (int): The total number of samples across all workers, or None to generate forever.
+                A finite dataset holds unique samples, like a generated file.
+            seed (int): The seed the random generator of each worker is derived from.
+            prefetch (int): The number of samples generated each time the buffer runs dry.
+
+        Raises:
+            ValueError: If a data type is unknown, a ratio is negative, or `length` or `prefetch`
+                is out of range.
+        """
+
+        if isinstance(ratios, str):
+            ratios = {ratios: 1}
+        if length is not None and length < 0:
+            raise ValueError(f"Length must be non-negative: {length}")
+        if prefetch < 1:
+            raise ValueError(f"Prefetch must be positive: {prefetch}")
+
+        # Fail early on invalid ratios rather than inside a worker
+        build_mixed_sampler(ratios)
+
+        self.ratios = dict(ratios)
+        self.length = length
+        self.seed = seed
+        self.prefetch = prefetch
+
+    def __len__(self):
+        if self.length is None:
+            raise TypeError("An infinite dataset has no length")
+        return self.length
+
+    def __iter__(self):
+        worker_id, worker_count = get_worker_info()
+        return self.iter_worker(worker_id, worker_count)
+
+    def iter_worker(self, worker_id, worker_count):
+        """
+        Lazily yields the samples of one worker.
+
+        Args:
+            worker_id (int): The zero-based id of the worker.
+            worker_count (int): The number of workers sharing the dataset.
+
+        Yields:
+            tuple: A `(text, data_type)` pair.
+        """
+
+        partition = (worker_id, worker_count)
+        if self.length is None:
+            sampler = build_mixed_sampler(self.ratios, partition)
+            samples = iter(sampler, None)
+            remaining = None
+        else:
+            samples = iter_mixed(self.ratios, partition)
+            remaining = partition_size(self.length, worker_id, worker_count)
+
+        # The samplers draw from the module-level generator, so it is swapped for the worker's own
+        # state while the buffer is filled and restored before any sample is yielded
+        rng_state = random.Random(f"{self.seed}/{worker_id}/{worker_count}").getstate()
+        buffer = collections.deque()
+        while remaining is None or remaining > 0:
+            size = self.prefetch if remaining is None else min(self.prefetch, remaining)
+            caller_state = random.getstate()
+            random.setstate(rng_state)
+            try:
+                for _ in range(size):
+                    data_type, sample = next(samples)
+                    buffer.append((sample, data_type))
+            finally:
+                rng_state = random.getstate()
+                random.setstate(caller_state)
+
+            if remaining is not None:
+                remaining -= size
+            while buffer:
+                yield buffer.popleft()
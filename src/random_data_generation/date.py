@@ -1,32 +1,44 @@
+import functools
 import random
 from datetime import datetime, timedelta
 from .constants import (
-    ARABIC_DIGITS,
-    THAI_DIGITS,
     MONTH_NAMES_TH,
     MONTH_ABBRS_TH,
     MONTH_NAMES_EN,
     MONTH_ABBRS_EN,
     DATE_START_DATE,
     DATE_END_DATE,
-    DATE_FORMAT_CHOICES,
-    DATE_FORMAT_WEIGHTS,
-    DATE_YEAR_TYPE_CHOICES,
-    DATE_YEAR_TYPE_WEIGHTS,
-    DATE_YEAR_DIGIT_CHOICES,
-    DATE_YEAR_DIGIT_WEIGHTS,
-    DATE_MONTH_LANG_THAI_WEIGHTS,
-    DATE_FULL_MONTH_WEIGHTS,
-    DATE_DATE_FORMAT_CHOICES,
-    DATE_DATE_FORMAT_WEIGHTS,
-    DATE_SEPARATOR_CHOICES,
-    DATE_SEPARATOR_WEIGHTS,
-    DATE_USE_THAI_NUMERAL_WEIGHTS,
 )
+from .entropy import below, pick, random_columns
 from .generate_weighted_list import generate_weighted_list
+from .number_format import FORMAT_BATCH_SIZE, THAI_TRANSLATION_TABLE
+from .profile import get_profile
+from .unique import UniqueCollector
 
-# Pre-compute translation table
-THAI_TRANSLATION_TABLE = str.maketrans(ARABIC_DIGITS, THAI_DIGITS)
+# Values a date is formatted from, in the order of the `format_date` arguments, stored in date records
+DATE_RECORD_FIELDS = (
+    "date",
+    "format",
+    "year_type",
+    "year_digit",
+    "month_lang_thai",
+    "full_month",
+    "date_format",
+    "separator",
+    "use_thai_numeral",
+)
+
+# Options a stratified run allocates quotas to, mapped to the position of their weighted list in the sampler arguments
+DATE_STRATA = {
+    "format": 0,
+    "year_type": 1,
+    "year_digit": 2,
+    "month_lang_thai": 3,
+    "full_month": 4,
+    "date_format": 5,
+    "separator": 6,
+    "use_thai_numeral": 7,
+}
 
 
 def format_date(
@@ -114,9 +126,15 @@ def random_date(start, end):
 
     Returns:
         datetime: A randomly generated date between start and end dates.
+
+    Raises:
+        ValueError: If the end date is before the start date.
     """
 
-    return start + timedelta(days=random.randint(0, (end - start).days))
+    days = (end - start).days
+    if days < 0:
+        raise ValueError(f"End date {end} is before start date {start}")
+    return start + timedelta(days=int(random.random() * (days + 1)))
 
 
 def generate_single_date_sample(
@@ -128,6 +146,8 @@ def generate_single_date_sample(
     date_format_weighted,
     separator_weighted,
     use_thai_numeral_weighted,
+    start_date=datetime(*DATE_START_DATE),
+    end_date=datetime(*DATE_END_DATE),
 ):
     """
     Generates a single formatted date sample with random values for formatting options.
@@ -141,13 +161,13 @@ def generate_single_date_sample(
         date_format_weighted (list): A list of date formats for day and month, weighted by their probabilities.
         separator_weighted (list): A list of separators, weighted by their probabilities.
         use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
+        start_date (datetime): The earliest date.
+        end_date (datetime): The latest date.
 
     Returns:
         str: A randomly generated formatted date string based on the given weights and random selections.
     """
 
-    start_date = datetime(*DATE_START_DATE)
-    end_date = datetime(*DATE_END_DATE)
     date = random_date(start_date, end_date)
     format = format_weighted[int(random.random() * len(format_weighted))]
     year_type = year_type_weighted[int(random.random() * len(year_type_weighted))]
@@ -178,53 +198,240 @@ def generate_single_date_sample(
     return formatted_date
 
 
-def generate_dates(number_of_generated_sample):
+def draw_date_batch(
+    format_weighted,
+    year_type_weighted,
+    year_digit_weighted,
+    month_lang_thai_weighted,
+    full_month_weighted,
+    date_format_weighted,
+    separator_weighted,
+    use_thai_numeral_weighted,
+    start_date,
+    end_date,
+    number_of_generated_sample,
+):
     """
-    Generates a specified number of date samples and writes them to a file.
+    Draws the random dates and formatting options of a batch of date samples.
+
+    The random options are drawn as one block of entropy, row by row in the same order as repeated
+    calls to `generate_single_date_sample`, so a seeded batch holds the same samples.
 
     Args:
-        number_of_generated_sample (int): The number of date samples to generate.
+        format_weighted (list): A list of date formats, weighted by their probabilities.
+        year_type_weighted (list): A list of year types, weighted by their probabilities.
+        year_digit_weighted (list): A list of year digit options, weighted by their probabilities.
+        month_lang_thai_weighted (list): A list of boolean values indicating whether to use Thai month names, weighted by their probabilities.
+        full_month_weighted (list): A list of boolean values indicating whether to use full month names, weighted by their probabilities.
+        date_format_weighted (list): A list of date formats for day and month, weighted by their probabilities.
+        separator_weighted (list): A list of separators, weighted by their probabilities.
+        use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
+        start_date (datetime): The earliest date.
+        end_date (datetime): The latest date.
+        number_of_generated_sample (int): The number of samples in the batch.
+
+    Returns:
+        list: One list per `format_date` argument, in the order of `DATE_RECORD_FIELDS`.
+    """
+
+    (
+        date_draws,
+        format_draws,
+        year_type_draws,
+        year_digit_draws,
+        month_lang_thai_draws,
+        full_month_draws,
+        date_format_draws,
+        separator_draws,
+        use_thai_numeral_draws,
+    ) = random_columns(number_of_generated_sample, 9)
+
+    dates = [
+        start_date + timedelta(days=days)
+        for days in below(date_draws, (end_date - start_date).days + 1)
+    ]
+
+    return [
+        dates,
+        pick(format_weighted, format_draws),
+        pick(year_type_weighted, year_type_draws),
+        pick(year_digit_weighted, year_digit_draws),
+        pick(month_lang_thai_weighted, month_lang_thai_draws),
+        pick(full_month_weighted, full_month_draws),
+        pick(date_format_weighted, date_format_draws),
+        pick(separator_weighted, separator_draws),
+        pick(use_thai_numeral_weighted, use_thai_numeral_draws),
+    ]
+
+
+def generate_date_batch(
+    format_weighted,
+    year_type_weighted,
+    year_digit_weighted,
+    month_lang_thai_weighted,
+    full_month_weighted,
+    date_format_weighted,
+    separator_weighted,
+    use_thai_numeral_weighted,
+    start_date,
+    end_date,
+    number_of_generated_sample,
+):
+    """
+    Generates a batch of formatted date samples with random values for formatting options.
+
+    The options are drawn by `draw_date_batch`, so a seeded batch holds the same samples as repeated
+    calls to `generate_single_date_sample`.
+
+    Args:
+        format_weighted (list): A list of date formats, weighted by their probabilities.
+        year_type_weighted (list): A list of year types, weighted by their probabilities.
+        year_digit_weighted (list): A list of year digit options, weighted by their probabilities.
+        month_lang_thai_weighted (list): A list of boolean values indicating whether to use Thai month names, weighted by their probabilities.
+        full_month_weighted (list): A list of boolean values indicating whether to use full month names, weighted by their probabilities.
+        date_format_weighted (list): A list of date formats for day and month, weighted by their probabilities.
+        separator_weighted (list): A list of separators, weighted by their probabilities.
+        use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
+        start_date (datetime): The earliest date.
+        end_date (datetime): The latest date.
+        number_of_generated_sample (int): The number of samples in the batch.
+
+    Returns:
+        list: The randomly generated formatted date strings.
+    """
+
+    columns = draw_date_batch(
+        format_weighted,
+        year_type_weighted,
+        year_digit_weighted,
+        month_lang_thai_weighted,
+        full_month_weighted,
+        date_format_weighted,
+        separator_weighted,
+        use_thai_numeral_weighted,
+        start_date,
+        end_date,
+        number_of_generated_sample,
+    )
+    return list(map(format_date, *columns))
+
+
+def generate_date_record_batch(*args):
+    """
+    Generates a batch of date records, each holding a formatted date and the values it was formatted from.
+
+    Args:
+        *args: The arguments of `generate_date_batch`, ending with the number of samples in the batch.
 
     Returns:
-        set: A set containing unique generated date samples.
+        list: Dictionaries holding the formatted string under "text" and the `DATE_RECORD_FIELDS`,
+        with the date as an ISO string.
     """
 
+    columns = draw_date_batch(*args)
+    records = []
+    for text, date, *options in zip(map(format_date, *columns), *columns):
+        record = {"text": text, "date": date.date().isoformat()}
+        record.update(zip(DATE_RECORD_FIELDS[1:], options))
+        records.append(record)
+    return records
+
+
+def build_date_sampler():
+    """
+    Builds a sampler that generates a single date sample per call.
+
+    The weights, choices and ranges are read from the active profile (see `profile.set_profile`).
+
+    Returns:
+        callable: A function taking no arguments that returns a formatted date string.
+    """
+
+    profile = get_profile()
+
     # Precompute weighted lists for efficient sampling
-    format_weighted = generate_weighted_list(DATE_FORMAT_CHOICES, DATE_FORMAT_WEIGHTS)
+    format_weighted = generate_weighted_list(
+        profile["DATE_FORMAT_CHOICES"], profile["DATE_FORMAT_WEIGHTS"]
+    )
     year_type_weighted = generate_weighted_list(
-        DATE_YEAR_TYPE_CHOICES, DATE_YEAR_TYPE_WEIGHTS
+        profile["DATE_YEAR_TYPE_CHOICES"], profile["DATE_YEAR_TYPE_WEIGHTS"]
     )
     year_digit_weighted = generate_weighted_list(
-        DATE_YEAR_DIGIT_CHOICES, DATE_YEAR_DIGIT_WEIGHTS
+        profile["DATE_YEAR_DIGIT_CHOICES"], profile["DATE_YEAR_DIGIT_WEIGHTS"]
     )
     month_lang_thai_weighted = generate_weighted_list(
-        [True, False], DATE_MONTH_LANG_THAI_WEIGHTS
+        [True, False], profile["DATE_MONTH_LANG_THAI_WEIGHTS"]
+    )
+    full_month_weighted = generate_weighted_list(
+        [True, False], profile["DATE_FULL_MONTH_WEIGHTS"]
     )
-    full_month_weighted = generate_weighted_list([True, False], DATE_FULL_MONTH_WEIGHTS)
     date_format_weighted = generate_weighted_list(
-        DATE_DATE_FORMAT_CHOICES, DATE_DATE_FORMAT_WEIGHTS
+        profile["DATE_DATE_FORMAT_CHOICES"], profile["DATE_DATE_FORMAT_WEIGHTS"]
     )
     separator_weighted = generate_weighted_list(
-        DATE_SEPARATOR_CHOICES, DATE_SEPARATOR_WEIGHTS
+        profile["DATE_SEPARATOR_CHOICES"], profile["DATE_SEPARATOR_WEIGHTS"]
     )
     use_thai_numeral_weighted = generate_weighted_list(
-        [True, False], DATE_USE_THAI_NUMERAL_WEIGHTS
+        [True, False], profile["DATE_USE_THAI_NUMERAL_WEIGHTS"]
+    )
+
+    return functools.partial(
+        generate_single_date_sample,
+        format_weighted,
+        year_type_weighted,
+        year_digit_weighted,
+        month_lang_thai_weighted,
+        full_month_weighted,
+        date_format_weighted,
+        separator_weighted,
+        use_thai_numeral_weighted,
+        datetime(*profile["DATE_START_DATE"]),
+        datetime(*profile["DATE_END_DATE"]),
     )
 
-    # Generate unique date samples
-    output = set()
+
+def build_date_batch_sampler():
+    """
+    Builds a sampler that generates a batch of date samples per call.
+
+    Returns:
+        callable: A function taking the batch size that returns a list of formatted date strings.
+    """
+
+    return functools.partial(generate_date_batch, *build_date_sampler().args)
+
+
+def build_date_record_sampler():
+    """
+    Builds a sampler that generates a batch of date records per call.
+
+    Returns:
+        callable: A function taking the batch size that returns a list of date records.
+    """
+
+    return functools.partial(generate_date_record_batch, *build_date_sampler().args)
+
+
+def generate_dates(number_of_generated_sample):
+    """
+    Generates a specified number of date samples and writes them to a file.
+
+    Args:
+        number_of_generated_sample (int): The number of date samples to generate.
+
+    Returns:
+        list: The unique generated date samples, in generation order.
+    """
+
+    batch_sampler = build_date_batch_sampler()
+
+    # Generate unique date samples, a batch at a time
+    output = UniqueCollector()
     while len(output) < number_of_generated_sample:
-        output.add(
-            generate_single_date_sample(
-                format_weighted,
-                year_type_weighted,
-                year_digit_weighted,
-                month_lang_thai_weighted,
-                full_month_weighted,
-                date_format_weighted,
-                separator_weighted,
-                use_thai_numeral_weighted,
+        output.update(
+            batch_sampler(
+                min(number_of_generated_sample - len(output), FORMAT_BATCH_SIZE)
             )
         )
 
-    return output
+    return output.to_list()
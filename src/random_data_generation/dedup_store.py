@@ -0,0 +1,150 @@
+import itertools
+import sqlite3
+from .checkpoint import fingerprint
+
+# Number of samples checked against the store per transaction
+DEDUP_STORE_BATCH_SIZE = 65536
+
+# Seconds to wait for another job holding the write lock
+DEDUP_STORE_TIMEOUT = 600
+
+
+class FingerprintStore:
+    """
+    On-disk set of 64-bit sample fingerprints shared by every run that uses the same file.
+
+    The store is a SQLite database in rollback-journal mode, so concurrent jobs on one host, or on
+    machines sharing a network filesystem with working POSIX file locks, can claim samples safely:
+    each batch is checked and committed in a single write transaction, and a sample claimed by one
+    job is never handed to another.
+
+    Example:
+        with FingerprintStore("train-eval.sqlite") as store:
+            new_samples = store.claim(samples)
+    """
+
+    def __init__(self, path, timeout=DEDUP_STORE_TIMEOUT):
+        """
+        Opens the store, creating it if needed.
+
+        Args:
+            path (str): The path to the SQLite database file.
+            timeout (float): Seconds to wait for another job holding the write lock.
+        """
+
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        # WAL needs shared memory between connections, so it only works on a single host;
+        # the rollback journal relies on file locks alone and also works across machines
+        self._connection.execute("PRAGMA journal_mode=DELETE")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints (fingerprint INTEGER PRIMARY KEY) WITHOUT ROWID"
+        )
+        self._connection.execute(
+            "CREATE TEMP TABLE batch (fingerprint INTEGER PRIMARY KEY) WITHOUT ROWID"
+        )
+
+    def __len__(self):
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM fingerprints")
+        return count[0]
+
+    def claim(self, samples):
+        """
+        Atomically records the samples not seen by any run yet, and returns them.
+
+        Args:
+            samples (list): Unique samples to check against the store.
+
+        Returns:
+            list: The samples that were not in the store, in their original order.
+        """
+
+        # SQLite integers are signed, so fingerprints are stored shifted into the signed range
+        keys = [fingerprint(sample) - (1 << 63) for sample in samples]
+
+        connection = self._connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute("DELETE FROM batch")
+            connection.executemany("INSERT OR IGNORE INTO batch VALUES (?)", zip(keys))
+            taken = set(
+                key
+                for key, in connection.execute(
+                    "SELECT fingerprint FROM batch WHERE fingerprint IN (SELECT fingerprint FROM fingerprints)"
+                )
+            )
+            connection.execute(
+                "INSERT OR IGNORE INTO fingerprints SELECT fingerprint FROM batch"
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        return [sample for sample, key in zip(samples, keys) if key not in taken]
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def iter_claimed(
+    samples, store, batch_size=DEDUP_STORE_BATCH_SIZE, key=None, limit=None
+):
+    """
+    Lazily filters a stream of unique samples down to those no run has claimed in the store yet.
+
+    Samples are checked and claimed in batches. With a `limit`, batches shrink to what is still
+    missing, so the run claims only the samples it yields.
+
+    Args:
+        samples (iterator): Unique samples, or items holding them.
+        store (FingerprintStore): The shared fingerprint store.
+        batch_size (int): The number of samples checked per transaction.
+        key (callable): Extracts the sample from an item, or None when the items are the samples.
+        limit (int): The number of items to yield, or None to exhaust `samples`.
+
+    Yields:
+        The items whose samples were newly claimed.
+    """
+
+    samples = iter(samples)
+    yielded = 0
+    while limit is None or yielded < limit:
+        size = batch_size if limit is None else min(batch_size, limit - yielded)
+        batch = list(itertools.islice(samples, size))
+        if not batch:
+            return
+        if key is None:
+            claimed = store.claim(batch)
+        else:
+            claimed_samples = set(store.claim([key(item) for item in batch]))
+            claimed = [item for item in batch if key(item) in claimed_samples]
+        yielded += len(claimed)
+        yield from claimed
+
+
+def iter_store_unique(samples, store_path, key=None, limit=None):
+    """
+    Opens a fingerprint store for the lifetime of a stream and filters the stream through it.
+
+    Args:
+        samples (iterator): Unique samples, or items holding them.
+        store_path (str): The path to the SQLite database file shared by the runs.
+        key (callable): Extracts the sample from an item, or None when the items are the samples.
+        limit (int): The number of items to yield, or None to exhaust `samples`.
+
+    Yields:
+        The items whose samples were newly claimed.
+    """
+
+    with FingerprintStore(store_path) as store:
+        yield from iter_claimed(samples, store, key=key, limit=limit)
@@ -0,0 +1,108 @@
+import random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, blocks fall back to the pure Python path
+    np = None
+
+# Scales combining two 32-bit words into a 53-bit float, exactly as `random.random()` does
+HIGH_WORD_SCALE = 67108864.0
+FLOAT_SCALE = 1.0 / 9007199254740992.0
+
+
+def random_columns(row_count, column_count, generator=random):
+    """
+    Draws a block of random floats in [0, 1) at once and splits it into columns.
+
+    The block is read from the generator with a single `getrandbits` call. The floats, and the state of
+    the generator afterwards, are identical to `row_count * column_count` calls of `random()` made row
+    by row, so a batch sampler taking one row per sample produces the same samples as a per-sample
+    sampler making its calls in column order.
+
+    Args:
+        row_count (int): The number of rows, typically one per sample.
+        column_count (int): The number of floats in each row, typically one per random decision.
+        generator: The random generator, a `random.Random` instance or the `random` module itself.
+
+    Returns:
+        list: `column_count` sequences of `row_count` floats.
+    """
+
+    if np is None:
+        draws = [generator.random() for _ in range(row_count * column_count)]
+        return [draws[column::column_count] for column in range(column_count)]
+
+    # Each float takes the top 27 bits of one word and the top 26 bits of the next
+    word_count = 2 * row_count * column_count
+    block = generator.getrandbits(32 * word_count) if word_count else 0
+    words = np.frombuffer(block.to_bytes(4 * word_count, "little"), dtype="<u4")
+    floats = ((words[0::2] >> 5) * HIGH_WORD_SCALE + (words[1::2] >> 6)) * FLOAT_SCALE
+    floats = floats.reshape(row_count, column_count)
+    return [floats[:, column] for column in range(column_count)]
+
+
+def below(column, bound, offset=0):
+    """
+    Turns a column of random floats into integers, as `int(random.random() * bound) + offset` does.
+
+    Args:
+        column (sequence): Random floats in [0, 1).
+        bound (int): The number of distinct integers.
+        offset (int): The smallest integer.
+
+    Returns:
+        list: Integers in [offset, offset + bound).
+    """
+
+    if np is None:
+        return [int(draw * bound) + offset for draw in column]
+    return ((column * bound).astype(np.int64) + offset).tolist()
+
+
+def pick(weighted_list, column):
+    """
+    Picks an item of a weighted list for each random float of a column.
+
+    Args:
+        weighted_list (list): The items to pick from, weighted by repetition.
+        column (sequence): Random floats in [0, 1).
+
+    Returns:
+        list: The picked items.
+    """
+
+    return list(map(weighted_list.__getitem__, below(column, len(weighted_list))))
+
+
+def less_than(column, probability):
+    """
+    Turns a column of random floats into booleans, as `random.random() < probability` does.
+
+    Args:
+        column (sequence): Random floats in [0, 1).
+        probability (float): The probability of True.
+
+    Returns:
+        list: The booleans.
+    """
+
+    if np is None:
+        return [draw < probability for draw in column]
+    return (column < probability).tolist()
+
+
+def scale(column, factor):
+    """
+    Multiplies a column of random floats, as `random.random() * factor` does.
+
+    Args:
+        column (sequence): Random floats in [0, 1).
+        factor (float): The multiplier.
+
+    Returns:
+        list: The scaled floats.
+    """
+
+    if np is None:
+        return [draw * factor for draw in column]
+    return (column * factor).tolist()
@@ -0,0 +1,315 @@
+import collections
+import json
+import math
+import operator
+from .stratified import get_option_probabilities, get_strata_fields
+
+# Extension of the histogram file written next to a validated output
+HISTOGRAM_EXTENSION = "hist.json"
+
+# Significance level below which the chi-square test of an option reports drift; sampling bugs show up
+# as p-values far smaller than this. The histograms count every draw, before duplicates are dropped, so
+# the counts of a correct run follow the weights exactly and fail only once in a million checks
+DRIFT_ALPHA = 1e-6
+
+# Iterations and relative tolerance of the incomplete gamma function behind the chi-square p-value
+GAMMA_MAX_ITERATIONS = 1000
+GAMMA_EPSILON = 1e-15
+
+# Result of checking the sampled values of an option against its weights
+OptionCheck = collections.namedtuple(
+    "OptionCheck",
+    [
+        "field",
+        "count",
+        "chi_square",
+        "degrees_of_freedom",
+        "p_value",
+        "kl_divergence",
+        "drifted",
+    ],
+)
+
+
+def chi_square_p_value(statistic, degrees_of_freedom):
+    """
+    Computes the probability of a chi-square statistic at least as large as the one observed.
+
+    This is the regularized upper incomplete gamma function Q(k / 2, x / 2), evaluated by its series
+    below its mean and by its continued fraction above it.
+
+    Args:
+        statistic (float): The chi-square statistic.
+        degrees_of_freedom (int): The number of degrees of freedom.
+
+    Returns:
+        float: The p-value, in [0, 1].
+    """
+
+    if degrees_of_freedom <= 0 or statistic <= 0:
+        return 1.0
+    if math.isinf(statistic):
+        return 0.0
+
+    a = degrees_of_freedom / 2
+    x = statistic / 2
+    log_prefactor = a * math.log(x) - x - math.lgamma(a)
+
+    if x < a + 1:
+        # Series of the lower function P(a, x)
+        term = total = 1 / a
+        for n in range(1, GAMMA_MAX_ITERATIONS):
+            term *= x / (a + n)
+            total += term
+            if abs(term) < abs(total) * GAMMA_EPSILON:
+                break
+        return max(0.0, 1 - total * math.exp(log_prefactor))
+
+    # Modified Lentz continued fraction of Q(a, x)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    fraction = d
+    for n in range(1, GAMMA_MAX_ITERATIONS):
+        an = -n * (n - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        fraction *= delta
+        if abs(delta - 1) < GAMMA_EPSILON:
+            break
+    return min(1.0, fraction * math.exp(log_prefactor))
+
+
+def check_counts(counts, probabilities, alpha=DRIFT_ALPHA, max_kl=None, field=None):
+    """
+    Tests the observed counts of an option against the probabilities of its values.
+
+    Args:
+        counts (dict): The number of samples drawn with each value.
+        probabilities (dict): The probability of each value under the weights.
+        alpha (float): The significance level below which the chi-square test reports drift.
+        max_kl (float): The largest KL divergence of the observed from the expected frequencies, in nats,
+            or None to rely on the chi-square test alone.
+        field (str): The name of the option, reported in the result.
+
+    Returns:
+        OptionCheck: The statistics, with `drifted` set if either test fails. A value with a zero weight
+            that was sampled anyway always counts as drift.
+    """
+
+    total = sum(counts.values())
+    if total == 0:
+        return OptionCheck(field, 0, 0.0, 0, 1.0, 0.0, False)
+
+    expected_values = [value for value, p in probabilities.items() if p > 0]
+    unexpected = any(
+        count and probabilities.get(value, 0) <= 0 for value, count in counts.items()
+    )
+
+    chi_square = math.inf if unexpected else 0.0
+    kl_divergence = math.inf if unexpected else 0.0
+    if not unexpected:
+        for value in expected_values:
+            observed = counts.get(value, 0)
+            expected = total * probabilities[value]
+            chi_square += (observed - expected) ** 2 / expected
+            if observed:
+                kl_divergence += observed / total * math.log(observed / expected)
+
+    degrees_of_freedom = len(expected_values) - 1
+    p_value = chi_square_p_value(chi_square, degrees_of_freedom)
+    drifted = p_value < alpha or (max_kl is not None and kl_divergence > max_kl)
+    return OptionCheck(
+        field,
+        total,
+        chi_square,
+        degrees_of_freedom,
+        p_value,
+        kl_divergence,
+        drifted,
+    )
+
+
+def format_check(check, name):
+    """
+    Formats the result of a check as a one-line report.
+
+    Args:
+        check (OptionCheck): The result returned by `check_counts`.
+        name (str): The name of the checked output (e.g., "date").
+
+    Returns:
+        str: The report, e.g. "date.format: ok (n=1000, chi2=3.21, df=7, p=0.865, kl=0.0016)".
+    """
+
+    status = "DRIFT" if check.drifted else "ok"
+    return (
+        f"{name}.{check.field}: {status} (n={check.count}, chi2={check.chi_square:.2f}, "
+        f"df={check.degrees_of_freedom}, p={check.p_value:.3g}, kl={check.kl_divergence:.3g})"
+    )
+
+
+class OptionHistograms:
+    """
+    Streaming counts of the values taken by the sampled options of a data type, such as the date format
+    or the phone number separator.
+
+    The counts are updated a batch of records at a time as they are drawn, saved next to the output,
+    and checked against the weights of the profile in milliseconds once generation ends, so a run that
+    does not honor its weights is caught without re-parsing its output. Histograms of shards generated
+    on different machines can be merged before they are checked.
+
+    Every draw is counted, including the ones dropped as duplicates: rejecting duplicates removes more
+    samples of the options with few distinct values, so the options of the unique output no longer
+    follow the weights once the value space starts to fill up, even in a correct run.
+
+    Example:
+        histograms = OptionHistograms("date")
+        records = iter_unique_records("date", histograms=histograms)
+        write_records(records, n, "date.jsonl", "jsonl")
+        failed = [check for check in histograms.check() if check.drifted]
+    """
+
+    def __init__(self, data_type, fields=None):
+        """
+        Creates empty histograms.
+
+        Args:
+            data_type (str): The type of data (e.g., "date").
+            fields (list): The options to count, or None for every option of `stratified.get_strata_fields`.
+
+        Raises:
+            ValueError: If the options of the data type are not known.
+        """
+
+        self.data_type = data_type
+        self.fields = get_strata_fields(data_type) if fields is None else list(fields)
+        self.counters = {field: collections.Counter() for field in self.fields}
+        self.draws = 0
+
+    def update(self, records):
+        """
+        Counts the options of a batch of drawn records.
+
+        Args:
+            records (list): Records holding each option under its name, as returned by a record sampler.
+        """
+
+        for field, counter in self.counters.items():
+            counter.update(map(operator.itemgetter(field), records))
+        self.draws += len(records)
+
+    def merge(self, other):
+        """
+        Adds the counts of other histograms of the same data type, such as those of another shard.
+
+        Args:
+            other (OptionHistograms): The histograms to add.
+
+        Raises:
+            ValueError: If the histograms are of another data type.
+        """
+
+        if other.data_type != self.data_type:
+            raise ValueError(
+                f"Cannot merge histograms of {other.data_type} into {self.data_type}"
+            )
+        for field, counter in other.counters.items():
+            self.counters.setdefault(field, collections.Counter()).update(counter)
+            if field not in self.fields:
+                self.fields.append(field)
+        self.draws += other.draws
+
+    def check(self, alpha=DRIFT_ALPHA, max_kl=None):
+        """
+        Tests each option against its weights in the active profile.
+
+        Args:
+            alpha (float): The significance level below which the chi-square test reports drift.
+            max_kl (float): The largest KL divergence allowed, in nats, or None to rely on the chi-square test.
+
+        Returns:
+            list: The `OptionCheck` of each option.
+        """
+
+        probabilities = get_option_probabilities(self.data_type, self.fields)
+        return [
+            check_counts(
+                self.counters[field], probabilities[field], alpha, max_kl, field
+            )
+            for field in self.fields
+        ]
+
+    def to_dict(self):
+        """
+        Converts the histograms to a JSON-serializable dictionary.
+
+        Values are stored as their JSON encoding, so booleans, numbers and strings stay distinct.
+
+        Returns:
+            dict: The data type, the number of draws and the counts of each option.
+        """
+
+        return {
+            "data_type": self.data_type,
+            "draws": self.draws,
+            "histograms": {
+                field: {
+                    json.dumps(value, ensure_ascii=False): count
+                    for value, count in counter.items()
+                }
+                for field, counter in self.counters.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Restores histograms converted by `to_dict`.
+
+        Args:
+            data (dict): The dictionary returned by `to_dict`.
+
+        Returns:
+            OptionHistograms: The histograms.
+        """
+
+        histograms = cls(data["data_type"], list(data["histograms"]))
+        for field, counts in data["histograms"].items():
+            histograms.counters[field].update(
+                {json.loads(value): count for value, count in counts.items()}
+            )
+        histograms.draws = data["draws"]
+        return histograms
+
+    def write(self, file_path):
+        """
+        Saves the histograms as JSON.
+
+        Args:
+            file_path (str): The path to the histogram file, conventionally ending in `HISTOGRAM_EXTENSION`.
+        """
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def read(cls, file_path):
+        """
+        Loads histograms saved by `write`.
+
+        Args:
+            file_path (str): The path to the histogram file.
+
+        Returns:
+            OptionHistograms: The histograms.
+        """
+
+        with open(file_path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
@@ -1,22 +1,36 @@
+import functools
 import random
 from .constants import (
-    ARABIC_DIGITS,
     THAI_DIGITS,
     THAI_ALPHABETS,
-    LICENSE_CHOICES,
-    LICENSE_WEIGHTS,
     LICENSE_MIN_PREFIX_NUM,
     LICENSE_MAX_PREFIX_NUM,
     LICENSE_MIN_NUMBER,
     LICENSE_MAX_NUMBER,
-    LICENSE_SEPARATOR_CHOICES,
-    LICENSE_SEPARATOR_WEIGHTS,
-    LICENSE_USE_THAI_NUMERAL_WEIGHTS,
 )
+from .entropy import below, pick, random_columns
 from .generate_weighted_list import generate_weighted_list
+from .number_format import FORMAT_BATCH_SIZE, THAI_TRANSLATION_TABLE
+from .profile import get_profile
+from .unique import UniqueCollector
 
-# Pre-compute translation table
-THAI_TRANSLATION_TABLE = str.maketrans(ARABIC_DIGITS, THAI_DIGITS)
+# Values a license plate is formatted from, in the order of the `format_license_plate` arguments,
+# stored in license plate records
+LICENSE_PLATE_RECORD_FIELDS = (
+    "prefix_type",
+    "prefix_num",
+    "prefix_alphabet",
+    "number",
+    "separator",
+    "use_thai_numeral",
+)
+
+# Options a stratified run allocates quotas to, mapped to the position of their weighted list in the sampler arguments
+LICENSE_PLATE_STRATA = {
+    "prefix_type": 0,
+    "separator": 1,
+    "use_thai_numeral": 2,
+}
 
 
 def format_license_plate(
@@ -66,8 +80,29 @@ def format_license_plate(
     return f"{prefix}{separator}{number_str}"
 
 
+def pick_alphabet_pair(first_index, second_index):
+    """
+    Picks two distinct Thai alphabets, like `random.sample(THAI_ALPHABETS, 2)`.
+
+    Args:
+        first_index (int): A random index in [0, len(THAI_ALPHABETS)).
+        second_index (int): A random index in [0, len(THAI_ALPHABETS) - 1), skipping the first alphabet.
+
+    Returns:
+        str: The two alphabets.
+    """
+
+    if second_index >= first_index:
+        second_index += 1
+    return THAI_ALPHABETS[first_index] + THAI_ALPHABETS[second_index]
+
+
 def generate_single_license_plate_sample(
-    prefix_type_weighted, separator_weighted, use_thai_numeral_weighted
+    prefix_type_weighted,
+    separator_weighted,
+    use_thai_numeral_weighted,
+    prefix_num_range=(LICENSE_MIN_PREFIX_NUM, LICENSE_MAX_PREFIX_NUM),
+    number_range=(LICENSE_MIN_NUMBER, LICENSE_MAX_NUMBER),
 ):
     """
     Generates a single formatted license plate sample with random values for formatting options.
@@ -76,6 +111,8 @@ def generate_single_license_plate_sample(
         prefix_type_weighted (list): A list of prefix types, weighted by their probabilities.
         separator_weighted (list): A list of separators, weighted by their probabilities.
         use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
+        prefix_num_range (tuple): The smallest and largest prefix number.
+        number_range (tuple): The smallest and largest number.
 
     Returns:
         str: A randomly generated formatted license plate string based on the given weights and random selections.
@@ -83,15 +120,16 @@ def generate_single_license_plate_sample(
 
     # Randomly select number and generate random formatting options
     prefix_type = prefix_type_weighted[int(random.random() * len(prefix_type_weighted))]
+    min_prefix_num, max_prefix_num = prefix_num_range
     prefix_num = (
-        int(random.random() * (LICENSE_MAX_PREFIX_NUM - LICENSE_MIN_PREFIX_NUM + 1))
-        + LICENSE_MIN_PREFIX_NUM
+        int(random.random() * (max_prefix_num - min_prefix_num + 1)) + min_prefix_num
     )
-    prefix_alphabet = "".join(random.sample(THAI_ALPHABETS, 2))
-    number = (
-        int(random.random() * (LICENSE_MAX_NUMBER - LICENSE_MIN_NUMBER + 1))
-        + LICENSE_MIN_NUMBER
+    prefix_alphabet = pick_alphabet_pair(
+        int(random.random() * len(THAI_ALPHABETS)),
+        int(random.random() * (len(THAI_ALPHABETS) - 1)),
     )
+    min_number, max_number = number_range
+    number = int(random.random() * (max_number - min_number + 1)) + min_number
     separator = separator_weighted[int(random.random() * len(separator_weighted))]
     use_thai_numeral = use_thai_numeral_weighted[
         int(random.random() * len(use_thai_numeral_weighted))
@@ -109,33 +147,211 @@ def generate_single_license_plate_sample(
     return formatted_license_plate
 
 
-def generate_license_plates(number_of_generated_sample):
+def draw_license_plate_batch(
+    prefix_type_weighted,
+    separator_weighted,
+    use_thai_numeral_weighted,
+    prefix_num_range,
+    number_range,
+    number_of_generated_sample,
+):
     """
-    Generates a specified number of license plate samples.
+    Draws the random numbers and formatting options of a batch of license plate samples.
+
+    The random options are drawn as one block of entropy, row by row in the same order as repeated
+    calls to `generate_single_license_plate_sample`, so a seeded batch holds the same samples.
 
     Args:
-        number_of_generated_sample (int): The number of license plate samples to generate.
+        prefix_type_weighted (list): A list of prefix types, weighted by their probabilities.
+        separator_weighted (list): A list of separators, weighted by their probabilities.
+        use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
+        prefix_num_range (tuple): The smallest and largest prefix number.
+        number_range (tuple): The smallest and largest number.
+        number_of_generated_sample (int): The number of samples in the batch.
+
+    Returns:
+        list: One list per `format_license_plate` argument, in the order of `LICENSE_PLATE_RECORD_FIELDS`.
+    """
+
+    (
+        prefix_type_draws,
+        prefix_num_draws,
+        first_alphabet_draws,
+        second_alphabet_draws,
+        number_draws,
+        separator_draws,
+        use_thai_numeral_draws,
+    ) = random_columns(number_of_generated_sample, 7)
+    min_prefix_num, max_prefix_num = prefix_num_range
+    min_number, max_number = number_range
+
+    return [
+        pick(prefix_type_weighted, prefix_type_draws),
+        below(prefix_num_draws, max_prefix_num - min_prefix_num + 1, min_prefix_num),
+        list(
+            map(
+                pick_alphabet_pair,
+                below(first_alphabet_draws, len(THAI_ALPHABETS)),
+                below(second_alphabet_draws, len(THAI_ALPHABETS) - 1),
+            )
+        ),
+        below(number_draws, max_number - min_number + 1, min_number),
+        pick(separator_weighted, separator_draws),
+        pick(use_thai_numeral_weighted, use_thai_numeral_draws),
+    ]
+
+
+def generate_license_plate_batch(
+    prefix_type_weighted,
+    separator_weighted,
+    use_thai_numeral_weighted,
+    prefix_num_range,
+    number_range,
+    number_of_generated_sample,
+):
+    """
+    Generates a batch of formatted license plate samples with random values for formatting options.
+
+    The options are drawn by `draw_license_plate_batch`, so a seeded batch holds the same samples as
+    repeated calls to `generate_single_license_plate_sample`.
+
+    Args:
+        prefix_type_weighted (list): A list of prefix types, weighted by their probabilities.
+        separator_weighted (list): A list of separators, weighted by their probabilities.
+        use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
+        prefix_num_range (tuple): The smallest and largest prefix number.
+        number_range (tuple): The smallest and largest number.
+        number_of_generated_sample (int): The number of samples in the batch.
 
     Returns:
-        set: A set containing unique generated license plate samples.
+        list: The randomly generated formatted license plate strings.
     """
 
+    columns = draw_license_plate_batch(
+        prefix_type_weighted,
+        separator_weighted,
+        use_thai_numeral_weighted,
+        prefix_num_range,
+        number_range,
+        number_of_generated_sample,
+    )
+    return list(map(format_license_plate, *columns))
+
+
+def generate_license_plate_record_batch(*args):
+    """
+    Generates a batch of license plate records, each holding a formatted license plate and the values
+    it was formatted from.
+
+    Only the parts that appear in the license plate are recorded: the prefix number is None for the
+    "a" and "aa" prefix types, and the "a" and "1a" prefix types keep a single alphabet.
+
+    Args:
+        *args: The arguments of `generate_license_plate_batch`, ending with the number of samples in the batch.
+
+    Returns:
+        list: Dictionaries holding the formatted string under "text" and the `LICENSE_PLATE_RECORD_FIELDS`.
+    """
+
+    columns = draw_license_plate_batch(*args)
+    records = []
+    for text, prefix_type, prefix_num, prefix_alphabet, *options in zip(
+        map(format_license_plate, *columns), *columns
+    ):
+        if not prefix_type[0].isdigit():
+            prefix_num = None
+        if prefix_type.count("a") == 1:
+            prefix_alphabet = prefix_alphabet[0]
+        record = {
+            "text": text,
+            "prefix_type": prefix_type,
+            "prefix_num": prefix_num,
+            "prefix_alphabet": prefix_alphabet,
+        }
+        record.update(zip(LICENSE_PLATE_RECORD_FIELDS[3:], options))
+        records.append(record)
+    return records
+
+
+def build_license_plate_sampler():
+    """
+    Builds a sampler that generates a single license plate sample per call.
+
+    The weights, choices and ranges are read from the active profile (see `profile.set_profile`).
+
+    Returns:
+        callable: A function taking no arguments that returns a formatted license plate string.
+    """
+
+    profile = get_profile()
+
     # Precompute weighted lists for efficient sampling
-    prefix_type_weighted = generate_weighted_list(LICENSE_CHOICES, LICENSE_WEIGHTS)
+    prefix_type_weighted = generate_weighted_list(
+        profile["LICENSE_CHOICES"], profile["LICENSE_WEIGHTS"]
+    )
     separator_weighted = generate_weighted_list(
-        LICENSE_SEPARATOR_CHOICES, LICENSE_SEPARATOR_WEIGHTS
+        profile["LICENSE_SEPARATOR_CHOICES"], profile["LICENSE_SEPARATOR_WEIGHTS"]
     )
     use_thai_numeral_weighted = generate_weighted_list(
-        [True, False], LICENSE_USE_THAI_NUMERAL_WEIGHTS
+        [True, False], profile["LICENSE_USE_THAI_NUMERAL_WEIGHTS"]
+    )
+
+    return functools.partial(
+        generate_single_license_plate_sample,
+        prefix_type_weighted,
+        separator_weighted,
+        use_thai_numeral_weighted,
+        (profile["LICENSE_MIN_PREFIX_NUM"], profile["LICENSE_MAX_PREFIX_NUM"]),
+        (profile["LICENSE_MIN_NUMBER"], profile["LICENSE_MAX_NUMBER"]),
     )
 
-    # Generate unique license plates samples
-    output = set()
+
+def build_license_plate_batch_sampler():
+    """
+    Builds a sampler that generates a batch of license plate samples per call.
+
+    Returns:
+        callable: A function taking the batch size that returns a list of formatted license plate strings.
+    """
+
+    return functools.partial(
+        generate_license_plate_batch, *build_license_plate_sampler().args
+    )
+
+
+def build_license_plate_record_sampler():
+    """
+    Builds a sampler that generates a batch of license plate records per call.
+
+    Returns:
+        callable: A function taking the batch size that returns a list of license plate records.
+    """
+
+    return functools.partial(
+        generate_license_plate_record_batch, *build_license_plate_sampler().args
+    )
+
+
+def generate_license_plates(number_of_generated_sample):
+    """
+    Generates a specified number of license plate samples.
+
+    Args:
+        number_of_generated_sample (int): The number of license plate samples to generate.
+
+    Returns:
+        list: The unique generated license plate samples, in generation order.
+    """
+
+    batch_sampler = build_license_plate_batch_sampler()
+
+    # Generate unique license plates samples, a batch at a time
+    output = UniqueCollector()
     while len(output) < number_of_generated_sample:
-        output.add(
-            generate_single_license_plate_sample(
-                prefix_type_weighted, separator_weighted, use_thai_numeral_weighted
+        output.update(
+            batch_sampler(
+                min(number_of_generated_sample - len(output), FORMAT_BATCH_SIZE)
             )
         )
 
-    return output
+    return output.to_list()
@@ -0,0 +1,127 @@
+import bisect
+import functools
+import itertools
+import random
+from .registry import get_generator_types, is_generator_type
+from .stream import build_sampler
+
+
+def parse_ratios(value):
+    """
+    Parses a ratio specification such as "currency=5,date=2,numeric=1".
+
+    Args:
+        value (str): Comma-separated `type=weight` pairs. A type without a weight gets a weight of 1,
+            and "all" mixes every type with equal weights.
+
+    Returns:
+        dict: The weight of each data type, in the given order.
+    """
+
+    if value == "all":
+        return {data_type: 1 for data_type in get_generator_types()}
+
+    ratios = {}
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        data_type, _, weight = item.partition("=")
+        ratios[data_type.strip()] = float(weight) if weight else 1
+    return ratios
+
+
+def sample_mixed(data_types, samplers, cumulative_weights):
+    """
+    Generates a single sample of a data type picked at random according to cumulative weights.
+
+    Args:
+        data_types (list): The data types to pick from.
+        samplers (list): The sampler of each data type.
+        cumulative_weights (list): The running total of the weights of the data types.
+
+    Returns:
+        tuple: A `(data_type, sample)` pair.
+    """
+
+    index = bisect.bisect(cumulative_weights, random.random() * cumulative_weights[-1])
+    if index >= len(data_types):
+        index = len(data_types) - 1
+    return data_types[index], samplers[index]()
+
+
+def build_mixed_sampler(ratios, partition=None):
+    """
+    Builds a sampler that generates a single sample of a data type picked according to `ratios`.
+
+    Args:
+        ratios (dict): The relative weight of each data type, e.g. {"currency": 5, "date": 2}.
+        partition (tuple): A `(partition_index, partition_count)` pair restricting the samples
+            to a hash partition, or None for every sample.
+
+    Returns:
+        callable: A function taking no arguments that returns a `(data_type, sample)` pair.
+
+    Raises:
+        ValueError: If a data type is unknown, a ratio is negative or no ratio is positive.
+    """
+
+    for data_type, weight in ratios.items():
+        if not is_generator_type(data_type):
+            raise ValueError(f"Unknown data type: {data_type}")
+        if weight < 0:
+            raise ValueError(f"Ratio must be non-negative: {data_type}")
+
+    # Precompute samplers and cumulative weights for efficient type selection
+    data_types = [data_type for data_type, weight in ratios.items() if weight > 0]
+    if not data_types:
+        raise ValueError("At least one ratio must be positive")
+    samplers = [build_sampler(data_type, partition) for data_type in data_types]
+    cumulative_weights = list(itertools.accumulate(ratios[t] for t in data_types))
+
+    return functools.partial(sample_mixed, data_types, samplers, cumulative_weights)
+
+
+def iter_mixed(ratios, partition=None):
+    """
+    Lazily interleaves the generators into one stream of unique samples tagged with their type.
+
+    Each row picks its type at random according to `ratios`, so the stream is already shuffled
+    and no per-type output has to be materialized. Samples are deduplicated across the whole stream.
+
+    Args:
+        ratios (dict): The relative weight of each data type, e.g. {"currency": 5, "date": 2}.
+        partition (tuple): A `(partition_index, partition_count)` pair restricting the samples
+            to a hash partition, or None for every sample.
+
+    Yields:
+        tuple: A `(data_type, sample)` pair.
+    """
+
+    sampler = build_mixed_sampler(ratios, partition)
+
+    seen = set()
+    while True:
+        data_type, sample = sampler()
+        if sample not in seen:
+            seen.add(sample)
+            yield data_type, sample
+
+
+def generate_mixed(ratios, number_of_generated_sample, partition=None):
+    """
+    Generates a specified number of unique samples mixed across data types.
+
+    Args:
+        ratios (dict): The relative weight of each data type, e.g. {"currency": 5, "date": 2}.
+        number_of_generated_sample (int): The number of samples to generate.
+        partition (tuple): A `(partition_index, partition_count)` pair restricting the samples
+            to a hash partition, or None for every sample.
+
+    Returns:
+        list: `(data_type, sample)` pairs in generation order.
+    """
+
+    return list(
+        itertools.islice(iter_mixed(ratios, partition), number_of_generated_sample)
+    )
@@ -0,0 +1,222 @@
+from .constants import ARABIC_DIGITS, THAI_DIGITS
+from .table_cache import load_array_table
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, batches fall back to the pure Python path
+    np = None
+
+# Pre-compute translation table
+THAI_TRANSLATION_TABLE = str.maketrans(ARABIC_DIGITS, THAI_DIGITS)
+
+# Batches at least this large are formatted with NumPy when it is installed
+NUMPY_MIN_BATCH_SIZE = 10000
+
+# Number of samples the batch samplers draw at a time, large enough for the NumPy path
+FORMAT_BATCH_SIZE = 1 << 17
+
+# Largest number of decimal places with a prebuilt format spec and NumPy support
+NUMPY_MAX_DECIMALS = 3
+
+# Largest absolute amount handled by the NumPy path, kept well inside exact float64 integers
+NUMPY_MAX_AMOUNT = 10**12
+
+# Prebuilt format specs, keyed by (use_comma, decimals)
+FORMAT_SPECS = {
+    (use_comma, decimals): f",.{decimals}f" if use_comma else f".{decimals}f"
+    for use_comma in (True, False)
+    for decimals in range(NUMPY_MAX_DECIMALS + 1)
+}
+
+# Lazily built digit-group lookup tables, keyed by numeral system
+_GROUP_TABLES = {}
+
+
+def get_format_spec(use_comma, decimals):
+    """
+    Returns the prebuilt format spec for the given formatting options.
+
+    Args:
+        use_comma (bool): Whether to use commas for thousands separators.
+        decimals (int): The number of decimal places.
+
+    Returns:
+        str: A format spec usable with the built-in `format`.
+    """
+
+    format_spec = FORMAT_SPECS.get((use_comma, decimals))
+    if format_spec is None:
+        format_spec = f",.{decimals}f" if use_comma else f".{decimals}f"
+    return format_spec
+
+
+# Formatting options behind each prebuilt format spec, used by the NumPy path
+SPEC_OPTIONS = {format_spec: options for options, format_spec in FORMAT_SPECS.items()}
+
+
+def format_amount(amount, format_spec, use_thai_numeral=False):
+    """
+    Formats a single amount with a prebuilt format spec.
+
+    Args:
+        amount (float): The numeric value to format.
+        format_spec (str): A format spec returned by `get_format_spec`.
+        use_thai_numeral (bool): Whether to use Thai numerals.
+
+    Returns:
+        str: The formatted amount.
+    """
+
+    amount_str = format(amount, format_spec)
+    if use_thai_numeral:
+        amount_str = amount_str.translate(THAI_TRANSLATION_TABLE)
+    return amount_str
+
+
+def format_amounts(amounts, format_spec, use_thai_numeral=False):
+    """
+    Formats a batch of amounts sharing the same prebuilt format spec.
+
+    Large batches are formatted with NumPy when it is installed: rounding and digit grouping are
+    vectorized and the digits are written directly in the requested numeral system, so Thai numerals
+    need no separate translation pass. The output is identical to formatting each amount with `format_amount`.
+
+    Args:
+        amounts (list): The numeric values to format.
+        format_spec (str): A format spec returned by `get_format_spec`.
+        use_thai_numeral (bool): Whether to use Thai numerals.
+
+    Returns:
+        list: The formatted amounts, in the same order as `amounts`.
+    """
+
+    if (
+        np is not None
+        and len(amounts) >= NUMPY_MIN_BATCH_SIZE
+        and format_spec in SPEC_OPTIONS
+    ):
+        use_comma, decimals = SPEC_OPTIONS[format_spec]
+        output = _format_amounts_numpy(amounts, use_comma, decimals, use_thai_numeral)
+        if output is not None:
+            return output
+
+    output = [format(amount, format_spec) for amount in amounts]
+    if use_thai_numeral:
+        output = [amount_str.translate(THAI_TRANSLATION_TABLE) for amount_str in output]
+    return output
+
+
+def _get_group_tables(use_thai_numeral):
+    """
+    Returns the digit-group lookup tables for a numeral system, loading or building them on first use.
+
+    The tables are memory-mapped from the table cache when one is set (see `table_cache.set_cache_dir`).
+
+    Args:
+        use_thai_numeral (bool): Whether the tables hold Thai numerals.
+
+    Returns:
+        tuple: `(unpadded, padded, fractions)`, where `unpadded` and `padded` are NumPy string arrays
+        for the groups 0-999 and `fractions` maps a number of decimals to the zero-padded fraction strings.
+    """
+
+    tables = _GROUP_TABLES.get(use_thai_numeral)
+    if tables is None:
+        digits = THAI_DIGITS if use_thai_numeral else ARABIC_DIGITS
+        translation = str.maketrans(ARABIC_DIGITS, digits)
+        unpadded = load_array_table(
+            "groups",
+            digits,
+            lambda: np.array(
+                [str(value).translate(translation) for value in range(1000)]
+            ),
+        )
+        padded = load_array_table(
+            "padded-groups",
+            digits,
+            lambda: np.array(
+                [f"{value:03}".translate(translation) for value in range(1000)]
+            ),
+        )
+        fractions = {
+            decimals: load_array_table(
+                f"fractions-{decimals}",
+                digits,
+                lambda decimals=decimals: np.array(
+                    [
+                        f".{value:0{decimals}}".translate(translation)
+                        for value in range(10**decimals)
+                    ]
+                ),
+            )
+            for decimals in range(1, NUMPY_MAX_DECIMALS + 1)
+        }
+        tables = (unpadded, padded, fractions)
+        _GROUP_TABLES[use_thai_numeral] = tables
+    return tables
+
+
+def _format_amounts_numpy(amounts, use_comma, decimals, use_thai_numeral):
+    """
+    Formats a batch of amounts with vectorized rounding and table-driven digit groups.
+
+    Returns None when the batch holds values the fast path does not handle (negative, non-finite or
+    very large amounts), so the caller can fall back to the pure Python path.
+    """
+
+    values = np.asarray(amounts, dtype=np.float64)
+    if not np.all(np.isfinite(values)) or np.any(values < 0):
+        return None
+    if values.size and values.max() >= NUMPY_MAX_AMOUNT:
+        return None
+
+    scaled = values * 10**decimals
+    rounded = np.rint(scaled).astype(np.int64)
+
+    # Amounts too close to a rounding midpoint are formatted exactly by Python
+    ambiguous = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-3)
+
+    integer_parts, fraction_parts = np.divmod(rounded, 10**decimals)
+
+    # Split the integer parts into groups of three digits, most significant first
+    group_columns = []
+    remaining = integer_parts
+    while True:
+        remaining, group = np.divmod(remaining, 1000)
+        group_columns.append(group)
+        if not remaining.any():
+            break
+    group_columns.reverse()
+    total_groups = len(group_columns)
+
+    # Count the groups each amount needs, the leading group is written unpadded
+    group_counts = np.ones(len(values), dtype=np.int64)
+    for index in range(1, total_groups):
+        group_counts += integer_parts >= 1000**index
+
+    unpadded, padded, fractions = _get_group_tables(use_thai_numeral)
+    group_separator = "," if use_comma else ""
+    fraction_table = fractions.get(decimals)
+
+    output = np.empty(len(values), dtype=f"<U{4 * total_groups + decimals + 1}")
+    for group_count in range(1, total_groups + 1):
+        rows = np.flatnonzero(group_counts == group_count)
+        if not rows.size:
+            continue
+        first = total_groups - group_count
+        strings = unpadded[group_columns[first][rows]]
+        for column in group_columns[first + 1 :]:
+            if group_separator:
+                strings = np.char.add(strings, group_separator)
+            strings = np.char.add(strings, padded[column[rows]])
+        if fraction_table is not None:
+            strings = np.char.add(strings, fraction_table[fraction_parts[rows]])
+        output[rows] = strings
+
+    output = output.tolist()
+    for row in ambiguous.tolist():
+        output[row] = format_amount(
+            amounts[row], get_format_spec(use_comma, decimals), use_thai_numeral
+        )
+
+    return output
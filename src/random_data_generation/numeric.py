@@ -1,14 +1,24 @@
+import functools
 import random
-from .constants import (
-    ARABIC_DIGITS,
-    THAI_DIGITS,
-    NUMERIC_MAX_AMOUNT,
-    NUMERIC_USE_THAI_NUMERAL_WEIGHTS,
-)
+from .constants import NUMERIC_MAX_AMOUNT
+from .entropy import less_than, pick, random_columns, scale
 from .generate_weighted_list import generate_weighted_list
+from .number_format import (
+    FORMAT_BATCH_SIZE,
+    format_amount,
+    format_amounts,
+    get_format_spec,
+)
+from .profile import get_profile
+from .unique import UniqueCollector
+
+# Values a numeric is formatted from, in the order of the `format_numeric` arguments, stored in numeric records
+NUMERIC_RECORD_FIELDS = ("amount", "use_comma", "show_decimal", "use_thai_numeral")
 
-# Pre-compute translation table
-THAI_TRANSLATION_TABLE = str.maketrans(ARABIC_DIGITS, THAI_DIGITS)
+# Options a stratified run allocates quotas to, mapped to the position of their weighted list in the sampler arguments
+NUMERIC_STRATA = {
+    "use_thai_numeral": 0,
+}
 
 
 def format_numeric(amount, use_comma=True, show_decimal=False, use_thai_numeral=False):
@@ -28,29 +38,25 @@ def format_numeric(amount, use_comma=True, show_decimal=False, use_thai_numeral=
     # Set the number of decimal places based on whether to show decimal values
     decimals = 2 if show_decimal else 0
 
-    # Format the amount with or without commas for thousands separators
-    amount_str = f"{amount:,.{decimals}f}" if use_comma else f"{amount:.{decimals}f}"
+    return format_amount(amount, get_format_spec(use_comma, decimals), use_thai_numeral)
 
-    # Convert digits to Thai numerals if applicable
-    if use_thai_numeral:
-        amount_str = amount_str.translate(THAI_TRANSLATION_TABLE)
 
-    return amount_str
-
-
-def generate_single_numeric_sample(use_thai_numeral_weighted):
+def generate_single_numeric_sample(
+    use_thai_numeral_weighted, max_amount=NUMERIC_MAX_AMOUNT
+):
     """
     Generates a single formatted numeric sample with random values for formatting options.
 
     Args:
         use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
+        max_amount (int): The exclusive upper bound of the amounts.
 
     Returns:
         str: A randomly generated formatted numeric string based on the given weights and random selections.
     """
 
     # Randomly select amount and generate random formatting options
-    amount = random.random() * NUMERIC_MAX_AMOUNT
+    amount = random.random() * max_amount
     use_comma = random.random() < 0.5
     show_decimal = random.random() < 0.5
     use_thai_numeral = use_thai_numeral_weighted[
@@ -64,25 +70,194 @@ def generate_single_numeric_sample(use_thai_numeral_weighted):
     return formatted_numeric
 
 
-def generate_numerics(number_of_generated_sample):
+def format_numeric_batch(amounts, use_commas, show_decimals, use_thai_numerals):
     """
-    Generates a specified number of numeric samples and writes them to a file.
+    Formats a batch of numeric amounts, grouping them by formatting options so each group is
+    formatted in bulk with `format_amounts`, which uses NumPy for large groups.
 
     Args:
-        number_of_generated_sample (int): The number of numeric samples to generate.
+        amounts (list): The numeric values to format.
+        use_commas (list): For each amount, whether to use commas for thousands separators.
+        show_decimals (list): For each amount, whether to show decimal places.
+        use_thai_numerals (list): For each amount, whether to use Thai numerals.
+
+    Returns:
+        list: The formatted numeric strings, in the same order as `amounts`.
+    """
+
+    groups = {}
+    for index, option_key in enumerate(
+        zip(use_commas, show_decimals, use_thai_numerals)
+    ):
+        groups.setdefault(option_key, []).append(index)
+
+    output = [None] * len(amounts)
+    for (use_comma, show_decimal, use_thai_numeral), indices in groups.items():
+        format_spec = get_format_spec(use_comma, 2 if show_decimal else 0)
+        group_amounts = [amounts[index] for index in indices]
+        for index, formatted_numeric in zip(
+            indices, format_amounts(group_amounts, format_spec, use_thai_numeral)
+        ):
+            output[index] = formatted_numeric
+
+    return output
+
+
+def draw_numeric_batch(
+    use_thai_numeral_weighted, max_amount, number_of_generated_sample
+):
+    """
+    Draws the random amounts and formatting options of a batch of numeric samples.
+
+    The random options are drawn as one block of entropy, row by row in the same order as repeated
+    calls to `generate_single_numeric_sample`, so a seeded batch holds the same samples.
+
+    Args:
+        use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
+        max_amount (int): The exclusive upper bound of the amounts.
+        number_of_generated_sample (int): The number of samples in the batch.
+
+    Returns:
+        list: One list per `format_numeric` argument, in the order of `NUMERIC_RECORD_FIELDS`.
+    """
+
+    amount_draws, use_comma_draws, show_decimal_draws, use_thai_numeral_draws = (
+        random_columns(number_of_generated_sample, 4)
+    )
+
+    return [
+        scale(amount_draws, max_amount),
+        less_than(use_comma_draws, 0.5),
+        less_than(show_decimal_draws, 0.5),
+        pick(use_thai_numeral_weighted, use_thai_numeral_draws),
+    ]
+
+
+def generate_numeric_batch(
+    use_thai_numeral_weighted, max_amount, number_of_generated_sample
+):
+    """
+    Generates a batch of formatted numeric samples with random values for formatting options.
+
+    The options are drawn by `draw_numeric_batch`, so a seeded batch holds the same samples as repeated
+    calls to `generate_single_numeric_sample`, then the batch is formatted with `format_numeric_batch`.
+
+    Args:
+        use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
+        max_amount (int): The exclusive upper bound of the amounts.
+        number_of_generated_sample (int): The number of samples in the batch.
+
+    Returns:
+        list: The randomly generated formatted numeric strings.
+    """
+
+    return format_numeric_batch(
+        *draw_numeric_batch(
+            use_thai_numeral_weighted, max_amount, number_of_generated_sample
+        )
+    )
+
+
+def generate_numeric_record_batch(*args):
+    """
+    Generates a batch of numeric records, each holding a formatted numeric and the values it was
+    formatted from.
+
+    The recorded amount is the value the string shows: rounded to 2 decimals when decimals are shown,
+    and to an integer otherwise.
+
+    Args:
+        *args: The arguments of `generate_numeric_batch`, ending with the number of samples in the batch.
+
+    Returns:
+        list: Dictionaries holding the formatted string under "text" and the `NUMERIC_RECORD_FIELDS`.
+    """
+
+    columns = draw_numeric_batch(*args)
+    records = []
+    for text, amount, use_comma, show_decimal, use_thai_numeral in zip(
+        format_numeric_batch(*columns), *columns
+    ):
+        records.append(
+            {
+                "text": text,
+                "amount": round(amount, 2) if show_decimal else round(amount),
+                "use_comma": use_comma,
+                "show_decimal": show_decimal,
+                "use_thai_numeral": use_thai_numeral,
+            }
+        )
+    return records
+
+
+def build_numeric_sampler():
+    """
+    Builds a sampler that generates a single numeric sample per call.
+
+    The weights, choices and ranges are read from the active profile (see `profile.set_profile`).
 
     Returns:
-        set: A set containing unique generated numeric samples.
+        callable: A function taking no arguments that returns a formatted numeric string.
     """
 
+    profile = get_profile()
+
     # Precompute weighted lists for efficient sampling
     use_thai_numeral_weighted = generate_weighted_list(
-        [True, False], NUMERIC_USE_THAI_NUMERAL_WEIGHTS
+        [True, False], profile["NUMERIC_USE_THAI_NUMERAL_WEIGHTS"]
+    )
+
+    return functools.partial(
+        generate_single_numeric_sample,
+        use_thai_numeral_weighted,
+        profile["NUMERIC_MAX_AMOUNT"],
     )
 
-    # Generate unique numeric samples
-    output = set()
+
+def build_numeric_batch_sampler():
+    """
+    Builds a sampler that generates a batch of numeric samples per call.
+
+    Returns:
+        callable: A function taking the batch size that returns a list of formatted numeric strings.
+    """
+
+    return functools.partial(generate_numeric_batch, *build_numeric_sampler().args)
+
+
+def build_numeric_record_sampler():
+    """
+    Builds a sampler that generates a batch of numeric records per call.
+
+    Returns:
+        callable: A function taking the batch size that returns a list of numeric records.
+    """
+
+    return functools.partial(
+        generate_numeric_record_batch, *build_numeric_sampler().args
+    )
+
+
+def generate_numerics(number_of_generated_sample):
+    """
+    Generates a specified number of numeric samples and writes them to a file.
+
+    Args:
+        number_of_generated_sample (int): The number of numeric samples to generate.
+
+    Returns:
+        list: The unique generated numeric samples, in generation order.
+    """
+
+    batch_sampler = build_numeric_batch_sampler()
+
+    # Generate unique numeric samples, a batch at a time
+    output = UniqueCollector()
     while len(output) < number_of_generated_sample:
-        output.add(generate_single_numeric_sample(use_thai_numeral_weighted))
+        output.update(
+            batch_sampler(
+                min(number_of_generated_sample - len(output), FORMAT_BATCH_SIZE)
+            )
+        )
 
-    return output
+    return output.to_list()
@@ -0,0 +1,90 @@
+import zlib
+
+
+def stable_hash(sample):
+    """
+    Computes a hash of a sample that is identical across processes, machines and Python versions.
+
+    Unlike the built-in `hash`, the result does not depend on hash randomization.
+
+    Args:
+        sample (str): The sample to hash.
+
+    Returns:
+        int: An unsigned 32-bit hash.
+    """
+
+    return zlib.crc32(sample.encode("utf-8"))
+
+
+def parse_partition(value):
+    """
+    Parses a partition specification such as "2/8".
+
+    Args:
+        value (str): The zero-based partition index and the number of partitions, separated by "/".
+
+    Returns:
+        tuple: The `(partition_index, partition_count)` pair.
+
+    Raises:
+        ValueError: If the specification is malformed or the index is out of range.
+    """
+
+    index, separator, count = value.partition("/")
+    if not separator:
+        raise ValueError(f"Partition must look like 'i/N': {value}")
+    partition_index, partition_count = int(index), int(count)
+    if partition_count < 1 or not 0 <= partition_index < partition_count:
+        raise ValueError(f"Partition index out of range: {value}")
+    return partition_index, partition_count
+
+
+def partition_size(number_of_generated_sample, partition_index, partition_count):
+    """
+    Computes how many of the total samples belong to a partition.
+
+    The remainder of the division goes to the first partitions, so the sizes of all partitions
+    add up to `number_of_generated_sample`.
+
+    Args:
+        number_of_generated_sample (int): The total number of samples across all partitions.
+        partition_index (int): The zero-based partition index.
+        partition_count (int): The number of partitions.
+
+    Returns:
+        int: The number of samples in the partition.
+    """
+
+    size, remainder = divmod(number_of_generated_sample, partition_count)
+    return size + (1 if partition_index < remainder else 0)
+
+
+def partition_sampler(sampler, partition_index, partition_count):
+    """
+    Restricts a sampler to the samples whose stable hash falls in a partition.
+
+    Partitions are disjoint, so samplers restricted to different partitions never produce the same
+    sample and independent nodes need no shared state to stay globally unique.
+
+    Args:
+        sampler (callable): A function taking no arguments that returns a sample.
+        partition_index (int): The zero-based partition index.
+        partition_count (int): The number of partitions.
+
+    Returns:
+        callable: A function taking no arguments that returns a sample of the partition.
+    """
+
+    if partition_count == 1:
+        return sampler
+
+    crc32 = zlib.crc32
+
+    def sample_partition():
+        while True:
+            sample = sampler()
+            if crc32(sample.encode("utf-8")) % partition_count == partition_index:
+                return sample
+
+    return sample_partition
@@ -1,27 +1,36 @@
+import functools
 import random
 from .constants import (
-    ARABIC_DIGITS,
-    THAI_DIGITS,
     PHONE_NUMBER_MAX_LENGTH,
     PHONE_MIN_DIGIT,
     PHONE_MAX_DIGIT,
-    PHONE_CHOICES,
-    PHONE_WEIGHTS,
-    PHONE_HOME_PREFIX_CHOICES,
-    PHONE_HOME_PREFIX_WEIGHTS,
-    PHONE_MOBILE_PREFIX_CHOICES,
-    PHONE_MOBILE_PREFIX_WEIGHTS,
-    PHONE_INTER_PREFIX_WEIGHTS,
-    PHONE_SEPARATOR_CHOICES,
-    PHONE_SEPARATOR_WEIGHTS,
-    PHONE_FORMAT_CHOICES,
-    PHONE_FORMAT_WEIGHTS,
-    PHONE_USE_THAI_NUMERAL_WEIGHTS,
 )
+from .entropy import pick, random_columns
 from .generate_weighted_list import generate_weighted_list
+from .number_format import FORMAT_BATCH_SIZE, THAI_TRANSLATION_TABLE
+from .profile import get_profile
+from .unique import UniqueCollector
 
-# Pre-compute translation table
-THAI_TRANSLATION_TABLE = str.maketrans(ARABIC_DIGITS, THAI_DIGITS)
+# Values a phone number is formatted from, stored in phone number records
+PHONE_NUMBER_RECORD_FIELDS = (
+    "phone_type",
+    "prefix",
+    "number",
+    "international_prefix",
+    "separator",
+    "format",
+    "use_thai_numeral",
+)
+
+# Options a stratified run allocates quotas to, mapped to the position of their weighted list in the
+# sampler arguments; the prefixes are left out as each one only applies to one phone type
+PHONE_NUMBER_STRATA = {
+    "phone_type": 0,
+    "international_prefix": 3,
+    "separator": 4,
+    "format": 5,
+    "use_thai_numeral": 6,
+}
 
 
 def format_phone_number(
@@ -89,6 +98,8 @@ def generate_single_phone_number_sample(
     separator_weighted,
     format_weighted,
     use_thai_numeral_weighted,
+    number_length=PHONE_NUMBER_MAX_LENGTH,
+    digit_range=(PHONE_MIN_DIGIT, PHONE_MAX_DIGIT),
 ):
     """
     Generates a single formatted phone number sample with random values for options.
@@ -101,6 +112,8 @@ def generate_single_phone_number_sample(
         separator_weighted (list): A list of separator choices, weighted by their probabilities.
         format_weighted (list): A list of phone number format choices, weighted by their probabilities.
         use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
+        number_length (int): The number of digits drawn for the number.
+        digit_range (tuple): The smallest and largest digit.
 
     Returns:
         str: A randomly generated formatted phone number based on the given weights and random selections.
@@ -112,13 +125,10 @@ def generate_single_phone_number_sample(
     mobile_prefix = mobile_prefix_weighted[
         int(random.random() * len(mobile_prefix_weighted))
     ]
-    number_length = PHONE_NUMBER_MAX_LENGTH
+    min_digit, max_digit = digit_range
     number = "".join(
         [
-            str(
-                int(random.random() * (PHONE_MAX_DIGIT - PHONE_MIN_DIGIT + 1))
-                + PHONE_MIN_DIGIT
-            )
+            str(int(random.random() * (max_digit - min_digit + 1)) + min_digit)
             for _ in range(number_length)
         ]
     )
@@ -146,49 +156,248 @@ def generate_single_phone_number_sample(
     return formatted_phone_number
 
 
-def generate_phone_numbers(number_of_generated_sample):
+def draw_phone_number_batch(
+    phone_type_weighted,
+    home_prefix_weighted,
+    mobile_prefix_weighted,
+    international_prefix_weighted,
+    separator_weighted,
+    format_weighted,
+    use_thai_numeral_weighted,
+    number_length,
+    digit_range,
+    number_of_generated_sample,
+):
     """
-    Generates a specified number of phone number samples.
+    Draws the random numbers and formatting options of a batch of phone number samples.
+
+    The random options are drawn as one block of entropy, row by row in the same order as repeated
+    calls to `generate_single_phone_number_sample`, so a seeded batch holds the same samples.
 
     Args:
-        number_of_generated_sample (int): The number of phone number samples to generate.
+        phone_type_weighted (list): A list of phone type choices, weighted by their probabilities.
+        home_prefix_weighted (list): A list of home prefix choices, weighted by their probabilities.
+        mobile_prefix_weighted (list): A list of mobile prefix choices, weighted by their probabilities.
+        international_prefix_weighted (list): A list of boolean values indicating whether to include an international prefix, weighted by their probabilities.
+        separator_weighted (list): A list of separator choices, weighted by their probabilities.
+        format_weighted (list): A list of phone number format choices, weighted by their probabilities.
+        use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
+        number_length (int): The number of digits drawn for the number.
+        digit_range (tuple): The smallest and largest digit.
+        number_of_generated_sample (int): The number of samples in the batch.
+
+    Returns:
+        list: One list per `format_phone_number` argument, in the order of its parameters.
+    """
+
+    draws = random_columns(number_of_generated_sample, number_length + 7)
+    phone_type_draws, home_prefix_draws, mobile_prefix_draws = draws[:3]
+    number_draws = draws[3 : 3 + number_length]
+    (
+        international_prefix_draws,
+        separator_draws,
+        format_draws,
+        use_thai_numeral_draws,
+    ) = draws[3 + number_length :]
+
+    # Pick each digit as a string, then join the digits of each sample
+    min_digit, max_digit = digit_range
+    digits = [str(digit) for digit in range(min_digit, max_digit + 1)]
+    numbers = list(
+        map("".join, zip(*[pick(digits, column) for column in number_draws]))
+    )
+
+    return [
+        pick(phone_type_weighted, phone_type_draws),
+        pick(home_prefix_weighted, home_prefix_draws),
+        pick(mobile_prefix_weighted, mobile_prefix_draws),
+        numbers,
+        pick(international_prefix_weighted, international_prefix_draws),
+        pick(separator_weighted, separator_draws),
+        pick(format_weighted, format_draws),
+        pick(use_thai_numeral_weighted, use_thai_numeral_draws),
+    ]
+
+
+def generate_phone_number_batch(
+    phone_type_weighted,
+    home_prefix_weighted,
+    mobile_prefix_weighted,
+    international_prefix_weighted,
+    separator_weighted,
+    format_weighted,
+    use_thai_numeral_weighted,
+    number_length,
+    digit_range,
+    number_of_generated_sample,
+):
+    """
+    Generates a batch of formatted phone number samples with random values for options.
+
+    The options are drawn by `draw_phone_number_batch`, so a seeded batch holds the same samples as
+    repeated calls to `generate_single_phone_number_sample`.
+
+    Args:
+        phone_type_weighted (list): A list of phone type choices, weighted by their probabilities.
+        home_prefix_weighted (list): A list of home prefix choices, weighted by their probabilities.
+        mobile_prefix_weighted (list): A list of mobile prefix choices, weighted by their probabilities.
+        international_prefix_weighted (list): A list of boolean values indicating whether to include an international prefix, weighted by their probabilities.
+        separator_weighted (list): A list of separator choices, weighted by their probabilities.
+        format_weighted (list): A list of phone number format choices, weighted by their probabilities.
+        use_thai_numeral_weighted (list): A list of boolean values indicating whether to use Thai numerals, weighted by their probabilities.
+        number_length (int): The number of digits drawn for the number.
+        digit_range (tuple): The smallest and largest digit.
+        number_of_generated_sample (int): The number of samples in the batch.
 
     Returns:
-        set: A set containing unique generated phone number samples.
+        list: The randomly generated formatted phone numbers.
     """
 
+    columns = draw_phone_number_batch(
+        phone_type_weighted,
+        home_prefix_weighted,
+        mobile_prefix_weighted,
+        international_prefix_weighted,
+        separator_weighted,
+        format_weighted,
+        use_thai_numeral_weighted,
+        number_length,
+        digit_range,
+        number_of_generated_sample,
+    )
+    return list(map(format_phone_number, *columns))
+
+
+def generate_phone_number_record_batch(*args):
+    """
+    Generates a batch of phone number records, each holding a formatted phone number and the values
+    it was formatted from.
+
+    Only the prefix and the digits that appear in the phone number are recorded: home numbers use the
+    home prefix and 7 digits, mobile numbers the mobile prefix and 8 digits.
+
+    Args:
+        *args: The arguments of `generate_phone_number_batch`, ending with the number of samples in the batch.
+
+    Returns:
+        list: Dictionaries holding the formatted string under "text" and the `PHONE_NUMBER_RECORD_FIELDS`.
+    """
+
+    columns = draw_phone_number_batch(*args)
+    records = []
+    for text, phone_type, home_prefix, mobile_prefix, number, *options in zip(
+        map(format_phone_number, *columns), *columns
+    ):
+        if phone_type == "home":
+            prefix, number = home_prefix, number[:7]
+        else:
+            prefix, number = mobile_prefix, number[:8]
+        record = {
+            "text": text,
+            "phone_type": phone_type,
+            "prefix": prefix,
+            "number": number,
+        }
+        record.update(zip(PHONE_NUMBER_RECORD_FIELDS[3:], options))
+        records.append(record)
+    return records
+
+
+def build_phone_number_sampler():
+    """
+    Builds a sampler that generates a single phone number sample per call.
+
+    The weights, choices and ranges are read from the active profile (see `profile.set_profile`).
+
+    Returns:
+        callable: A function taking no arguments that returns a formatted phone number string.
+    """
+
+    profile = get_profile()
+
     # Precompute weighted lists for efficient sampling
-    phone_type_weighted = generate_weighted_list(PHONE_CHOICES, PHONE_WEIGHTS)
+    phone_type_weighted = generate_weighted_list(
+        profile["PHONE_CHOICES"], profile["PHONE_WEIGHTS"]
+    )
     home_prefix_weighted = generate_weighted_list(
-        PHONE_HOME_PREFIX_CHOICES, PHONE_HOME_PREFIX_WEIGHTS
+        profile["PHONE_HOME_PREFIX_CHOICES"], profile["PHONE_HOME_PREFIX_WEIGHTS"]
     )
     mobile_prefix_weighted = generate_weighted_list(
-        PHONE_MOBILE_PREFIX_CHOICES, PHONE_MOBILE_PREFIX_WEIGHTS
+        profile["PHONE_MOBILE_PREFIX_CHOICES"], profile["PHONE_MOBILE_PREFIX_WEIGHTS"]
     )
     international_prefix_weighted = generate_weighted_list(
-        [True, False], PHONE_INTER_PREFIX_WEIGHTS
+        [True, False], profile["PHONE_INTER_PREFIX_WEIGHTS"]
     )
     separator_weighted = generate_weighted_list(
-        PHONE_SEPARATOR_CHOICES, PHONE_SEPARATOR_WEIGHTS
+        profile["PHONE_SEPARATOR_CHOICES"], profile["PHONE_SEPARATOR_WEIGHTS"]
+    )
+    format_weighted = generate_weighted_list(
+        profile["PHONE_FORMAT_CHOICES"], profile["PHONE_FORMAT_WEIGHTS"]
     )
-    format_weighted = generate_weighted_list(PHONE_FORMAT_CHOICES, PHONE_FORMAT_WEIGHTS)
     use_thai_numeral_weighted = generate_weighted_list(
-        [True, False], PHONE_USE_THAI_NUMERAL_WEIGHTS
+        [True, False], profile["PHONE_USE_THAI_NUMERAL_WEIGHTS"]
+    )
+
+    return functools.partial(
+        generate_single_phone_number_sample,
+        phone_type_weighted,
+        home_prefix_weighted,
+        mobile_prefix_weighted,
+        international_prefix_weighted,
+        separator_weighted,
+        format_weighted,
+        use_thai_numeral_weighted,
+        profile["PHONE_NUMBER_MAX_LENGTH"],
+        (profile["PHONE_MIN_DIGIT"], profile["PHONE_MAX_DIGIT"]),
     )
 
-    # Generate unique phone number samples
-    output = set()
+
+def build_phone_number_batch_sampler():
+    """
+    Builds a sampler that generates a batch of phone number samples per call.
+
+    Returns:
+        callable: A function taking the batch size that returns a list of formatted phone numbers.
+    """
+
+    return functools.partial(
+        generate_phone_number_batch, *build_phone_number_sampler().args
+    )
+
+
+def build_phone_number_record_sampler():
+    """
+    Builds a sampler that generates a batch of phone number records per call.
+
+    Returns:
+        callable: A function taking the batch size that returns a list of phone number records.
+    """
+
+    return functools.partial(
+        generate_phone_number_record_batch, *build_phone_number_sampler().args
+    )
+
+
+def generate_phone_numbers(number_of_generated_sample):
+    """
+    Generates a specified number of phone number samples.
+
+    Args:
+        number_of_generated_sample (int): The number of phone number samples to generate.
+
+    Returns:
+        list: The unique generated phone number samples, in generation order.
+    """
+
+    batch_sampler = build_phone_number_batch_sampler()
+
+    # Generate unique phone number samples, a batch at a time
+    output = UniqueCollector()
     while len(output) < number_of_generated_sample:
-        output.add(
-            generate_single_phone_number_sample(
-                phone_type_weighted,
-                home_prefix_weighted,
-                mobile_prefix_weighted,
-                international_prefix_weighted,
-                separator_weighted,
-                format_weighted,
-                use_thai_numeral_weighted,
+        output.update(
+            batch_sampler(
+                min(number_of_generated_sample - len(output), FORMAT_BATCH_SIZE)
             )
         )
 
-    return output
+    return output.to_list()
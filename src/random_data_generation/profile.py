@@ -0,0 +1,239 @@
+import collections.abc
+import datetime
+import json
+from . import constants
+
+# Prefixes of the constants a profile may override, one per data type
+PROFILE_PREFIXES = ("CURRENCY_", "NUMERIC_", "PHONE_", "LICENSE_", "DATE_")
+
+# Default value of every constant a profile may override
+DEFAULT_VALUES = {
+    name: value
+    for name, value in vars(constants).items()
+    if name.startswith(PROFILE_PREFIXES)
+}
+
+# Choice lists that accept any string, since they are inserted into the samples verbatim
+FREE_CHOICES = {
+    "PHONE_SEPARATOR_CHOICES",
+    "LICENSE_SEPARATOR_CHOICES",
+    "DATE_SEPARATOR_CHOICES",
+}
+
+# Inclusive integer ranges, as (minimum name, maximum name, smallest allowed minimum)
+RANGES = (
+    ("PHONE_MIN_DIGIT", "PHONE_MAX_DIGIT", 0),
+    ("LICENSE_MIN_PREFIX_NUM", "LICENSE_MAX_PREFIX_NUM", 0),
+    ("LICENSE_MIN_NUMBER", "LICENSE_MAX_NUMBER", 0),
+)
+
+# Largest digit of the phone number and license plate prefix ranges, as they are written as one digit
+MAX_SINGLE_DIGIT = 9
+
+# Shortest phone number, as the formats split it into groups of up to 8 digits
+PHONE_NUMBER_MIN_LENGTH = 8
+
+# The profile every sampler is built from, until another one is activated
+_active_profile = None
+
+
+class Profile(collections.abc.Mapping):
+    """
+    Immutable table of the generation constants the samplers are built from.
+
+    A profile only holds tuples, integers and strings, so it can be pickled into worker processes.
+    """
+
+    def __init__(self, values):
+        self._values = {name: freeze(value) for name, value in values.items()}
+
+    def __getitem__(self, name):
+        return self._values[name]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return f"Profile({self._values!r})"
+
+
+def freeze(value):
+    """
+    Converts the lists of a constant into tuples, so it cannot be modified once compiled.
+
+    Args:
+        value: A constant value, possibly holding lists.
+
+    Returns:
+        The same value with every list replaced by a tuple.
+    """
+
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _check_type(name, value):
+    """
+    Checks that an overriding value has the shape of the default value.
+
+    Args:
+        name (str): The name of the constant.
+        value: The overriding value.
+
+    Raises:
+        ValueError: If the value does not have the shape of the default value.
+    """
+
+    default = DEFAULT_VALUES[name]
+    if isinstance(default, list):
+        if not isinstance(value, list) or not value:
+            raise ValueError(f"{name} must be a non-empty list")
+        kinds = {type(item) for item in default}
+        for item in value:
+            if type(item) not in kinds:
+                raise ValueError(f"{name} holds an invalid item: {item!r}")
+    elif isinstance(default, tuple):
+        if (
+            not isinstance(value, list)
+            or len(value) != len(default)
+            or not all(type(item) is int for item in value)
+        ):
+            raise ValueError(f"{name} must be a list of {len(default)} integers")
+    elif isinstance(default, int):
+        if type(value) is not int:
+            raise ValueError(f"{name} must be an integer")
+    else:
+        raise ValueError(f"{name} cannot be overridden")
+
+
+def compile_profile(overrides=None):
+    """
+    Validates overrides of the generation constants and compiles them into an immutable profile.
+
+    Args:
+        overrides (dict): Constant names, such as "DATE_FORMAT_WEIGHTS", mapped to the values replacing
+            their defaults. Lists stand for lists and tuples, like in a JSON or TOML file.
+
+    Returns:
+        Profile: The value of every overridable constant, with lists frozen into tuples.
+
+    Raises:
+        ValueError: If a constant is unknown or an overriding value is invalid.
+    """
+
+    overrides = overrides or {}
+    for name, value in overrides.items():
+        if name not in DEFAULT_VALUES:
+            raise ValueError(f"Unknown profile constant: {name}")
+        _check_type(name, value)
+
+    values = {**DEFAULT_VALUES, **overrides}
+
+    # Weights must match their choices and select at least one of them
+    for name in values:
+        if not name.endswith("_WEIGHTS"):
+            continue
+        weights = values[name]
+        choices_name = f"{name[: -len('_WEIGHTS')]}_CHOICES"
+        choice_count = len(values[choices_name]) if choices_name in values else 2
+        if len(weights) != choice_count:
+            raise ValueError(f"{name} must hold {choice_count} weights")
+        if any(weight < 0 for weight in weights) or not any(weights):
+            raise ValueError(f"{name} must be non-negative with a positive weight")
+
+    # Choices other than separators must be supported by the formatters
+    for name in values:
+        if name.endswith("_CHOICES") and name not in FREE_CHOICES:
+            unsupported = set(values[name]) - set(DEFAULT_VALUES[name])
+            if unsupported:
+                raise ValueError(f"{name} holds unsupported choices: {unsupported}")
+
+    for minimum_name, maximum_name, lowest in RANGES:
+        if not lowest <= values[minimum_name] <= values[maximum_name]:
+            raise ValueError(f"{minimum_name} and {maximum_name} form an invalid range")
+    if values["PHONE_MAX_DIGIT"] > MAX_SINGLE_DIGIT:
+        raise ValueError(f"PHONE_MAX_DIGIT must be at most {MAX_SINGLE_DIGIT}")
+    if values["LICENSE_MAX_PREFIX_NUM"] > MAX_SINGLE_DIGIT:
+        raise ValueError(f"LICENSE_MAX_PREFIX_NUM must be at most {MAX_SINGLE_DIGIT}")
+    if values["PHONE_NUMBER_MAX_LENGTH"] < PHONE_NUMBER_MIN_LENGTH:
+        raise ValueError(
+            f"PHONE_NUMBER_MAX_LENGTH must be at least {PHONE_NUMBER_MIN_LENGTH}"
+        )
+    for name in ("CURRENCY_MAX_AMOUNT", "NUMERIC_MAX_AMOUNT"):
+        if values[name] <= 0:
+            raise ValueError(f"{name} must be positive")
+
+    try:
+        start_date = datetime.date(*values["DATE_START_DATE"])
+        end_date = datetime.date(*values["DATE_END_DATE"])
+    except ValueError as error:
+        raise ValueError(f"Invalid date range: {error}") from error
+    if start_date > end_date:
+        raise ValueError("DATE_START_DATE must not be after DATE_END_DATE")
+
+    return Profile(values)
+
+
+def load_profile(file_path):
+    """
+    Loads and compiles a profile from a JSON or TOML file.
+
+    The file holds a table of constant names and their overriding values, for example
+    `{"CURRENCY_WEIGHTS": [1, 1, 1, 1, 1], "DATE_START_DATE": [2000, 1, 1]}`.
+
+    Args:
+        file_path (str): The path of the profile, read as TOML if it ends with ".toml" and as JSON otherwise.
+
+    Returns:
+        Profile: The compiled profile.
+
+    Raises:
+        ValueError: If the file is not a table or the profile is invalid.
+    """
+
+    if file_path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11, only JSON profiles can be loaded
+            raise ValueError("TOML profiles require Python 3.11 or later") from None
+        with open(file_path, "rb") as f:
+            overrides = tomllib.load(f)
+    else:
+        with open(file_path, encoding="utf-8") as f:
+            overrides = json.load(f)
+
+    if not isinstance(overrides, dict):
+        raise ValueError(f"Profile must be a table of constants: {file_path}")
+    return compile_profile(overrides)
+
+
+def get_profile():
+    """
+    Returns the profile the samplers are built from, compiling the defaults on first use.
+
+    Returns:
+        Profile: The active profile.
+    """
+
+    global _active_profile
+    if _active_profile is None:
+        _active_profile = compile_profile()
+    return _active_profile
+
+
+def set_profile(profile):
+    """
+    Activates a compiled profile for every sampler built afterwards in this process.
+
+    Worker pools pass the active profile to their processes with `set_profile` as initializer.
+
+    Args:
+        profile (Profile): A profile returned by `compile_profile` or `load_profile`, or None for the defaults.
+    """
+
+    global _active_profile
+    _active_profile = profile
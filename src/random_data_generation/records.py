@@ -0,0 +1,157 @@
+import csv
+import io
+import json
+from .partition import stable_hash
+from .registry import load_generator
+from .stream import iter_chunks
+from .writer import WRITER_MAX_QUEUED_CHUNKS, BackgroundWriter
+
+# Structured output formats, mapped to their file extension
+RECORD_FORMATS = {
+    "jsonl": "jsonl",
+    "csv": "csv",
+}
+
+# Number of records a record sampler generates per call
+RECORD_BATCH_SIZE = 4096
+
+# Number of records encoded and handed to the background writer at a time
+RECORD_CHUNK_SIZE = 65536
+
+
+def iter_unique_records(
+    data_type, seen=None, partition=None, batch_size=RECORD_BATCH_SIZE, histograms=None
+):
+    """
+    Lazily yields records of a data type whose samples are unique, in generation order.
+
+    Each record is a dictionary holding the formatted sample under "text" and the values it was formatted
+    from, such as the amount, currency code, date or format, so no consumer has to parse the sample back.
+
+    Args:
+        data_type (str): The type of data to generate (e.g., "currency").
+        seen (set): Samples that must not be yielded, updated as new records are yielded.
+        partition (tuple): A `(partition_index, partition_count)` pair, or None for every sample.
+        batch_size (int): The number of records generated per call of the record sampler.
+        histograms (OptionHistograms): Histograms counting the options of every drawn record, before
+            duplicates and other partitions are dropped, or None.
+
+    Yields:
+        dict: A record whose sample has not been yielded before.
+
+    Raises:
+        ValueError: If the data type is unknown.
+    """
+
+    record_sampler = load_generator(data_type).build_record_sampler()
+    if seen is None:
+        seen = set()
+    seen_add = seen.add
+    partition_index, partition_count = partition or (0, 1)
+    while True:
+        batch = record_sampler(batch_size)
+        if histograms is not None:
+            histograms.update(batch)
+        for record in batch:
+            text = record["text"]
+            if text in seen:
+                continue
+            if (
+                partition_count > 1
+                and stable_hash(text) % partition_count != partition_index
+            ):
+                continue
+            seen_add(text)
+            yield record
+
+
+def encode_jsonl(records):
+    """
+    Encodes a batch of records as JSON lines, keeping non-ASCII characters such as Thai numerals as is.
+
+    Args:
+        records (list): The records to encode.
+
+    Returns:
+        list: One JSON object per record, without line terminators.
+    """
+
+    return list(map(json.JSONEncoder(ensure_ascii=False).encode, records))
+
+
+def encode_csv(records, fields):
+    """
+    Encodes a batch of records as CSV rows, one row per record.
+
+    Each row is encoded on its own into a reused buffer, so a value holding a line break, such as a
+    separator from a profile, stays quoted inside its row instead of splitting it.
+
+    Args:
+        records (list): The records to encode.
+        fields (list): The column names, in order.
+
+    Returns:
+        list: One CSV row per record, without its line terminator. None values are written as empty cells.
+    """
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fields, lineterminator="\n")
+    rows = []
+    for record in records:
+        writer.writerow(record)
+        rows.append(buffer.getvalue()[:-1])
+        buffer.seek(0)
+        buffer.truncate()
+    return rows
+
+
+def write_records(
+    records,
+    number_of_generated_sample,
+    file_path,
+    record_format,
+    compression=None,
+    chunk_size=RECORD_CHUNK_SIZE,
+    max_queued_chunks=WRITER_MAX_QUEUED_CHUNKS,
+):
+    """
+    Writes lazily generated records to a JSONL or CSV file through a background writer thread.
+
+    Records are taken in chunks and each chunk is encoded at once before it is queued to the writer,
+    so compression and disk writes overlap with generation. CSV files start with a header row holding
+    the fields of the first record, which every record of a data type shares.
+
+    Args:
+        records (iterator): The records to write, generated lazily.
+        number_of_generated_sample (int): The number of records to write.
+        file_path (str): The path to the file where the records will be written.
+        record_format (str): One of `RECORD_FORMATS`.
+        compression (str): None for plain output, or one of `COMPRESSION_EXTENSIONS`.
+        chunk_size (int): The number of records in each chunk.
+        max_queued_chunks (int): The number of chunks that may wait for the writer thread.
+
+    Returns:
+        int: The number of records written, not counting the CSV header.
+
+    Raises:
+        ValueError: If the record format is unknown.
+    """
+
+    if record_format not in RECORD_FORMATS:
+        raise ValueError(f"Unknown record format: {record_format}")
+
+    fields = None
+    number_written = 0
+    with BackgroundWriter(file_path, compression, max_queued_chunks) as writer:
+        for chunk in iter_chunks(records, number_of_generated_sample, chunk_size):
+            if record_format == "jsonl":
+                rows = encode_jsonl(chunk)
+            else:
+                if fields is None:
+                    fields = list(chunk[0])
+                    writer.write([",".join(fields)])
+                rows = encode_csv(chunk, fields)
+            writer.write(rows)
+            number_written += len(rows)
+
+    return number_written
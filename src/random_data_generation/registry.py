@@ -0,0 +1,285 @@
+import collections
+import functools
+import importlib
+import os
+import sys
+import time
+from .unique import UniqueCollector
+
+# Entry point group through which other packages register extra data types, each entry point
+# named after its type and pointing at a sampler builder, e.g. "iban = my_package.iban:build_iban_sampler",
+# or at a module providing the fields of a `Generator`, e.g. "iban = my_package.iban"
+GENERATOR_ENTRY_POINT_GROUP = "random_data_generation.generators"
+
+# Environment variable that makes the registry report how long each generator takes to import,
+# so worker processes inherit it
+IMPORT_DEBUG_ENV = "RANDOM_DATA_DEBUG_IMPORTS"
+
+# Built-in data types, mapped to their module, sampler builder, bulk generator, batch sampler builder,
+# record sampler builder and stratifiable options
+BUILTIN_GENERATORS = {
+    "currency": (
+        ".currency",
+        "build_currency_sampler",
+        "generate_currencies",
+        "build_currency_batch_sampler",
+        "build_currency_record_sampler",
+        "CURRENCY_STRATA",
+    ),
+    "numeric": (
+        ".numeric",
+        "build_numeric_sampler",
+        "generate_numerics",
+        "build_numeric_batch_sampler",
+        "build_numeric_record_sampler",
+        "NUMERIC_STRATA",
+    ),
+    "date": (
+        ".date",
+        "build_date_sampler",
+        "generate_dates",
+        "build_date_batch_sampler",
+        "build_date_record_sampler",
+        "DATE_STRATA",
+    ),
+    "phone_number": (
+        ".phone_number",
+        "build_phone_number_sampler",
+        "generate_phone_numbers",
+        "build_phone_number_batch_sampler",
+        "build_phone_number_record_sampler",
+        "PHONE_NUMBER_STRATA",
+    ),
+    "license_plate": (
+        ".license_plate",
+        "build_license_plate_sampler",
+        "generate_license_plates",
+        "build_license_plate_batch_sampler",
+        "build_license_plate_record_sampler",
+        "LICENSE_PLATE_STRATA",
+    ),
+}
+
+# A loaded data type: a builder of single-sample samplers, a function generating unique samples in bulk,
+# builders of samplers returning a batch of samples or of records (see `sample_text_records`), and the
+# position of each stratifiable option among the sampler arguments, or None if it cannot be stratified
+Generator = collections.namedtuple(
+    "Generator",
+    [
+        "build_sampler",
+        "generate",
+        "build_batch_sampler",
+        "build_record_sampler",
+        "strata",
+    ],
+)
+
+# Optional fields of a plugin module, with the attribute each is read from
+PLUGIN_GENERATOR_ATTRIBUTES = {
+    "generate": "generate",
+    "build_batch_sampler": "build_batch_sampler",
+    "build_record_sampler": "build_record_sampler",
+    "strata": "STRATA",
+}
+
+# Generators loaded so far, keyed by data type
+_LOADED_GENERATORS = {}
+
+# Entry points of plugin data types, discovered on first use
+_plugin_entry_points = None
+
+
+def generate_unique(build_sampler, number_of_generated_sample):
+    """
+    Generates a specified number of unique samples with a sampler builder.
+
+    Args:
+        build_sampler (callable): A function taking no arguments that returns a sampler.
+        number_of_generated_sample (int): The number of samples to generate.
+
+    Returns:
+        list: The unique generated samples, in generation order.
+    """
+
+    sampler = build_sampler()
+
+    output = UniqueCollector()
+    while len(output) < number_of_generated_sample:
+        output.add(sampler())
+
+    return output.to_list()
+
+
+def sample_batch(sampler, number_of_generated_sample):
+    """
+    Generates a batch of samples, for data types without a batch function.
+
+    Args:
+        sampler (callable): A function taking no arguments that returns a sample.
+        number_of_generated_sample (int): The number of samples in the batch.
+
+    Returns:
+        list: The samples, which may repeat.
+    """
+
+    return [sampler() for _ in range(number_of_generated_sample)]
+
+
+def build_sample_batch_sampler(build_sampler):
+    """
+    Builds a sampler that generates a batch of samples per call.
+
+    Args:
+        build_sampler (callable): A function taking no arguments that returns a sampler.
+
+    Returns:
+        callable: A function taking the batch size that returns a list of samples.
+    """
+
+    return functools.partial(sample_batch, build_sampler())
+
+
+def sample_text_records(sampler, number_of_generated_sample):
+    """
+    Generates a batch of records that only hold the sample, for data types without sampled components.
+
+    Args:
+        sampler (callable): A function taking no arguments that returns a sample.
+        number_of_generated_sample (int): The number of records in the batch.
+
+    Returns:
+        list: Dictionaries holding the sample under "text".
+    """
+
+    return [{"text": sampler()} for _ in range(number_of_generated_sample)]
+
+
+def build_text_record_sampler(build_sampler):
+    """
+    Builds a sampler that generates a batch of text-only records per call.
+
+    Args:
+        build_sampler (callable): A function taking no arguments that returns a sampler.
+
+    Returns:
+        callable: A function taking the batch size that returns a list of records.
+    """
+
+    return functools.partial(sample_text_records, build_sampler())
+
+
+def set_import_debug(enabled):
+    """
+    Turns import time reports on or off for this process and the worker processes it starts.
+
+    Args:
+        enabled (bool): Whether to report import times.
+    """
+
+    if enabled:
+        os.environ[IMPORT_DEBUG_ENV] = "1"
+    else:
+        os.environ.pop(IMPORT_DEBUG_ENV, None)
+
+
+def _get_plugin_entry_points():
+    """
+    Discovers the entry points of plugin data types, once per process.
+
+    Returns:
+        dict: The entry points, keyed by data type. Built-in types cannot be overridden.
+    """
+
+    global _plugin_entry_points
+    if _plugin_entry_points is None:
+        import importlib.metadata
+
+        entry_points = importlib.metadata.entry_points()
+        if hasattr(entry_points, "select"):
+            group = entry_points.select(group=GENERATOR_ENTRY_POINT_GROUP)
+        else:  # Python < 3.10 returns a dict of groups
+            group = entry_points.get(GENERATOR_ENTRY_POINT_GROUP, [])
+        _plugin_entry_points = {
+            entry_point.name: entry_point
+            for entry_point in group
+            if entry_point.name not in BUILTIN_GENERATORS
+        }
+    return _plugin_entry_points
+
+
+def get_generator_types():
+    """
+    Lists the available data types without importing their generators.
+
+    Returns:
+        list: The built-in data types followed by the plugin data types.
+    """
+
+    return [*BUILTIN_GENERATORS, *_get_plugin_entry_points()]
+
+
+def is_generator_type(data_type):
+    """
+    Checks whether a data type is available, without importing its generator.
+
+    Args:
+        data_type (str): The type of data (e.g., "currency").
+
+    Returns:
+        bool: Whether the data type is built in or registered by a plugin.
+    """
+
+    return data_type in BUILTIN_GENERATORS or data_type in _get_plugin_entry_points()
+
+
+def load_generator(data_type):
+    """
+    Imports the generator of a data type on first use.
+
+    Args:
+        data_type (str): The type of data (e.g., "currency").
+
+    Returns:
+        Generator: The sampler builders, bulk generator and stratifiable options of the data type.
+
+    Raises:
+        ValueError: If the data type is unknown.
+    """
+
+    generator = _LOADED_GENERATORS.get(data_type)
+    if generator is not None:
+        return generator
+
+    start_time = time.perf_counter()
+    if data_type in BUILTIN_GENERATORS:
+        module_name, *function_names = BUILTIN_GENERATORS[data_type]
+        module = importlib.import_module(module_name, __package__)
+        generator = Generator(*[getattr(module, name) for name in function_names])
+    elif data_type in _get_plugin_entry_points():
+        plugin = _get_plugin_entry_points()[data_type].load()
+        build_sampler = plugin if callable(plugin) else plugin.build_sampler
+        generator = Generator(
+            build_sampler,
+            functools.partial(generate_unique, build_sampler),
+            functools.partial(build_sample_batch_sampler, build_sampler),
+            functools.partial(build_text_record_sampler, build_sampler),
+            None,
+        )
+        if not callable(plugin):
+            # A module may provide any of the other fields itself
+            generator = generator._replace(
+                **{
+                    field: getattr(plugin, attribute)
+                    for field, attribute in PLUGIN_GENERATOR_ATTRIBUTES.items()
+                    if hasattr(plugin, attribute)
+                }
+            )
+    else:
+        raise ValueError(f"Unknown data type: {data_type}")
+
+    if os.environ.get(IMPORT_DEBUG_ENV):
+        elapsed = (time.perf_counter() - start_time) * 1000
+        print(f"Imported {data_type} generator in {elapsed:.1f} ms", file=sys.stderr)
+
+    _LOADED_GENERATORS[data_type] = generator
+    return generator
@@ -0,0 +1,328 @@
+import asyncio
+import collections
+import random
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from .profile import get_profile, set_profile
+from .shards import generate_candidates
+from .registry import is_generator_type
+
+# Wire format: every length or count is an unsigned 32-bit big-endian integer
+FRAME_HEADER = struct.Struct("!I")
+
+# Row count announcing an error message instead of rows
+ERROR_MARKER = 0xFFFFFFFF
+
+# Largest number of rows a client may request at once
+SERVER_MAX_REQUEST_ROWS = 1 << 20
+
+# Number of samples a worker generates per task
+SERVER_BATCH_SIZE = 10000
+
+# Number of batches generated ahead of each client, per type
+SERVER_PREFETCH_BATCHES = 4
+
+
+def encode_request(data_type, number_of_generated_sample):
+    """
+    Encodes a request for a batch of samples.
+
+    Args:
+        data_type (str): The type of data to generate.
+        number_of_generated_sample (int): The number of samples in the batch.
+
+    Returns:
+        bytes: The length-prefixed request.
+    """
+
+    body = f"{data_type} {number_of_generated_sample}".encode("utf-8")
+    return FRAME_HEADER.pack(len(body)) + body
+
+
+def parse_request(body):
+    """
+    Parses the body of a request encoded by `encode_request`.
+
+    Args:
+        body (bytes): The request without its length prefix.
+
+    Returns:
+        tuple: The `(data_type, number_of_generated_sample)` pair.
+
+    Raises:
+        ValueError: If the request is malformed or asks for an unknown type or too many rows.
+    """
+
+    data_type, _, number = body.decode("utf-8").partition(" ")
+    if not is_generator_type(data_type):
+        raise ValueError(f"Unknown data type: {data_type}")
+    number_of_generated_sample = int(number)
+    if not 0 <= number_of_generated_sample <= SERVER_MAX_REQUEST_ROWS:
+        raise ValueError(f"Number of rows out of range: {number}")
+    return data_type, number_of_generated_sample
+
+
+def encode_rows(rows):
+    """
+    Encodes a batch of rows as a row count followed by length-prefixed UTF-8 rows.
+
+    Args:
+        rows (list): The rows to send.
+
+    Returns:
+        bytes: The encoded batch.
+    """
+
+    pack = FRAME_HEADER.pack
+    parts = [pack(len(rows))]
+    for row in rows:
+        encoded = row.encode("utf-8")
+        parts.append(pack(len(encoded)))
+        parts.append(encoded)
+    return b"".join(parts)
+
+
+def encode_error(message):
+    """
+    Encodes an error reply, sent instead of rows when a request is rejected.
+
+    Args:
+        message (str): The error message.
+
+    Returns:
+        bytes: The encoded error.
+    """
+
+    encoded = message.encode("utf-8")
+    return FRAME_HEADER.pack(ERROR_MARKER) + FRAME_HEADER.pack(len(encoded)) + encoded
+
+
+async def read_frame(reader):
+    """
+    Reads one length-prefixed frame from a stream.
+
+    Args:
+        reader (asyncio.StreamReader): The stream to read from.
+
+    Returns:
+        bytes: The frame without its length prefix.
+
+    Raises:
+        asyncio.IncompleteReadError: If the stream ends before the frame is complete.
+    """
+
+    (length,) = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+    return await reader.readexactly(length)
+
+
+class _Prefetcher:
+    """
+    Keeps batches of one type generated ahead of a client.
+
+    Up to `prefetch` batches are generated in the process pool while up to `prefetch` more wait in a
+    bounded queue. Once the queue is full, no new batch is started until the client takes one, so a
+    slow client holds back generation instead of growing memory.
+    """
+
+    def __init__(self, executor, data_type, batch_size, prefetch):
+        self._executor = executor
+        self._data_type = data_type
+        self._batch_size = batch_size
+        self._prefetch = prefetch
+        self._queue = asyncio.Queue(maxsize=prefetch)
+        self._batch = []
+        self._offset = 0
+        self._task = asyncio.ensure_future(self._fill())
+
+    def _submit(self):
+        return asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            generate_candidates,
+            self._data_type,
+            self._batch_size,
+            random.getrandbits(64),
+        )
+
+    async def _fill(self):
+        pending = collections.deque(self._submit() for _ in range(self._prefetch))
+        try:
+            while True:
+                batch = await pending.popleft()
+                await self._queue.put(batch)
+                pending.append(self._submit())
+        except Exception as error:
+            # Hand the failure to the client waiting for rows
+            await self._queue.put(error)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def take(self, number_of_generated_sample):
+        """
+        Takes the next samples, waiting for batches to be generated when needed.
+
+        Args:
+            number_of_generated_sample (int): The number of samples to take.
+
+        Returns:
+            list: The samples.
+        """
+
+        rows = []
+        while len(rows) < number_of_generated_sample:
+            if self._offset == len(self._batch):
+                batch = await self._queue.get()
+                if isinstance(batch, Exception):
+                    raise batch
+                self._batch, self._offset = batch, 0
+            end = self._offset + number_of_generated_sample - len(rows)
+            rows.extend(self._batch[self._offset : end])
+            self._offset = min(end, len(self._batch))
+        return rows
+
+    def close(self):
+        self._task.cancel()
+
+
+class GenerationServer:
+    """
+    Serves batches of generated samples to local clients over a Unix socket or TCP.
+
+    A client sends requests encoded by `encode_request` and receives, for each one, a row count
+    followed by length-prefixed UTF-8 rows (see `encode_rows`), or an error (see `encode_error`).
+    Samples are generated by a pool of worker processes, so the event loop never blocks on
+    formatting, and each client gets its own prefetched batches per type. Samples are unique
+    within each generated batch.
+
+    Example:
+        server = GenerationServer(jobs=4)
+        await server.start(path="/tmp/random_data.sock")
+        await server.serve_forever()
+    """
+
+    def __init__(
+        self,
+        jobs=None,
+        batch_size=SERVER_BATCH_SIZE,
+        prefetch=SERVER_PREFETCH_BATCHES,
+    ):
+        """
+        Creates the server and its pool of worker processes.
+
+        Args:
+            jobs (int): The number of worker processes, or None for the number of CPUs.
+            batch_size (int): The number of samples a worker generates per task.
+            prefetch (int): The number of batches generated ahead of each client, per type.
+        """
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=jobs, initializer=set_profile, initargs=(get_profile(),)
+        )
+        self._batch_size = batch_size
+        self._prefetch = prefetch
+        self._server = None
+
+    async def _handle_client(self, reader, writer):
+        prefetchers = {}
+        try:
+            while True:
+                try:
+                    body = await read_frame(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+
+                try:
+                    data_type, number_of_generated_sample = parse_request(body)
+                except ValueError as error:
+                    writer.write(encode_error(str(error)))
+                    await writer.drain()
+                    continue
+
+                if data_type not in prefetchers:
+                    prefetchers[data_type] = _Prefetcher(
+                        self._executor, data_type, self._batch_size, self._prefetch
+                    )
+                try:
+                    rows = await prefetchers[data_type].take(number_of_generated_sample)
+                except Exception as error:
+                    writer.write(encode_error(f"Generation failed: {error}"))
+                    await writer.drain()
+                    break
+
+                writer.write(encode_rows(rows))
+                # Wait for the client to read before serving its next request
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for prefetcher in prefetchers.values():
+                prefetcher.close()
+            writer.close()
+
+    async def start(self, path=None, host="127.0.0.1", port=0):
+        """
+        Starts listening for clients.
+
+        Args:
+            path (str): The path of a Unix socket to listen on, or None to listen on TCP.
+            host (str): The TCP host to listen on.
+            port (int): The TCP port to listen on, 0 to pick a free port.
+
+        Returns:
+            asyncio.AbstractServer: The listening server, whose `sockets` give the bound address.
+        """
+
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_client, path)
+        else:
+            self._server = await asyncio.start_server(self._handle_client, host, port)
+        return self._server
+
+    async def serve_forever(self):
+        """
+        Serves clients until the server is closed.
+        """
+
+        await self._server.serve_forever()
+
+    async def close(self):
+        """
+        Stops listening and shuts the worker processes down.
+        """
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+async def fetch_rows(reader, writer, data_type, number_of_generated_sample):
+    """
+    Requests a batch of samples from a `GenerationServer` and reads the reply.
+
+    Args:
+        reader (asyncio.StreamReader): The stream of the connection to read from.
+        writer (asyncio.StreamWriter): The stream of the connection to write to.
+        data_type (str): The type of data to generate.
+        number_of_generated_sample (int): The number of samples in the batch.
+
+    Returns:
+        list: The samples.
+
+    Raises:
+        ValueError: If the server rejected the request.
+    """
+
+    writer.write(encode_request(data_type, number_of_generated_sample))
+    await writer.drain()
+
+    (count,) = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+    if count == ERROR_MARKER:
+        raise ValueError((await read_frame(reader)).decode("utf-8"))
+    return [(await read_frame(reader)).decode("utf-8") for _ in range(count)]
@@ -0,0 +1,187 @@
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from .profile import get_profile, set_profile
+from .registry import is_generator_type
+from .stream import build_sampler, iter_chunks
+from .unique import UniqueCollector
+from .writer import BackgroundWriter
+
+# Number of candidate samples a worker generates per task
+SHARD_BATCH_SIZE = 50000
+
+# Number of shards that may be written concurrently while the next one is filled
+SHARD_MAX_OPEN_WRITERS = 4
+
+
+def shard_file_name(data_type, shard_index, extension="txt"):
+    """
+    Builds the file name of an output shard, e.g. "currency-00001.txt".
+
+    Args:
+        data_type (str): The type of data in the shard.
+        shard_index (int): The zero-based index of the shard.
+        extension (str): The file extension.
+
+    Returns:
+        str: The shard file name.
+    """
+
+    return f"{data_type}-{shard_index:05d}.{extension}"
+
+
+def generate_candidates(data_type, number_of_generated_sample, seed, partition=None):
+    """
+    Generates a batch of locally unique samples in a worker process.
+
+    Args:
+        data_type (str): The type of data to generate.
+        number_of_generated_sample (int): The number of samples to generate.
+        seed (int): The seed of the worker's random generator, so forked workers do not repeat each other.
+        partition (tuple): A `(partition_index, partition_count)` pair, or None for every sample.
+
+    Returns:
+        list: The unique samples, in generation order.
+    """
+
+    random.seed(seed)
+    sampler = build_sampler(data_type, partition)
+
+    output = UniqueCollector()
+    while len(output) < number_of_generated_sample:
+        output.add(sampler())
+
+    return output.to_list()
+
+
+def iter_parallel_unique(
+    data_type, jobs, batch_size=SHARD_BATCH_SIZE, seen=None, partition=None
+):
+    """
+    Lazily yields unique samples generated by a pool of worker processes.
+
+    Workers generate candidate batches concurrently, while this process drops the samples already
+    yielded, so uniqueness holds across all workers.
+
+    Args:
+        data_type (str): The type of data to generate.
+        jobs (int): The number of worker processes.
+        batch_size (int): The number of candidate samples per worker task.
+        seen (set): Samples that must not be yielded, updated as new samples are yielded.
+        partition (tuple): A `(partition_index, partition_count)` pair, or None for every sample.
+
+    Yields:
+        str: A sample that has not been yielded before.
+    """
+
+    if not is_generator_type(data_type):
+        raise ValueError(f"Unknown data type: {data_type}")
+    if seen is None:
+        seen = set()
+
+    executor = ProcessPoolExecutor(
+        max_workers=jobs, initializer=set_profile, initargs=(get_profile(),)
+    )
+    futures = []
+    try:
+        # Keep every worker busy with one task, plus one queued task each
+        for _ in range(2 * jobs):
+            futures.append(
+                executor.submit(
+                    generate_candidates,
+                    data_type,
+                    batch_size,
+                    random.getrandbits(64),
+                    partition,
+                )
+            )
+        while True:
+            candidates = futures.pop(0).result()
+            futures.append(
+                executor.submit(
+                    generate_candidates,
+                    data_type,
+                    batch_size,
+                    random.getrandbits(64),
+                    partition,
+                )
+            )
+            for sample in candidates:
+                if sample not in seen:
+                    seen.add(sample)
+                    yield sample
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def write_shards(
+    samples,
+    data_type,
+    number_of_generated_sample,
+    output_dir,
+    shard_size,
+    compression=None,
+    extension="txt",
+):
+    """
+    Writes unique samples to rotating shard files with a manifest.
+
+    Shards are named `<type>-00000.<extension>`, `<type>-00001.<extension>`, ... and hold
+    `shard_size` entries each, except possibly the last one. Each shard is written by its own
+    background writer thread while the next shard is being filled. The manifest,
+    `<type>-manifest.json`, lists the row count and byte size of every shard.
+
+    Args:
+        samples (iterator): Unique samples, e.g. from `iter_unique_samples` or `iter_parallel_unique`,
+            so uniqueness holds across all shards.
+        data_type (str): The type of data, used to name the shards.
+        number_of_generated_sample (int): The total number of entries to write.
+        output_dir (str): The directory where the shards are written.
+        shard_size (int): The number of entries per shard.
+        compression (str): None for plain text, or one of `COMPRESSION_EXTENSIONS`.
+        extension (str): The file extension of each shard, including any compression extension.
+
+    Returns:
+        dict: The manifest.
+    """
+
+    if shard_size < 1:
+        raise ValueError("Shard size must be positive")
+    os.makedirs(output_dir, exist_ok=True)
+
+    shards = []
+    writers = []
+    try:
+        for shard_index, chunk in enumerate(
+            iter_chunks(samples, number_of_generated_sample, shard_size)
+        ):
+            # Wait for the oldest shard once too many are still being written
+            if len(writers) >= SHARD_MAX_OPEN_WRITERS:
+                writers.pop(0).close()
+
+            file_name = shard_file_name(data_type, shard_index, extension)
+            writer = BackgroundWriter(os.path.join(output_dir, file_name), compression)
+            writers.append(writer)
+            writer.write(chunk)
+            shards.append({"file": file_name, "rows": len(chunk)})
+    finally:
+        for writer in writers:
+            writer.close()
+
+    for shard in shards:
+        shard["bytes"] = os.path.getsize(os.path.join(output_dir, shard["file"]))
+
+    manifest = {
+        "type": data_type,
+        "shard_size": shard_size,
+        "rows": sum(shard["rows"] for shard in shards),
+        "bytes": sum(shard["bytes"] for shard in shards),
+        "shards": shards,
+    }
+    with open(os.path.join(output_dir, f"{data_type}-manifest.json"), "w") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    return manifest
@@ -0,0 +1,414 @@
+import bisect
+import itertools
+import platform
+import struct
+import time
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+from .stream import build_sampler
+
+# Ring layout: a header, then `slot_count` slots of `slot_size` bytes each
+RING_MAGIC = b"RDGR"
+RING_VERSION = 1
+RING_HEADER = struct.Struct("<4sHHII")
+
+# Counters live on their own cache lines, each written by a single side:
+# the producer owns `head` and `closed`, the consumer owns `tail`
+RING_CLOSED_OFFSET = 16
+RING_HEAD_OFFSET = 64
+RING_TAIL_OFFSET = 128
+RING_SLOTS_OFFSET = 192
+
+# Slot layout: a row count, `count + 1` byte offsets, then the packed UTF-8 rows
+SLOT_COUNT = struct.Struct("<I")
+
+# Default number of slots and size of a slot in bytes
+RING_SLOT_COUNT = 64
+RING_SLOT_SIZE = 1 << 20
+
+# Number of samples the producer generates at a time
+RING_BATCH_SIZE = 4096
+
+# Seconds to sleep while the ring is full (producer) or empty (consumer)
+RING_POLL_INTERVAL = 0.0005
+
+# Seconds the producer waits for a consumer to make progress before giving up on it
+RING_TIMEOUT = 60
+
+# CPUs whose total store order makes slot writes visible before the head that publishes them
+TOTAL_STORE_ORDER_MACHINES = {"x86_64", "amd64", "i386", "i686", "x86"}
+
+
+def _open_shared_memory(name):
+    try:
+        # The creator is responsible for unlinking, not the processes that attach
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        memory = shared_memory.SharedMemory(name)
+        resource_tracker.unregister(memory._name, "shared_memory")
+        return memory
+
+
+class SharedRing:
+    """
+    Single-producer, single-consumer ring buffer of row batches in shared memory.
+
+    Each slot holds one batch as a row count, byte offsets and packed UTF-8 rows, so a consumer can
+    read a batch in place without any serialization. The producer and the consumer each advance
+    their own counter, and a side that finds the ring full or empty polls.
+
+    Without a lock, a slot is published by a plain store of the head counter, which is only safe
+    on x86 CPUs, whose total store order keeps the slot content visible before the new head. On
+    weakly ordered CPUs (e.g. ARM), both sides must share a `multiprocessing.Lock`, whose
+    operations synchronize memory between processes.
+
+    Example:
+        ring = SharedRing.create("random-data-0")      # producer
+        ring = SharedRing.attach("random-data-0")      # consumer process
+        for row in ring: ...
+    """
+
+    def __init__(self, memory, owner, lock=None):
+        if (
+            lock is None
+            and platform.machine().lower() not in TOTAL_STORE_ORDER_MACHINES
+        ):
+            memory.close()
+            raise ValueError(
+                f"A lock is required to share a ring on {platform.machine()} CPUs"
+            )
+
+        self._memory = memory
+        self._owner = owner
+        self._lock = lock
+        self._buffer = memory.buf
+        magic, version, _, self.slot_count, self.slot_size = RING_HEADER.unpack_from(
+            self._buffer
+        )
+        if magic != RING_MAGIC or version != RING_VERSION:
+            raise ValueError(f"Not a ring buffer: {memory.name}")
+        self._counters = self._buffer[:RING_SLOTS_OFFSET].cast("Q")
+        self.name = memory.name
+
+    @classmethod
+    def create(
+        cls, name=None, slot_count=RING_SLOT_COUNT, slot_size=RING_SLOT_SIZE, lock=None
+    ):
+        """
+        Creates a ring buffer in a new shared memory block.
+
+        Args:
+            name (str): The name of the shared memory block, or None for a random name.
+            slot_count (int): The number of slots.
+            slot_size (int): The size of a slot in bytes, bounding the size of a batch.
+            lock (multiprocessing.Lock): A lock shared with the consumer, required on weakly ordered CPUs.
+
+        Returns:
+            SharedRing: The ring, owned by the caller, who must `unlink` it.
+        """
+
+        if slot_count < 1 or slot_size < 3 * SLOT_COUNT.size:
+            raise ValueError("Ring slots must hold at least one row")
+        memory = shared_memory.SharedMemory(
+            name, create=True, size=RING_SLOTS_OFFSET + slot_count * slot_size
+        )
+        memory.buf[:RING_SLOTS_OFFSET] = bytes(RING_SLOTS_OFFSET)
+        RING_HEADER.pack_into(
+            memory.buf, 0, RING_MAGIC, RING_VERSION, 0, slot_count, slot_size
+        )
+        try:
+            return cls(memory, owner=True, lock=lock)
+        except ValueError:
+            memory.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, name, lock=None):
+        """
+        Attaches to a ring buffer created by another process.
+
+        Args:
+            name (str): The name of the shared memory block.
+            lock (multiprocessing.Lock): The lock given to `create`, if any.
+
+        Returns:
+            SharedRing: The ring.
+
+        Raises:
+            ValueError: If the shared memory block is not a ring buffer.
+        """
+
+        return cls(_open_shared_memory(name), owner=False, lock=lock)
+
+    def _load(self, offset):
+        if self._lock is None:
+            return self._counters[offset // 8]
+        with self._lock:
+            return self._counters[offset // 8]
+
+    def _store(self, offset, value):
+        if self._lock is None:
+            self._counters[offset // 8] = value
+        else:
+            with self._lock:
+                self._counters[offset // 8] = value
+
+    @property
+    def closed(self):
+        """
+        Whether the producer will not put any more batches.
+        """
+
+        return bool(self._load(RING_CLOSED_OFFSET))
+
+    def __len__(self):
+        """
+        Returns the number of batches waiting to be read.
+        """
+
+        return self._load(RING_HEAD_OFFSET) - self._load(RING_TAIL_OFFSET)
+
+    def _slot(self, index):
+        start = RING_SLOTS_OFFSET + (index % self.slot_count) * self.slot_size
+        return self._buffer[start : start + self.slot_size]
+
+    def try_put(self, encoded_rows):
+        """
+        Packs as many leading rows as fit into the next free slot, without waiting.
+
+        Args:
+            encoded_rows (list): The UTF-8 encoded rows.
+
+        Returns:
+            int: The number of rows put, 0 if the ring is full.
+
+        Raises:
+            ValueError: If the first row does not fit in a slot.
+        """
+
+        head = self._load(RING_HEAD_OFFSET)
+        if head - self._load(RING_TAIL_OFFSET) >= self.slot_count:
+            return 0
+
+        # k rows take 4 bytes of count, 4 * (k + 1) bytes of offsets and the rows themselves
+        ends = list(itertools.accumulate(len(row) for row in encoded_rows))
+        sizes = [end + SLOT_COUNT.size * index for index, end in enumerate(ends, 2)]
+        row_count = bisect.bisect_right(sizes, self.slot_size - SLOT_COUNT.size)
+        if not row_count and encoded_rows:
+            raise ValueError("Row does not fit in a ring slot")
+
+        offsets = array("I", [0])
+        offsets.extend(ends[:row_count])
+        blob = b"".join(encoded_rows[:row_count])
+        slot = self._slot(head)
+        SLOT_COUNT.pack_into(slot, 0, row_count)
+        blob_start = SLOT_COUNT.size * (row_count + 2)
+        slot[SLOT_COUNT.size : blob_start] = offsets.tobytes()
+        slot[blob_start : blob_start + len(blob)] = blob
+        slot.release()
+
+        # Publish the slot only once its content is written
+        self._store(RING_HEAD_OFFSET, head + 1)
+        return row_count
+
+    def put(self, rows, timeout=RING_TIMEOUT):
+        """
+        Puts rows into the ring, waiting while it is full.
+
+        Args:
+            rows (list): The rows to put, spread over as many slots as needed.
+            timeout (float): Seconds to wait for a free slot before giving up.
+
+        Raises:
+            TimeoutError: If the consumer did not free a slot in time.
+        """
+
+        encoded_rows = [row.encode("utf-8") for row in rows]
+        deadline = time.monotonic() + timeout
+        while encoded_rows:
+            row_count = self.try_put(encoded_rows)
+            if row_count:
+                del encoded_rows[:row_count]
+                deadline = time.monotonic() + timeout
+            elif time.monotonic() > deadline:
+                raise TimeoutError(f"Consumer of ring {self.name} stopped reading")
+            else:
+                time.sleep(RING_POLL_INTERVAL)
+
+    def get_batch(self):
+        """
+        Waits for the next batch and returns it in place, without copying.
+
+        The returned views stay valid until `release_batch` is called.
+
+        Returns:
+            tuple: The `(offsets, blob)` views, where row `i` is `blob[offsets[i]:offsets[i + 1]]`,
+                or None once the ring is closed and empty.
+        """
+
+        tail = self._load(RING_TAIL_OFFSET)
+        while self._load(RING_HEAD_OFFSET) == tail:
+            if self.closed:
+                # The producer may have put a last batch before closing
+                if self._load(RING_HEAD_OFFSET) == tail:
+                    return None
+                break
+            time.sleep(RING_POLL_INTERVAL)
+
+        slot = self._slot(tail)
+        (row_count,) = SLOT_COUNT.unpack_from(slot)
+        blob_start = SLOT_COUNT.size * (row_count + 2)
+        offsets = slot[SLOT_COUNT.size : blob_start].cast("I")
+        return offsets, slot[blob_start : blob_start + offsets[row_count]]
+
+    def release_batch(self):
+        """
+        Hands the slot of the batch returned by `get_batch` back to the producer.
+        """
+
+        self._store(RING_TAIL_OFFSET, self._load(RING_TAIL_OFFSET) + 1)
+
+    def get_rows(self):
+        """
+        Waits for the next batch and decodes its rows.
+
+        Returns:
+            list: The rows, or None once the ring is closed and empty.
+        """
+
+        batch = self.get_batch()
+        if batch is None:
+            return None
+        offsets, blob = batch
+        content = bytes(blob)
+        rows = [
+            content[start:end].decode("utf-8")
+            for start, end in zip(offsets, offsets[1:])
+        ]
+        offsets.release()
+        blob.release()
+        self.release_batch()
+        return rows
+
+    def __iter__(self):
+        """
+        Yields the rows of every batch until the ring is closed and empty.
+        """
+
+        for rows in iter(self.get_rows, None):
+            yield from rows
+
+    def close_writing(self):
+        """
+        Tells the consumer that no more batches will be put.
+        """
+
+        self._store(RING_CLOSED_OFFSET, 1)
+
+    def wait_drained(self, timeout=RING_TIMEOUT):
+        """
+        Waits until the consumer has read every batch.
+
+        Args:
+            timeout (float): Seconds to wait for the consumer to read a batch before giving up.
+
+        Raises:
+            TimeoutError: If the consumer stopped reading before the ring was empty.
+        """
+
+        tail = self._load(RING_TAIL_OFFSET)
+        deadline = time.monotonic() + timeout
+        while len(self):
+            if self._load(RING_TAIL_OFFSET) != tail:
+                tail = self._load(RING_TAIL_OFFSET)
+                deadline = time.monotonic() + timeout
+            elif time.monotonic() > deadline:
+                raise TimeoutError(f"Consumer of ring {self.name} stopped reading")
+            time.sleep(RING_POLL_INTERVAL)
+
+    def close(self):
+        """
+        Detaches from the shared memory block.
+        """
+
+        self._counters.release()
+        self._buffer = None
+        self._memory.close()
+
+    def unlink(self):
+        """
+        Destroys the shared memory block, once every process has detached.
+        """
+
+        # Consumers sharing our resource tracker may have dropped the block from it when attaching
+        resource_tracker.register(self._memory._name, "shared_memory")
+        self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        if self._owner:
+            self.unlink()
+
+
+def produce(
+    data_type,
+    rings,
+    number_of_generated_sample=None,
+    batch_size=RING_BATCH_SIZE,
+    timeout=RING_TIMEOUT,
+):
+    """
+    Generates samples of a type into rings read by co-located consumer processes.
+
+    Batches are put into whichever ring has a free slot, so a slow consumer does not hold back the
+    others. Once done, every ring is closed for writing and drained.
+
+    Args:
+        data_type (str): The type of data to generate.
+        rings (list): The rings to fill, one per consumer.
+        number_of_generated_sample (int): The total number of samples, or None to run until interrupted.
+        batch_size (int): The number of samples generated at a time.
+        timeout (float): Seconds to wait for any consumer to make progress before giving up.
+
+    Returns:
+        int: The number of samples put.
+
+    Raises:
+        TimeoutError: If the consumers stopped reading, e.g. because they died.
+    """
+
+    sampler = build_sampler(data_type)
+    rows_put = 0
+    pending = []
+    ring_cycle = itertools.cycle(rings)
+    deadline = time.monotonic() + timeout
+    try:
+        while (
+            number_of_generated_sample is None or rows_put < number_of_generated_sample
+        ):
+            if not pending:
+                size = batch_size
+                if number_of_generated_sample is not None:
+                    size = min(size, number_of_generated_sample - rows_put)
+                pending = [sampler().encode("utf-8") for _ in range(size)]
+
+            for _ in rings:
+                row_count = next(ring_cycle).try_put(pending)
+                if row_count:
+                    del pending[:row_count]
+                    rows_put += row_count
+                    deadline = time.monotonic() + timeout
+                    break
+            else:
+                if time.monotonic() > deadline:
+                    raise TimeoutError("Every ring consumer stopped reading")
+                time.sleep(RING_POLL_INTERVAL)
+    finally:
+        for ring in rings:
+            ring.close_writing()
+    for ring in rings:
+        ring.wait_drained(timeout)
+    return rows_put
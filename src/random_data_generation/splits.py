@@ -0,0 +1,167 @@
+import os
+import random
+from .writer import BackgroundWriter
+
+# Names of the splits, in the order their ratios are given
+SPLIT_NAMES = ("train", "val", "test")
+
+# Number of entries buffered per split before they are handed to its writer
+SPLIT_CHUNK_SIZE = 65536
+
+
+def parse_splits(value):
+    """
+    Parses a split specification such as "0.9,0.05,0.05".
+
+    Args:
+        value (str): Comma-separated ratios of the train, validation and (optionally) test splits.
+
+    Returns:
+        list: The ratios, in the order of `SPLIT_NAMES`.
+
+    Raises:
+        ValueError: If the specification is malformed or the ratios do not add up to 1.
+    """
+
+    ratios = [float(item) for item in value.split(",") if item.strip()]
+    if not 2 <= len(ratios) <= len(SPLIT_NAMES):
+        raise ValueError(f"Splits must have 2 or 3 ratios: {value}")
+    if any(ratio < 0 for ratio in ratios):
+        raise ValueError(f"Split ratios must be non-negative: {value}")
+    if abs(sum(ratios) - 1) > 1e-6:
+        raise ValueError(f"Split ratios must add up to 1: {value}")
+    return ratios
+
+
+def split_sizes(number_of_generated_sample, ratios):
+    """
+    Divides a number of samples between splits according to their ratios.
+
+    Sizes are rounded down, and the leftover samples go to the splits with the largest remainders,
+    so the sizes add up to `number_of_generated_sample`.
+
+    Args:
+        number_of_generated_sample (int): The total number of samples.
+        ratios (list): The ratio of each split.
+
+    Returns:
+        list: The number of samples in each split.
+    """
+
+    exact = [number_of_generated_sample * ratio for ratio in ratios]
+    sizes = [int(size) for size in exact]
+    by_remainder = sorted(
+        range(len(ratios)), key=lambda index: sizes[index] - exact[index]
+    )
+    for index in by_remainder[: number_of_generated_sample - sum(sizes)]:
+        sizes[index] += 1
+    return sizes
+
+
+def iter_splits(samples, sizes):
+    """
+    Lazily assigns each sample of a stream to a split, filling every split to its exact size.
+
+    Each sample goes to a split chosen at random with probability proportional to the room left
+    in the split, so the assignment is a uniformly random partition of the stream. Given unique
+    samples, the splits are disjoint.
+
+    Args:
+        samples (iterator): Unique samples, e.g. from `iter_unique_samples`.
+        sizes (list): The number of samples in each split.
+
+    Yields:
+        tuple: The `(split_index, sample)` pairs, until every split is full or `samples` is exhausted.
+    """
+
+    remaining = list(sizes)
+    total = sum(remaining)
+    rand = random.random
+    for sample in samples:
+        if not total:
+            return
+        position = int(rand() * total)
+        split_index = 0
+        while position >= remaining[split_index]:
+            position -= remaining[split_index]
+            split_index += 1
+        remaining[split_index] -= 1
+        total -= 1
+        yield split_index, sample
+
+
+def split_file_name(data_type, split_index, extension="txt"):
+    """
+    Builds the file name of a split, e.g. "currency.train.txt".
+
+    Args:
+        data_type (str): The type of data in the split.
+        split_index (int): The index of the split in `SPLIT_NAMES`.
+        extension (str): The file extension.
+
+    Returns:
+        str: The split file name.
+    """
+
+    return f"{data_type}.{SPLIT_NAMES[split_index]}.{extension}"
+
+
+def write_splits(
+    samples,
+    data_type,
+    number_of_generated_sample,
+    output_dir,
+    ratios,
+    compression=None,
+    extension="txt",
+    chunk_size=SPLIT_CHUNK_SIZE,
+):
+    """
+    Writes unique samples to disjoint train/validation/test files in a single pass.
+
+    Samples are assigned to splits as they stream out of `samples`, and every split file is written
+    by its own background writer thread, so nothing is materialized beyond one chunk per split.
+
+    Args:
+        samples (iterator): Unique samples, e.g. from `iter_unique_samples` or `iter_parallel_unique`.
+        data_type (str): The type of data, used to name the split files.
+        number_of_generated_sample (int): The total number of entries across all splits.
+        output_dir (str): The directory where the split files are written.
+        ratios (list): The ratio of each split, in the order of `SPLIT_NAMES`.
+        compression (str): None for plain text, or one of `COMPRESSION_EXTENSIONS`.
+        extension (str): The file extension of each split, including any compression extension.
+        chunk_size (int): The number of entries buffered per split before being written.
+
+    Returns:
+        dict: The number of entries written to each split file, keyed by file name.
+    """
+
+    os.makedirs(output_dir, exist_ok=True)
+    sizes = split_sizes(number_of_generated_sample, ratios)
+    file_names = [
+        split_file_name(data_type, split_index, extension)
+        for split_index in range(len(sizes))
+    ]
+
+    writers = []
+    try:
+        for file_name in file_names:
+            writers.append(
+                BackgroundWriter(os.path.join(output_dir, file_name), compression)
+            )
+        chunks = [[] for _ in sizes]
+        for split_index, sample in iter_splits(samples, sizes):
+            chunk = chunks[split_index]
+            chunk.append(sample)
+            if len(chunk) >= chunk_size:
+                writers[split_index].write(chunk)
+                chunks[split_index] = []
+        for writer, chunk in zip(writers, chunks):
+            writer.write(chunk)
+    finally:
+        for writer in writers:
+            writer.close()
+
+    return {
+        file_name: writer.rows_written for file_name, writer in zip(file_names, writers)
+    }
@@ -0,0 +1,321 @@
+import collections
+import functools
+import itertools
+import random
+from .registry import load_generator
+from .splits import split_sizes
+
+# Largest number of samples drawn at a time for a stratum, which bounds the samples buffered per stratum
+STRATUM_BATCH_SIZE = 1024
+
+# Number of consecutive batches without a new sample after which a stratum counts as exhausted
+STRATUM_MAX_STALE_BATCHES = 64
+
+# A combination of options, its probability under the weights, and the number of samples allocated to it
+Stratum = collections.namedtuple("Stratum", ["options", "probability", "quota"])
+
+
+def get_strata_fields(data_type):
+    """
+    Lists the options of a data type that quotas can be allocated to.
+
+    Args:
+        data_type (str): The type of data (e.g., "date").
+
+    Returns:
+        list: The option names, such as "format" or "use_thai_numeral".
+
+    Raises:
+        ValueError: If the data type is unknown or cannot be stratified.
+    """
+
+    strata = load_generator(data_type).strata
+    if strata is None:
+        raise ValueError(f"Data type cannot be stratified: {data_type}")
+    return list(strata)
+
+
+def allocate_quotas(probabilities, number_of_generated_sample, min_count=1):
+    """
+    Allocates an exact number of samples to each stratum from its probability.
+
+    Every stratum first gets `min_count` samples, so rare combinations are always covered, and the rest
+    is divided in proportion to the probabilities, with the leftover samples going to the strata with
+    the largest remainders. The quotas add up to `number_of_generated_sample`.
+
+    Args:
+        probabilities (list): The probability of each stratum, adding up to 1.
+        number_of_generated_sample (int): The total number of samples.
+        min_count (int): The smallest number of samples in a stratum.
+
+    Returns:
+        list: The number of samples allocated to each stratum.
+
+    Raises:
+        ValueError: If there are too few samples to give every stratum `min_count` of them.
+    """
+
+    remaining = number_of_generated_sample - min_count * len(probabilities)
+    if remaining < 0:
+        raise ValueError(
+            f"{number_of_generated_sample} samples cannot cover {len(probabilities)} strata "
+            f"with {min_count} samples each"
+        )
+    return [min_count + size for size in split_sizes(remaining, probabilities)]
+
+
+def get_option_probabilities(data_type, fields=None):
+    """
+    Computes the probability of each value of the stratifiable options of a data type.
+
+    Args:
+        data_type (str): The type of data (e.g., "date").
+        fields (list): The options, or None for every option of `get_strata_fields`.
+
+    Returns:
+        dict: The probability of each value of each option under the weights of the active profile, with the
+            values in the order of their weighted list.
+
+    Raises:
+        ValueError: If the data type cannot be stratified or an option is unknown.
+    """
+
+    strata_fields = get_strata_fields(data_type)
+    fields = strata_fields if fields is None else list(fields)
+    for field in fields:
+        if field not in strata_fields:
+            raise ValueError(f"Unknown option of {data_type}: {field}")
+
+    positions = load_generator(data_type).strata
+    args = load_generator(data_type).build_sampler().args
+
+    option_probabilities = {}
+    for field in fields:
+        weighted_list = args[positions[field]]
+        counts = collections.Counter(weighted_list)
+        option_probabilities[field] = {
+            value: counts[value] / len(weighted_list)
+            for value in dict.fromkeys(weighted_list)
+        }
+    return option_probabilities
+
+
+def plan_strata(data_type, number_of_generated_sample, fields=None, min_count=1):
+    """
+    Splits the samples of a data type into strata, one per combination of the given options.
+
+    The probability of a combination is the product of the weights of its options in the active profile,
+    so combinations with a zero weight are left out.
+
+    Args:
+        data_type (str): The type of data (e.g., "date").
+        number_of_generated_sample (int): The total number of samples.
+        fields (list): The options to stratify on, or None for every option of `get_strata_fields`.
+        min_count (int): The smallest number of samples in a stratum.
+
+    Returns:
+        list: The `Stratum` of each combination, in the order of the weighted lists.
+
+    Raises:
+        ValueError: If the data type cannot be stratified, an option is unknown, or there are too few
+            samples to cover every stratum.
+    """
+
+    option_probabilities = get_option_probabilities(data_type, fields)
+    fields = list(option_probabilities)
+
+    combinations = list(
+        itertools.product(
+            *[list(values.items()) for values in option_probabilities.values()]
+        )
+    )
+    probabilities = [
+        functools.reduce(lambda product, item: product * item[1], combination, 1.0)
+        for combination in combinations
+    ]
+    quotas = allocate_quotas(probabilities, number_of_generated_sample, min_count)
+
+    return [
+        Stratum(
+            dict(zip(fields, (value for value, _ in combination))), probability, quota
+        )
+        for combination, probability, quota in zip(combinations, probabilities, quotas)
+    ]
+
+
+def iter_interleaved(quotas):
+    """
+    Lazily interleaves strata by their quotas, as a uniformly random sequence of stratum indices.
+
+    Each index is chosen with probability proportional to the remaining quota of its stratum, as
+    `splits.iter_splits` assigns samples to splits, until every quota is used up. The remaining quotas
+    are kept in a Fenwick tree, so each choice takes O(log k) steps for k strata instead of a scan.
+
+    Args:
+        quotas (list): The number of samples of each stratum.
+
+    Yields:
+        int: The index of the stratum the next sample is taken from.
+    """
+
+    size = len(quotas)
+    tree = [0] * (size + 1)
+    for index, quota in enumerate(quotas, 1):
+        tree[index] += quota
+        parent = index + (index & -index)
+        if parent <= size:
+            tree[parent] += tree[index]
+    top = 1 << (size.bit_length() - 1) if size else 0
+
+    total = sum(quotas)
+    rand = random.random
+    while total:
+        # Descend to the stratum holding the chosen position among the remaining samples
+        position = int(rand() * total)
+        index = 0
+        step = top
+        while step:
+            child = index + step
+            if child <= size and tree[child] <= position:
+                index = child
+                position -= tree[child]
+            step >>= 1
+        child = index + 1
+        while child <= size:
+            tree[child] -= 1
+            child += child & -child
+        total -= 1
+        yield index
+
+
+def _fill_stratum(batch_sampler, buffer, pending, seen, records, batch_size):
+    """
+    Draws batches for a stratum until its buffer holds at least one new sample.
+
+    Args:
+        batch_sampler (callable): The batch sampler of the stratum.
+        buffer (collections.deque): The samples of the stratum waiting to be yielded.
+        pending (int): The number of samples of the stratum not drawn yet.
+        seen (set): The samples drawn for any stratum so far, updated with the new ones.
+        records (bool): Whether the sampler returns records instead of strings.
+        batch_size (int): The largest number of samples drawn at a time.
+
+    Returns:
+        int: The number of samples of the stratum still not drawn. The buffer stays empty if
+            `STRATUM_MAX_STALE_BATCHES` batches in a row held no new sample.
+    """
+
+    seen_add = seen.add
+    for _ in range(STRATUM_MAX_STALE_BATCHES):
+        for sample in batch_sampler(min(pending, batch_size)):
+            key = sample["text"] if records else sample
+            if key in seen:
+                continue
+            seen_add(key)
+            buffer.append(sample)
+            pending -= 1
+            if pending == 0:
+                break
+        if buffer:
+            break
+    return pending
+
+
+def iter_stratified(
+    data_type,
+    number_of_generated_sample,
+    fields=None,
+    min_count=1,
+    records=False,
+    batch_size=STRATUM_BATCH_SIZE,
+):
+    """
+    Lazily generates unique samples of a data type with an exact quota for every combination of options.
+
+    Each stratum is filled by the batch function of the data type with the weighted list of every
+    stratified option replaced by the option of the stratum, so the other options and values keep their
+    weights. The strata are interleaved as the samples are yielded: each sample is taken from a stratum
+    chosen at random with probability proportional to its remaining quota (see `iter_interleaved`),
+    so the order is a uniformly random interleaving and every stratum ends at its exact quota. Only one
+    batch per stratum is buffered, never the whole output.
+
+    Args:
+        data_type (str): The type of data (e.g., "date").
+        number_of_generated_sample (int): The total number of samples.
+        fields (list): The options to stratify on, or None for every option of `get_strata_fields`.
+        min_count (int): The smallest number of samples in a stratum.
+        records (bool): Whether to generate records (see `records.iter_unique_records`) instead of strings.
+        batch_size (int): The largest number of samples drawn for a stratum at a time.
+
+    Yields:
+        The samples or records, in random order.
+
+    Raises:
+        ValueError: If the strata cannot be planned, or a stratum runs out of unique samples. The
+            strata are planned before the first sample is yielded, but a stratum may only run out
+            once part of the output has been yielded.
+    """
+
+    strata = plan_strata(data_type, number_of_generated_sample, fields, min_count)
+
+    generator = load_generator(data_type)
+    build_batch_sampler = (
+        generator.build_record_sampler if records else generator.build_batch_sampler
+    )
+    batch_function = build_batch_sampler().func
+    positions = generator.strata
+    args = generator.build_sampler().args
+
+    batch_samplers = []
+    for stratum in strata:
+        stratum_args = list(args)
+        for field, value in stratum.options.items():
+            stratum_args[positions[field]] = [value]
+        batch_samplers.append(functools.partial(batch_function, *stratum_args))
+
+    buffers = [collections.deque() for _ in strata]
+    pending = [stratum.quota for stratum in strata]
+    seen = set()
+    for index in iter_interleaved(pending.copy()):
+        buffer = buffers[index]
+        if not buffer:
+            pending[index] = _fill_stratum(
+                batch_samplers[index],
+                buffer,
+                pending[index],
+                seen,
+                records,
+                batch_size,
+            )
+            if not buffer:
+                raise ValueError(
+                    f"Stratum {strata[index].options} of {data_type} ran out of unique samples"
+                )
+        yield buffer.popleft()
+
+
+def generate_stratified(
+    data_type, number_of_generated_sample, fields=None, min_count=1, records=False
+):
+    """
+    Generates unique samples of a data type with an exact quota for every combination of options.
+
+    Args:
+        data_type (str): The type of data (e.g., "date").
+        number_of_generated_sample (int): The total number of samples.
+        fields (list): The options to stratify on, or None for every option of `get_strata_fields`.
+        min_count (int): The smallest number of samples in a stratum.
+        records (bool): Whether to generate records (see `records.iter_unique_records`) instead of strings.
+
+    Returns:
+        list: The samples or records of `iter_stratified`, in random order.
+
+    Raises:
+        ValueError: If the strata cannot be planned, or a stratum runs out of unique samples.
+    """
+
+    return list(
+        iter_stratified(
+            data_type, number_of_generated_sample, fields, min_count, records
+        )
+    )
@@ -0,0 +1,83 @@
+import itertools
+from .partition import partition_sampler
+from .registry import load_generator
+
+
+def iter_unique(sampler, seen=None):
+    """
+    Lazily yields unique samples from a sampler, in generation order.
+
+    Args:
+        sampler (callable): A function taking no arguments that returns a sample.
+        seen (set): Samples that must not be yielded, updated as new samples are yielded.
+
+    Yields:
+        str: A sample that has not been yielded before.
+    """
+
+    if seen is None:
+        seen = set()
+    seen_add = seen.add
+    for sample in iter(sampler, None):
+        if sample not in seen:
+            seen_add(sample)
+            yield sample
+
+
+def build_sampler(data_type, partition=None):
+    """
+    Builds the sampler of a data type, optionally restricted to a hash partition.
+
+    Args:
+        data_type (str): The type of data to generate (e.g., "currency").
+        partition (tuple): A `(partition_index, partition_count)` pair, or None for every sample.
+
+    Returns:
+        callable: A function taking no arguments that returns a sample.
+
+    Raises:
+        ValueError: If the data type is unknown.
+    """
+
+    sampler = load_generator(data_type).build_sampler()
+    if partition is not None:
+        sampler = partition_sampler(sampler, *partition)
+    return sampler
+
+
+def iter_unique_samples(data_type, seen=None, partition=None):
+    """
+    Lazily yields unique samples of a data type, in generation order.
+
+    Args:
+        data_type (str): The type of data to generate (e.g., "currency").
+        seen (set): Samples that must not be yielded, updated as new samples are yielded.
+        partition (tuple): A `(partition_index, partition_count)` pair, or None for every sample.
+
+    Yields:
+        str: A sample that has not been yielded before.
+    """
+
+    return iter_unique(build_sampler(data_type, partition), seen)
+
+
+def iter_chunks(samples, number_of_generated_sample, chunk_size):
+    """
+    Takes a number of samples from an iterator and groups them into lists.
+
+    Args:
+        samples (iterator): The samples to group.
+        number_of_generated_sample (int): The total number of samples to take.
+        chunk_size (int): The maximum number of samples in each list.
+
+    Yields:
+        list: The next chunk of at most `chunk_size` samples.
+    """
+
+    remaining = number_of_generated_sample
+    while remaining > 0:
+        chunk = list(itertools.islice(samples, min(chunk_size, remaining)))
+        if not chunk:
+            return
+        remaining -= len(chunk)
+        yield chunk
@@ -0,0 +1,156 @@
+import os
+
+# hashlib, json, mmap, pickle and tempfile are imported on first use, as every generator imports
+# this module and processes without a cache should not pay for them at start-up
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, array tables are then never cached
+    np = None
+
+# Environment variable naming the directory of cached tables, so worker processes inherit it
+TABLE_CACHE_ENV = "RANDOM_DATA_TABLE_CACHE"
+
+# Version of the cached table layouts, bumped whenever a table changes shape so stale files are ignored
+TABLE_CACHE_VERSION = 1
+
+
+def get_cache_dir():
+    """
+    Returns the directory of cached tables.
+
+    Returns:
+        str: The directory named by the `RANDOM_DATA_TABLE_CACHE` environment variable, or None when
+        tables are only built in memory.
+    """
+
+    return os.environ.get(TABLE_CACHE_ENV) or None
+
+
+def set_cache_dir(cache_dir):
+    """
+    Sets the directory of cached tables for this process and the worker processes it starts.
+
+    Args:
+        cache_dir (str): The directory, created if needed, or None to stop caching.
+    """
+
+    if cache_dir is None:
+        os.environ.pop(TABLE_CACHE_ENV, None)
+    else:
+        os.makedirs(cache_dir, exist_ok=True)
+        os.environ[TABLE_CACHE_ENV] = os.path.abspath(cache_dir)
+
+
+def table_path(cache_dir, name, sources, extension):
+    """
+    Builds the path of a cached table, keyed by a hash of the values the table is built from.
+
+    Args:
+        cache_dir (str): The directory of cached tables.
+        name (str): The name of the table.
+        sources: JSON-serializable values the table is built from, such as constants.
+        extension (str): The file extension.
+
+    Returns:
+        str: The path of the cached table.
+    """
+
+    import hashlib
+    import json
+
+    key = json.dumps([TABLE_CACHE_VERSION, name, sources], ensure_ascii=False)
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(cache_dir, f"{name}-{digest}.{extension}")
+
+
+def _write_atomic(path, write):
+    """
+    Writes a file through a temporary file in the same directory, so readers never see a partial table.
+
+    A table that cannot be written, e.g. to a read-only cache, is simply rebuilt by the next process.
+
+    Args:
+        path (str): The path of the file.
+        write (callable): A function writing the content to a binary file object.
+    """
+
+    import tempfile
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_object_table(name, sources, build):
+    """
+    Loads a table of Python objects from the cache, building and caching it on a miss.
+
+    Args:
+        name (str): The name of the table.
+        sources: JSON-serializable values the table is built from.
+        build (callable): A function taking no arguments that builds the table.
+
+    Returns:
+        The table.
+    """
+
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return build()
+
+    import mmap
+    import pickle
+
+    path = table_path(cache_dir, name, sources, "pickle")
+    try:
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            return pickle.loads(mapped)
+    except (OSError, ValueError, pickle.UnpicklingError):
+        pass
+
+    table = build()
+    _write_atomic(
+        path, lambda f: pickle.dump(table, f, protocol=pickle.HIGHEST_PROTOCOL)
+    )
+    return table
+
+
+def load_array_table(name, sources, build):
+    """
+    Memory-maps a NumPy array from the cache, building and caching it on a miss.
+
+    A memory-mapped table costs no parsing, and its pages are shared by every process using the cache.
+
+    Args:
+        name (str): The name of the table.
+        sources: JSON-serializable values the table is built from.
+        build (callable): A function taking no arguments that builds the array.
+
+    Returns:
+        numpy.ndarray: The array, read-only when loaded from the cache.
+    """
+
+    cache_dir = get_cache_dir()
+    if cache_dir is None or np is None:
+        return build()
+
+    path = table_path(cache_dir, name, sources, "npy")
+    try:
+        return np.load(path, mmap_mode="r", allow_pickle=False)
+    except (OSError, ValueError):
+        pass
+
+    table = build()
+    _write_atomic(path, lambda f: np.save(f, table, allow_pickle=False))
+    return table
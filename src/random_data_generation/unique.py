@@ -0,0 +1,92 @@
+class UniqueCollector:
+    """
+    Collects unique samples in the order they are first generated.
+
+    A set is only a hash index here, answering membership, while an append-only list keeps the
+    samples in generation order. Iterating a set follows string hashes, which change with hash
+    randomization, so a seeded run collected into a set is written in a different order every time;
+    the list makes its output byte-identical instead. Batches of new samples, the common case, are
+    checked and added with a few set operations in C, so collecting is nearly as fast as with a set.
+
+    Example:
+        output = UniqueCollector()
+        while len(output) < n:
+            output.update(batch_sampler(n - len(output)))
+        samples = output.to_list()
+    """
+
+    def __init__(self):
+        """
+        Creates an empty collector.
+        """
+
+        self._index = set()
+        self._samples = []
+
+    def __len__(self):
+        return len(self._samples)
+
+    def __contains__(self, sample):
+        return sample in self._index
+
+    def __iter__(self):
+        return iter(self._samples)
+
+    def add(self, sample):
+        """
+        Collects a sample unless it has been collected before.
+
+        Args:
+            sample: The sample, which must be hashable.
+
+        Returns:
+            bool: Whether the sample was new.
+        """
+
+        if sample in self._index:
+            return False
+        self._index.add(sample)
+        self._samples.append(sample)
+        return True
+
+    def update(self, samples):
+        """
+        Collects the samples of a batch that have not been collected before, keeping their order.
+
+        Args:
+            samples (list): The samples.
+
+        Returns:
+            int: The number of new samples.
+        """
+
+        count = len(self._samples)
+        if self._index.isdisjoint(samples):
+            size = len(self._index)
+            self._index.update(samples)
+            if len(self._index) - size == len(samples):
+                self._samples.extend(samples)
+            else:
+                # The batch repeats some of its own samples, keep their first occurrences
+                self._samples.extend(dict.fromkeys(samples))
+        else:
+            index = self._index
+            index_add = index.add
+            self._samples.extend(
+                [
+                    sample
+                    for sample in samples
+                    if sample not in index and not index_add(sample)
+                ]
+            )
+        return len(self._samples) - count
+
+    def to_list(self):
+        """
+        Returns the collected samples.
+
+        Returns:
+            list: The samples, in the order they were first collected.
+        """
+
+        return list(self._samples)
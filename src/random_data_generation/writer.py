@@ -0,0 +1,153 @@
+import bz2
+import gzip
+import lzma
+import os
+import queue
+import threading
+
+# Standard-library codecs for compressed output, mapped to their file extension
+COMPRESSION_EXTENSIONS = {
+    "gzip": "gz",
+    "xz": "xz",
+    "bz2": "bz2",
+}
+
+# Number of chunks the producer may queue ahead of the writer thread
+WRITER_MAX_QUEUED_CHUNKS = 8
+
+# Size of the buffer in front of the output file
+WRITER_BUFFER_SIZE = 1 << 20
+
+
+def open_output(
+    file_path, compression=None, buffer_size=WRITER_BUFFER_SIZE, append=False
+):
+    """
+    Opens a binary output file, optionally through a standard-library compression codec.
+
+    Args:
+        file_path (str): The path to the file to open for writing.
+        compression (str): None for plain output, or one of `COMPRESSION_EXTENSIONS`.
+        buffer_size (int): The size of the write buffer in bytes.
+        append (bool): Whether to append to an existing file instead of truncating it.
+
+    Returns:
+        file: A writable binary file object.
+    """
+
+    mode = "ab" if append else "wb"
+    if compression is None:
+        return open(file_path, mode, buffering=buffer_size)
+    if compression == "gzip":
+        # A zero timestamp in the header keeps seeded runs byte-identical
+        return gzip.GzipFile(file_path, mode, compresslevel=6, mtime=0)
+    if compression == "xz":
+        return lzma.open(file_path, mode)
+    if compression == "bz2":
+        return bz2.open(file_path, mode)
+    raise ValueError(f"Unknown compression: {compression}")
+
+
+class BackgroundWriter:
+    """
+    Writes chunks of rows to a file from a background thread.
+
+    Chunks are handed over through a bounded queue, so encoding, compression and disk writes overlap
+    with sample generation while the queue keeps memory bounded. Rows are separated by newlines,
+    producing the same content as `"\\n".join(rows)`.
+
+    Example:
+        with BackgroundWriter("date.txt.gz", compression="gzip") as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+    """
+
+    def __init__(
+        self,
+        file_path,
+        compression=None,
+        max_queued_chunks=WRITER_MAX_QUEUED_CHUNKS,
+        buffer_size=WRITER_BUFFER_SIZE,
+        append=False,
+    ):
+        """
+        Opens the output file and starts the writer thread.
+
+        Args:
+            file_path (str): The path to the file where data will be written.
+            compression (str): None for plain output, or one of `COMPRESSION_EXTENSIONS`.
+            max_queued_chunks (int): The number of chunks that may wait for the writer thread.
+            buffer_size (int): The size of the write buffer in bytes.
+            append (bool): Whether to append rows to an existing uncompressed file, starting on a new line.
+        """
+
+        # Appended rows start on a new line unless the file is empty or already ends with one
+        self._separator = b""
+        if append and compression is None and os.path.exists(file_path):
+            with open(file_path, "rb") as f:
+                if f.seek(0, os.SEEK_END):
+                    f.seek(-1, os.SEEK_END)
+                    self._separator = b"" if f.read(1) == b"\n" else b"\n"
+
+        self._file = open_output(file_path, compression, buffer_size, append)
+        self._queue = queue.Queue(maxsize=max_queued_chunks)
+        self._error = None
+        self._closed = False
+        self.rows_written = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            separator = self._separator
+            while True:
+                rows = self._queue.get()
+                if rows is None:
+                    break
+                if rows:
+                    self._file.write(separator + "\n".join(rows).encode("utf-8"))
+                    separator = b"\n"
+                    self.rows_written += len(rows)
+        except BaseException as error:
+            self._error = error
+            # Keep draining so the producer never blocks on a dead writer
+            while self._queue.get() is not None:
+                pass
+        finally:
+            self._file.close()
+
+    def write(self, rows):
+        """
+        Queues a chunk of rows, blocking while the queue is full.
+
+        Args:
+            rows (list): The rows to write.
+
+        Raises:
+            Exception: The error raised by the writer thread, if it failed.
+        """
+
+        if self._error is not None:
+            raise self._error
+        self._queue.put(rows)
+
+    def close(self):
+        """
+        Flushes the queued chunks, waits for the writer thread and closes the file.
+
+        Raises:
+            Exception: The error raised by the writer thread, if it failed.
+        """
+
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
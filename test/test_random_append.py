@@ -0,0 +1,55 @@
+# Unit tests
+import os
+import tempfile
+import unittest
+
+from random_data_generation.append import append_unique, build_line_index, line_key
+
+
+class TestAppend(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "date.txt")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_build_line_index(self):
+        with open(self.file_path, "w", encoding="utf-8") as f:
+            f.write("01/08/2024\n๑๕ มิถุนายน ๒๕๖๗\n1/8/67")
+        result = build_line_index(self.file_path)
+        self.assertEqual(
+            result,
+            {line_key("01/08/2024"), line_key("๑๕ มิถุนายน ๒๕๖๗"), line_key("1/8/67")},
+        )
+
+    def test_build_line_index_missing_file(self):
+        self.assertEqual(build_line_index(self.file_path), set())
+
+    def test_append_unique(self):
+        with open(self.file_path, "w", encoding="utf-8") as f:
+            f.write("a\nb")
+        samples = iter(["b", "c", "a", "c", "d", "e"])
+        number_written = append_unique(lambda: next(samples), 2, self.file_path)
+        self.assertEqual(number_written, 2)
+        with open(self.file_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "a\nb\nc\nd")
+
+    def test_append_unique_to_missing_file(self):
+        samples = iter(["a", "a", "b"])
+        append_unique(lambda: next(samples), 2, self.file_path)
+        with open(self.file_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "a\nb")
+
+    def test_append_unique_after_trailing_newline(self):
+        with open(self.file_path, "w", encoding="utf-8") as f:
+            f.write("a\n")
+        samples = iter(["a", "b"])
+        append_unique(lambda: next(samples), 1, self.file_path)
+        with open(self.file_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "a\nb")
+
+
+if __name__ == "__main__":
+    unittest.main()
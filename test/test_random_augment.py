@@ -0,0 +1,159 @@
+# Unit tests
+import itertools
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from random_data_generation import augment
+from random_data_generation.augment import (
+    augment_batch,
+    compile_noise,
+    iter_augmented,
+    iter_augmented_pairs,
+    iter_augmented_records,
+    parse_noise,
+)
+
+SCRIPT_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "scripts", "random_generator.py"
+)
+
+SAMPLES = ["12/03/2024", "฿1,234.56", "", "๑๒ ๓๔-๕", "Jul 26, 2525"]
+
+
+class TestAugment(unittest.TestCase):
+
+    def test_parse_noise(self):
+        self.assertEqual(
+            parse_noise("digit_confusion=0.05, space_jitter=0.5"),
+            {"digit_confusion": 0.05, "space_jitter": 0.5},
+        )
+        with self.assertRaises(ValueError):
+            parse_noise("blur=0.1")
+        with self.assertRaises(ValueError):
+            parse_noise("digit_confusion")
+
+    def test_compile_noise_invalid_probability(self):
+        with self.assertRaises(ValueError):
+            compile_noise(drop_separator=1.5)
+
+    def test_no_noise(self):
+        self.assertEqual(augment_batch(SAMPLES, compile_noise()), SAMPLES)
+
+    def test_digit_confusion(self):
+        result = augment_batch(SAMPLES, compile_noise(digit_confusion=1))
+        self.assertEqual(result[0], "๑๒/๐๓/๒๐๒๔")
+        self.assertEqual(result[3], "12 34-5")
+
+    def test_drop_separator(self):
+        result = augment_batch(SAMPLES, compile_noise(drop_separator=1))
+        self.assertEqual(result, ["12032024", "฿123456", "", "๑๒๓๔๕", "Jul262525"])
+
+    def test_space_jitter(self):
+        result = augment_batch(["ab", "๑"], compile_noise(space_jitter=1))
+        self.assertEqual(result, ["a b ", "๑ "])
+
+    def test_pure_python_path(self):
+        random.seed(0)
+        expected = augment_batch(SAMPLES, compile_noise(0.3, 0.5, 0.2))
+        with patch.object(augment, "np", None):
+            random.seed(0)
+            result = augment_batch(SAMPLES, compile_noise(0.3, 0.5, 0.2))
+        self.assertEqual(result, expected)
+
+    def test_iter_augmented_seeded(self):
+        noise = compile_noise(0.3, 0.5, 0.2)
+        first = list(
+            iter_augmented(
+                SAMPLES * 10, noise, batch_size=7, generator=random.Random(1)
+            )
+        )
+        second = list(
+            iter_augmented(
+                SAMPLES * 10, noise, batch_size=7, generator=random.Random(1)
+            )
+        )
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 50)
+
+    def test_default_generator_leaves_global_state(self):
+        random.seed(3)
+        state = random.getstate()
+        list(iter_augmented(SAMPLES, compile_noise(0.5, 0.5, 0.5)))
+        self.assertEqual(random.getstate(), state)
+
+    def test_noise_does_not_change_samples(self):
+        produced = []
+
+        def sampler():
+            produced.append(f"{random.random():.6f}")
+            return produced[-1]
+
+        runs = []
+        for noise in (compile_noise(), compile_noise(0.5, 0.5, 0.5)):
+            produced.clear()
+            random.seed(2)
+            samples = itertools.islice(iter(sampler, None), 20)
+            list(iter_augmented(samples, noise, batch_size=5))
+            runs.append(list(produced))
+        self.assertEqual(runs[0], runs[1])
+
+    def test_cli_noise_keeps_seeded_samples(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            outputs = []
+            for name, options in (
+                ("clean", []),
+                ("noisy", ["--noise", "digit_confusion=0.0"]),
+            ):
+                output_dir = os.path.join(temp_dir, name, "")
+                subprocess.run(
+                    [
+                        sys.executable,
+                        SCRIPT_PATH,
+                        "--type",
+                        "numeric",
+                        "--number",
+                        "50",
+                        "--seed",
+                        "1",
+                        "--output",
+                        output_dir,
+                        *options,
+                    ],
+                    capture_output=True,
+                    check=True,
+                )
+                with open(os.path.join(output_dir, "numeric.txt"), "rb") as f:
+                    outputs.append(f.read())
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_cli_imports_noise_lazily(self):
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", SCRIPT_PATH, "--help"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+        self.assertNotIn("random_data_generation.augment", stderr)
+        self.assertNotIn("numpy", stderr)
+
+    def test_iter_augmented_pairs(self):
+        pairs = [("date", "12/03/2024"), ("numeric", "1,234")]
+        result = list(iter_augmented_pairs(pairs, compile_noise(drop_separator=1)))
+        self.assertEqual(result, [("date", "12032024"), ("numeric", "1234")])
+
+    def test_iter_augmented_records(self):
+        records = [{"text": "1-2"}, {"text": "3 4"}]
+        result = list(iter_augmented_records(records, compile_noise(drop_separator=1)))
+        self.assertEqual(
+            result,
+            [{"text": "1-2", "noisy_text": "12"}, {"text": "3 4", "noisy_text": "34"}],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+# Unit tests
+import os
+import tempfile
+import unittest
+
+from random_data_generation.binary_format import (
+    BINARY_HEADER,
+    BinaryRowReader,
+    write_binary,
+)
+
+
+class TestBinaryFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "data.bin")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        rows = ["$ 1,234.56", "๑๕ มิถุนายน ๒๕๖๗", "", "กก 1234"]
+        write_binary(rows, self.file_path)
+        with BinaryRowReader(self.file_path) as reader:
+            self.assertEqual(len(reader), 4)
+            self.assertEqual(reader[1], "๑๕ มิถุนายน ๒๕๖๗")
+            self.assertEqual(reader[-1], "กก 1234")
+            self.assertEqual(list(reader), rows)
+
+    def test_file_layout(self):
+        write_binary(["ab", "ค"], self.file_path)
+        with open(self.file_path, "rb") as f:
+            content = f.read()
+        self.assertEqual(len(content), BINARY_HEADER.size + 3 * 8 + 2 + 3)
+        self.assertTrue(content.endswith("abค".encode("utf-8")))
+
+    def test_index_out_of_range(self):
+        write_binary(["a"], self.file_path)
+        with BinaryRowReader(self.file_path) as reader:
+            with self.assertRaises(IndexError):
+                reader[1]
+
+    def test_not_a_binary_file(self):
+        with open(self.file_path, "w") as f:
+            f.write("01/08/2024\n02/08/2024")
+        with self.assertRaises(ValueError):
+            BinaryRowReader(self.file_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
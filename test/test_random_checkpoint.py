@@ -0,0 +1,125 @@
+# Unit tests
+import os
+import random
+import tempfile
+import unittest
+
+from random_data_generation.checkpoint import (
+    count_rows,
+    fingerprint,
+    load_checkpoint,
+    save_checkpoint,
+    write_resumable,
+)
+from random_data_generation.stream import build_sampler
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "date.txt")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_fingerprint(self):
+        self.assertEqual(fingerprint("01/08/2024"), fingerprint("01/08/2024"))
+        self.assertNotEqual(fingerprint("01/08/2024"), fingerprint("01/08/2025"))
+        self.assertLess(fingerprint("๑๕ มิถุนายน ๒๕๖๗"), 2**64)
+
+    def test_save_and_load_checkpoint(self):
+        random.seed(7)
+        rng_state = random.getstate()
+        checkpoint_path = os.path.join(self.temp_dir.name, "date.txt.ckpt")
+        save_checkpoint(checkpoint_path, 10, 120, 10, rng_state)
+        result = load_checkpoint(checkpoint_path)
+        self.assertEqual(
+            result,
+            {
+                "rows_written": 10,
+                "output_bytes": 120,
+                "fingerprint_count": 10,
+                "rng_state": rng_state,
+            },
+        )
+
+    def test_write_resumable(self):
+        random.seed(1)
+        number_written = write_resumable(
+            build_sampler("date"), 1000, self.file_path, checkpoint_every=300
+        )
+        self.assertEqual(number_written, 1000)
+        with open(self.file_path, encoding="utf-8") as f:
+            rows = f.read().split("\n")
+        self.assertEqual(len(set(rows)), 1000)
+        self.assertEqual(os.listdir(self.temp_dir.name), ["date.txt"])
+
+    def test_resume_matches_uninterrupted_run(self):
+        random.seed(1)
+        write_resumable(build_sampler("date"), 1000, self.file_path, 300)
+        with open(self.file_path, encoding="utf-8") as f:
+            expected = f.read()
+
+        # Fail while the third chunk is being generated
+        sampler = build_sampler("date")
+        calls = []
+
+        def failing_sampler():
+            calls.append(None)
+            if len(calls) > 700:
+                raise KeyboardInterrupt
+            return sampler()
+
+        random.seed(1)
+        with self.assertRaises(KeyboardInterrupt):
+            write_resumable(failing_sampler, 1000, self.file_path, 300)
+        self.assertTrue(os.path.exists(f"{self.file_path}.ckpt"))
+
+        random.seed(99)
+        number_written = write_resumable(
+            sampler, 1000, self.file_path, 300, resume=True
+        )
+        self.assertEqual(number_written, 1000)
+        with open(self.file_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), expected)
+
+    def test_count_rows(self):
+        with open(self.file_path, "w", encoding="utf-8") as f:
+            f.write("")
+        self.assertEqual(count_rows(self.file_path), 0)
+        with open(self.file_path, "w", encoding="utf-8") as f:
+            f.write("01/08/2024\n๑๕ มิถุนายน ๒๕๖๗\n1/8/67")
+        self.assertEqual(count_rows(self.file_path), 3)
+
+    def test_resume_completed_run(self):
+        random.seed(1)
+        write_resumable(build_sampler("date"), 500, self.file_path, 300)
+        with open(self.file_path, encoding="utf-8") as f:
+            expected = f.read()
+
+        random.seed(2)
+        number_written = write_resumable(
+            build_sampler("date"), 500, self.file_path, 300, resume=True
+        )
+        self.assertEqual(number_written, 500)
+        with open(self.file_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), expected)
+
+        with self.assertRaises(ValueError):
+            write_resumable(
+                build_sampler("date"), 600, self.file_path, 300, resume=True
+            )
+        with open(self.file_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), expected)
+
+    def test_resume_without_output(self):
+        number_written = write_resumable(
+            build_sampler("date"), 100, self.file_path, 300, resume=True
+        )
+        self.assertEqual(number_written, 100)
+        self.assertEqual(count_rows(self.file_path), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,13 @@
 # Unit tests
+import random
 import unittest
 
 from random_data_generation.currency import (
+    build_currency_batch_sampler,
+    build_currency_sampler,
+    compile_format_plan,
     format_currency,
+    format_currency_batch,
     generate_weighted_list,
     generate_single_currency_sample,
 )
@@ -109,6 +114,40 @@ class TestFormatCurrency(unittest.TestCase):
         )
         self.assertTrue(result.endswith(" Baht"))
 
+    def test_compile_format_plan_thb_suffix(self):
+        result = compile_format_plan(
+            "THB",
+            use_symbol=True,
+            use_comma=True,
+            show_cents=False,
+            use_dash=True,
+            use_space=True,
+            use_thai_numeral=True,
+            use_suffix=True,
+            suffix_th=True,
+        )
+        self.assertEqual(result, ("", ",.0f", ".- บาท", True))
+
+    def test_compile_format_plan_usd_ignores_thai_options(self):
+        result = compile_format_plan(
+            "USD",
+            use_symbol=True,
+            use_space=True,
+            use_thai_numeral=True,
+            use_suffix=True,
+        )
+        self.assertEqual(result, ("$ ", ".0f", "", False))
+
+    def test_format_currency_batch(self):
+        plan_keys = [
+            ("USD", True, True, True, False, True, False, False, False),
+            ("THB", True, True, True, False, False, True, False, False),
+            ("USD", True, True, True, False, True, False, False, False),
+            ("THB", False, True, True, True, False, False, False, False),
+        ]
+        result = format_currency_batch([1234.56, 1234.56, 7.5, 1234.56], plan_keys)
+        self.assertEqual(result, ["$ 1,234.56", "฿๑,๒๓๔.๕๖", "$ 7.50", "THB1,234.56.-"])
+
     def test_weighted_list(self):
         result = generate_weighted_list(["A", "B", "C"], [3, 1, 2])
         self.assertEqual(result, ["A", "A", "A", "B", "C", "C"])
@@ -126,6 +165,13 @@ class TestFormatCurrency(unittest.TestCase):
         self.assertIsNotNone(result, "The result is None")
         self.assertNotEqual(result, "", "The result is an empty string")
 
+    def test_currency_batch_sampler_matches_sampler(self):
+        sampler = build_currency_sampler()
+        random.seed(3)
+        expected = [sampler() for _ in range(20000)]
+        random.seed(3)
+        self.assertEqual(build_currency_batch_sampler()(20000), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,62 @@
+# Unit tests
+import random
+import unittest
+
+from random_data_generation.dataset import GeneratedDataset, get_worker_info
+
+
+class TestDataset(unittest.TestCase):
+
+    def test_get_worker_info(self):
+        self.assertEqual(get_worker_info(), (0, 1))
+
+    def test_fixed_length(self):
+        dataset = GeneratedDataset({"currency": 1, "date": 1}, length=1000, prefetch=64)
+        result = list(dataset)
+        self.assertEqual(len(dataset), 1000)
+        self.assertEqual(len(result), 1000)
+        self.assertEqual({data_type for _, data_type in result}, {"currency", "date"})
+        texts = [text for text, _ in result]
+        self.assertEqual(len(texts), len(set(texts)), "Samples are not unique")
+
+    def test_infinite(self):
+        dataset = GeneratedDataset("numeric", prefetch=10)
+        samples = iter(dataset)
+        result = [next(samples) for _ in range(25)]
+        self.assertEqual({data_type for _, data_type in result}, {"numeric"})
+        with self.assertRaises(TypeError):
+            len(dataset)
+
+    def test_deterministic_and_isolated(self):
+        dataset = GeneratedDataset("date", length=300, seed=3, prefetch=50)
+        random.seed(1)
+        expected_random = [random.random() for _ in range(3)]
+
+        random.seed(1)
+        first = list(dataset)
+        self.assertEqual([random.random() for _ in range(3)], expected_random)
+
+        random.seed(2)
+        self.assertEqual(list(dataset), first)
+        self.assertNotEqual(
+            list(GeneratedDataset("date", length=300, seed=4, prefetch=50)), first
+        )
+
+    def test_workers_are_disjoint(self):
+        dataset = GeneratedDataset("license_plate", length=1001, prefetch=100)
+        streams = [list(dataset.iter_worker(index, 3)) for index in range(3)]
+        self.assertEqual([len(stream) for stream in streams], [334, 334, 333])
+        texts = [text for stream in streams for text, _ in stream]
+        self.assertEqual(len(texts), len(set(texts)), "Workers overlap")
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            GeneratedDataset({"unknown": 1})
+        with self.assertRaises(ValueError):
+            GeneratedDataset("date", length=-1)
+        with self.assertRaises(ValueError):
+            GeneratedDataset("date", prefetch=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 # Unit tests
+import random
 import unittest
 import re
 from datetime import datetime, timedelta
@@ -9,6 +10,8 @@ from random_data_generation.date import (
     generate_weighted_list,
     random_date,
     generate_single_date_sample,
+    build_date_sampler,
+    build_date_batch_sampler,
 )
 
 
@@ -204,6 +207,13 @@ class TestFormatDate(unittest.TestCase):
         expected_date = "15-7-2023"
         self.assertEqual(result, expected_date)
 
+    def test_date_batch_sampler_matches_sampler(self):
+        sampler = build_date_sampler()
+        random.seed(3)
+        expected = [sampler() for _ in range(20000)]
+        random.seed(3)
+        self.assertEqual(build_date_batch_sampler()(20000), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,65 @@
+# Unit tests
+import os
+import tempfile
+import unittest
+
+from random_data_generation.dedup_store import (
+    FingerprintStore,
+    iter_claimed,
+    iter_store_unique,
+)
+
+
+class TestDedupStore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store_path = os.path.join(self.temp_dir.name, "store.sqlite")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_claim(self):
+        with FingerprintStore(self.store_path) as store:
+            self.assertEqual(store.claim(["a", "b"]), ["a", "b"])
+            self.assertEqual(store.claim(["c", "b", "d", "a"]), ["c", "d"])
+            self.assertEqual(len(store), 4)
+
+    def test_claim_across_connections(self):
+        with FingerprintStore(self.store_path) as first, FingerprintStore(
+            self.store_path
+        ) as second:
+            self.assertEqual(first.claim(["a", "b"]), ["a", "b"])
+            self.assertEqual(second.claim(["b", "c"]), ["c"])
+            self.assertEqual(first.claim(["c", "d"]), ["d"])
+
+    def test_claim_persists(self):
+        with FingerprintStore(self.store_path) as store:
+            store.claim(["๑๕ มิถุนายน ๒๕๖๗"])
+        with FingerprintStore(self.store_path) as store:
+            self.assertEqual(store.claim(["๑๕ มิถุนายน ๒๕๖๗", "1/8/67"]), ["1/8/67"])
+
+    def test_iter_claimed(self):
+        with FingerprintStore(self.store_path) as store:
+            store.claim(["b", "d"])
+            result = list(iter_claimed(iter("abcdef"), store, batch_size=2))
+            self.assertEqual(result, ["a", "c", "e", "f"])
+
+    def test_iter_claimed_key_and_limit(self):
+        items = [("date", "a"), ("numeric", "b"), ("date", "c"), ("numeric", "d")]
+        with FingerprintStore(self.store_path) as store:
+            store.claim(["a"])
+            result = list(iter_claimed(items, store, key=lambda item: item[1], limit=2))
+            self.assertEqual(result, [("numeric", "b"), ("date", "c")])
+            # Only the yielded samples are claimed
+            self.assertEqual(len(store), 3)
+
+    def test_iter_store_unique(self):
+        first = list(iter_store_unique(iter("abc"), self.store_path))
+        second = list(iter_store_unique(iter("bcde"), self.store_path, limit=1))
+        self.assertEqual(first, ["a", "b", "c"])
+        self.assertEqual(second, ["d"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+# Unit tests
+import random
+import unittest
+from unittest.mock import patch
+
+from random_data_generation import entropy
+from random_data_generation.entropy import (
+    below,
+    less_than,
+    pick,
+    random_columns,
+    scale,
+)
+
+
+class TestEntropy(unittest.TestCase):
+
+    def check_random_columns(self):
+        random.seed(11)
+        expected = [random.random() for _ in range(3000)]
+        expected_next = random.random()
+
+        random.seed(11)
+        columns = random_columns(1000, 3)
+        self.assertEqual(len(columns), 3)
+        rows = [draw for row in zip(*columns) for draw in row]
+        self.assertEqual(rows, expected)
+        self.assertEqual(random.random(), expected_next)
+
+    def test_random_columns(self):
+        self.check_random_columns()
+
+    def test_random_columns_without_numpy(self):
+        with patch.object(entropy, "np", None):
+            self.check_random_columns()
+
+    def test_empty_block(self):
+        self.assertEqual([len(column) for column in random_columns(0, 2)], [0, 0])
+
+    def test_helpers_match_random_calls(self):
+        random.seed(5)
+        (column,) = random_columns(500, 1)
+        draws = list(column)
+        weighted_list = ["a", "b", "b", "c"]
+        self.assertEqual(below(column, 10, 3), [int(d * 10) + 3 for d in draws])
+        self.assertEqual(
+            pick(weighted_list, column), [weighted_list[int(d * 4)] for d in draws]
+        )
+        self.assertEqual(less_than(column, 0.5), [d < 0.5 for d in draws])
+        self.assertEqual(scale(column, 100.0), [d * 100.0 for d in draws])
+
+
+if __name__ == "__main__":
+    unittest.main()
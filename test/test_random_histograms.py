@@ -0,0 +1,133 @@
+# Unit tests
+import collections
+import itertools
+import os
+import random
+import tempfile
+import unittest
+
+from random_data_generation.histograms import (
+    OptionHistograms,
+    check_counts,
+    chi_square_p_value,
+)
+from random_data_generation.profile import compile_profile, set_profile
+from random_data_generation.records import iter_unique_records
+from random_data_generation.registry import load_generator
+from random_data_generation.stratified import get_option_probabilities
+
+
+class TestHistograms(unittest.TestCase):
+
+    def test_chi_square_p_value(self):
+        # Critical values at the 5% level
+        self.assertAlmostEqual(chi_square_p_value(3.841, 1), 0.05, places=4)
+        self.assertAlmostEqual(chi_square_p_value(11.070, 5), 0.05, places=4)
+        self.assertAlmostEqual(chi_square_p_value(2.0, 2), 0.367879, places=5)
+        self.assertEqual(chi_square_p_value(0.0, 3), 1.0)
+        self.assertEqual(chi_square_p_value(float("inf"), 3), 0.0)
+
+    def test_check_counts(self):
+        probabilities = {"-": 0.5, " ": 0.25, "": 0.25}
+        check = check_counts({"-": 50, " ": 25, "": 25}, probabilities, field="sep")
+        self.assertEqual(check.field, "sep")
+        self.assertEqual(check.count, 100)
+        self.assertEqual(check.chi_square, 0)
+        self.assertEqual(check.kl_divergence, 0)
+        self.assertFalse(check.drifted)
+        self.assertTrue(check_counts({"-": 100, " ": 900}, probabilities).drifted)
+        self.assertTrue(check_counts({"-": 1, "/": 1}, probabilities).drifted)
+
+    def test_check_counts_max_kl(self):
+        probabilities = {True: 0.5, False: 0.5}
+        counts = {True: 55, False: 45}
+        self.assertFalse(check_counts(counts, probabilities).drifted)
+        self.assertTrue(check_counts(counts, probabilities, max_kl=0.001).drifted)
+
+    def test_records_honor_weights(self):
+        random.seed(0)
+        for data_type in ["currency", "date", "phone_number", "license_plate"]:
+            with self.subTest(data_type=data_type):
+                histograms = OptionHistograms(data_type)
+                records = iter_unique_records(
+                    data_type, batch_size=700, histograms=histograms
+                )
+                self.assertEqual(len(list(itertools.islice(records, 5000))), 5000)
+                self.assertEqual(histograms.draws % 700, 0)
+                self.assertGreaterEqual(histograms.draws, 5000)
+                for check in histograms.check():
+                    self.assertFalse(check.drifted, check)
+
+    def test_counts_match_draws(self):
+        random.seed(1)
+        histograms = OptionHistograms("license_plate", ["separator"])
+        histograms.update(load_generator("license_plate").build_record_sampler()(300))
+        random.seed(1)
+        records = load_generator("license_plate").build_record_sampler()(300)
+        expected = collections.Counter(record["separator"] for record in records)
+        self.assertEqual(histograms.counters["separator"], expected)
+        self.assertEqual(histograms.draws, 300)
+
+    def test_duplicates_do_not_cause_drift(self):
+        # A month of dates holds few distinct samples, so most draws are duplicates
+        set_profile(
+            compile_profile(
+                {"DATE_START_DATE": [2024, 2, 1], "DATE_END_DATE": [2024, 2, 29]}
+            )
+        )
+        self.addCleanup(set_profile, None)
+        random.seed(0)
+        histograms = OptionHistograms("date")
+        records = list(
+            itertools.islice(iter_unique_records("date", histograms=histograms), 5000)
+        )
+        self.assertGreater(histograms.draws, 2 * len(records))
+        for check in histograms.check():
+            self.assertFalse(check.drifted, check)
+
+        # The options of the unique samples alone no longer follow the weights
+        unique = OptionHistograms("date")
+        unique.update(records)
+        self.assertTrue(any(check.drifted for check in unique.check()))
+
+    def test_drift_detected(self):
+        histograms = OptionHistograms("numeric")
+        histograms.update([{"use_thai_numeral": True}] * 1000)
+        (check,) = histograms.check()
+        self.assertTrue(check.drifted)
+        self.assertEqual(
+            set(get_option_probabilities("numeric")["use_thai_numeral"]),
+            {True, False},
+        )
+
+    def test_write_read_merge(self):
+        random.seed(2)
+        parts = []
+        for partition in [(0, 2), (1, 2)]:
+            histograms = OptionHistograms("date")
+            records = iter_unique_records(
+                "date", partition=partition, batch_size=400, histograms=histograms
+            )
+            list(itertools.islice(records, 100))
+            parts.append(histograms)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "date.hist.json")
+            parts[0].write(file_path)
+            merged = OptionHistograms.read(file_path)
+        self.assertEqual(merged.counters, parts[0].counters)
+        merged.merge(parts[1])
+        self.assertEqual(merged.draws, parts[0].draws + parts[1].draws)
+        self.assertEqual(
+            merged.counters["year_digit"],
+            parts[0].counters["year_digit"] + parts[1].counters["year_digit"],
+        )
+        with self.assertRaises(ValueError):
+            merged.merge(OptionHistograms("numeric"))
+
+    def test_unknown_type(self):
+        with self.assertRaises(ValueError):
+            OptionHistograms("mixed")
+
+
+if __name__ == "__main__":
+    unittest.main()
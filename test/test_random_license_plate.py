@@ -1,4 +1,5 @@
 # Unit tests
+import random
 import unittest
 import re
 
@@ -6,6 +7,8 @@ from random_data_generation.license_plate import (
     format_license_plate,
     generate_weighted_list,
     generate_single_license_plate_sample,
+    build_license_plate_sampler,
+    build_license_plate_batch_sampler,
 )
 
 
@@ -130,6 +133,13 @@ class TestFormatLicensePlate(unittest.TestCase):
             len(result), 6, "The length of the result should be less than 6 characters."
         )
 
+    def test_license_plate_batch_sampler_matches_sampler(self):
+        sampler = build_license_plate_sampler()
+        random.seed(3)
+        expected = [sampler() for _ in range(20000)]
+        random.seed(3)
+        self.assertEqual(build_license_plate_batch_sampler()(20000), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
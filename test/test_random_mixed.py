@@ -0,0 +1,39 @@
+# Unit tests
+import unittest
+
+from random_data_generation.mixed import (
+    generate_mixed,
+    iter_mixed,
+    parse_ratios,
+)
+
+
+class TestMixed(unittest.TestCase):
+
+    def test_parse_ratios(self):
+        result = parse_ratios("currency=5, date=2,numeric")
+        self.assertEqual(result, {"currency": 5.0, "date": 2.0, "numeric": 1})
+
+    def test_parse_ratios_all(self):
+        result = parse_ratios("all")
+        self.assertEqual(len(result), 5)
+        self.assertEqual(set(result.values()), {1})
+
+    def test_generate_mixed(self):
+        result = generate_mixed({"currency": 1, "date": 1}, 500)
+        self.assertEqual(len(result), 500)
+        self.assertEqual({data_type for data_type, _ in result}, {"currency", "date"})
+        samples = [sample for _, sample in result]
+        self.assertEqual(len(samples), len(set(samples)), "Samples are not unique")
+
+    def test_generate_mixed_zero_ratio(self):
+        result = generate_mixed({"numeric": 1, "license_plate": 0}, 100)
+        self.assertEqual({data_type for data_type, _ in result}, {"numeric"})
+
+    def test_iter_mixed_unknown_type(self):
+        with self.assertRaises(ValueError):
+            next(iter_mixed({"unknown": 1}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+# Unit tests
+import unittest
+import random
+from unittest.mock import patch
+
+from random_data_generation import number_format
+from random_data_generation.number_format import (
+    format_amount,
+    format_amounts,
+    get_format_spec,
+)
+
+
+class TestNumberFormat(unittest.TestCase):
+
+    def test_get_format_spec(self):
+        self.assertEqual(get_format_spec(True, 2), ",.2f")
+        self.assertEqual(get_format_spec(False, 0), ".0f")
+        self.assertEqual(get_format_spec(True, 6), ",.6f")
+
+    def test_format_amount(self):
+        result = format_amount(1234.56, get_format_spec(True, 2))
+        self.assertEqual(result, "1,234.56")
+
+    def test_format_amount_thai_numeral(self):
+        result = format_amount(1234.56, get_format_spec(True, 0), True)
+        self.assertEqual(result, "๑,๒๓๕")
+
+    def test_format_amounts(self):
+        result = format_amounts([1234.56, 7.0], get_format_spec(False, 2), True)
+        self.assertEqual(result, ["๑๒๓๔.๕๖", "๗.๐๐"])
+
+    @patch.object(number_format, "NUMPY_MIN_BATCH_SIZE", 1)
+    def test_format_amounts_numpy_matches_format(self):
+        if number_format.np is None:
+            self.skipTest("NumPy is not installed")
+
+        amounts = [random.random() * 100000000 for _ in range(2000)]
+        amounts += [0.0, 0.5, 0.005, 999.995, 1000.0, 999999.999]
+        for use_comma in (True, False):
+            for decimals in (0, 2):
+                for use_thai_numeral in (True, False):
+                    format_spec = get_format_spec(use_comma, decimals)
+                    result = format_amounts(amounts, format_spec, use_thai_numeral)
+                    expected = [
+                        format_amount(amount, format_spec, use_thai_numeral)
+                        for amount in amounts
+                    ]
+                    self.assertEqual(result, expected)
+
+    @patch.object(number_format, "NUMPY_MIN_BATCH_SIZE", 1)
+    def test_format_amounts_numpy_negative_fallback(self):
+        result = format_amounts([-1234.5, 10.0], get_format_spec(True, 2))
+        self.assertEqual(result, ["-1,234.50", "10.00"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
 # Unit tests
+import random
 import unittest
 import re
 
 from random_data_generation.numeric import (
+    build_numeric_batch_sampler,
+    build_numeric_sampler,
     format_numeric,
     generate_weighted_list,
     generate_single_numeric_sample,
@@ -93,6 +96,13 @@ class TestFormatNumeric(unittest.TestCase):
             "The result does not contain Thai numerals",
         )
 
+    def test_numeric_batch_sampler_matches_sampler(self):
+        sampler = build_numeric_sampler()
+        random.seed(3)
+        expected = [sampler() for _ in range(100000)]
+        random.seed(3)
+        self.assertEqual(build_numeric_batch_sampler()(100000), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,47 @@
+# Unit tests
+import itertools
+import unittest
+
+from random_data_generation.partition import (
+    parse_partition,
+    partition_sampler,
+    partition_size,
+    stable_hash,
+)
+from random_data_generation.stream import iter_unique_samples
+
+
+class TestPartition(unittest.TestCase):
+
+    def test_stable_hash(self):
+        self.assertEqual(stable_hash("01/08/2024"), 590586652)
+        self.assertEqual(stable_hash("฿๑,๒๓๔.๕๖"), stable_hash("฿๑,๒๓๔.๕๖"))
+
+    def test_parse_partition(self):
+        self.assertEqual(parse_partition("2/8"), (2, 8))
+
+    def test_parse_partition_invalid(self):
+        for value in ("8/8", "-1/8", "2", "0/0"):
+            with self.assertRaises(ValueError):
+                parse_partition(value)
+
+    def test_partition_size(self):
+        sizes = [partition_size(10, index, 3) for index in range(3)]
+        self.assertEqual(sizes, [4, 3, 3])
+
+    def test_partition_sampler(self):
+        samples = iter(["a", "b", "c", "d", "e", "f"])
+        sampler = partition_sampler(lambda: next(samples), 1, 2)
+        for _ in range(2):
+            self.assertEqual(stable_hash(sampler()) % 2, 1)
+
+    def test_partitions_are_disjoint(self):
+        partitions = [
+            set(itertools.islice(iter_unique_samples("numeric", partition=(i, 3)), 500))
+            for i in range(3)
+        ]
+        self.assertEqual(len(set.union(*partitions)), 1500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 # Unit tests
+import random
 import unittest
 import re
 
@@ -6,6 +7,8 @@ from random_data_generation.phone_number import (
     format_phone_number,
     generate_weighted_list,
     generate_single_phone_number_sample,
+    build_phone_number_sampler,
+    build_phone_number_batch_sampler,
 )
 
 
@@ -140,6 +143,13 @@ class TestFormatPhoneNumber(unittest.TestCase):
             f"Expected result to contain only Arabic numerals, but got {result}",
         )
 
+    def test_phone_number_batch_sampler_matches_sampler(self):
+        sampler = build_phone_number_sampler()
+        random.seed(3)
+        expected = [sampler() for _ in range(20000)]
+        random.seed(3)
+        self.assertEqual(build_phone_number_batch_sampler()(20000), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,88 @@
+# Unit tests
+import json
+import os
+import pickle
+import random
+import tempfile
+import unittest
+
+from random_data_generation.constants import DATE_FORMAT_WEIGHTS
+from random_data_generation.date import generate_dates
+from random_data_generation.profile import (
+    compile_profile,
+    get_profile,
+    load_profile,
+    set_profile,
+)
+from random_data_generation.stream import build_sampler
+
+
+class TestProfile(unittest.TestCase):
+
+    def tearDown(self):
+        set_profile(None)
+
+    def test_default_profile(self):
+        profile = compile_profile()
+        self.assertEqual(profile["DATE_FORMAT_WEIGHTS"], tuple(DATE_FORMAT_WEIGHTS))
+        self.assertEqual(profile["DATE_START_DATE"], (1900, 1, 1))
+        self.assertEqual(get_profile(), profile)
+        self.assertEqual(pickle.loads(pickle.dumps(profile)), profile)
+
+    def test_override(self):
+        profile = compile_profile(
+            {
+                "CURRENCY_CHOICES": ["THB", "JPY"],
+                "CURRENCY_WEIGHTS": [1, 0],
+                "CURRENCY_USE_SUFFIX_WEIGHTS": [1, 0],
+                "CURRENCY_SUFFIX_TH_WEIGHTS": [1, 0],
+            }
+        )
+        set_profile(profile)
+        sampler = build_sampler("currency")
+        for _ in range(200):
+            self.assertTrue(sampler().endswith("บาท"))
+
+    def test_ranges(self):
+        set_profile(
+            compile_profile(
+                {"DATE_START_DATE": [2024, 2, 1], "DATE_END_DATE": [2024, 2, 29]}
+            )
+        )
+        random.seed(0)
+        result = generate_dates(5000)
+        self.assertTrue(any("2024" in sample for sample in result))
+        self.assertFalse(any("2023" in sample or "2025" in sample for sample in result))
+
+    def test_invalid_profiles(self):
+        for overrides in (
+            {"UNKNOWN_WEIGHTS": [1]},
+            {"DATE_FORMAT_WEIGHTS": [1, 2]},
+            {"DATE_FORMAT_WEIGHTS": [0, 0, 0, 0, 0, 0, 0]},
+            {"DATE_FORMAT_WEIGHTS": [1, 1, 1, 1, 1, 1, 1.5]},
+            {"CURRENCY_CHOICES": ["CHF"], "CURRENCY_WEIGHTS": [1]},
+            {"LICENSE_MIN_NUMBER": 10, "LICENSE_MAX_NUMBER": 9},
+            {"PHONE_MAX_DIGIT": 10},
+            {"DATE_START_DATE": [2024, 2, 30]},
+            {"NUMERIC_MAX_AMOUNT": "100"},
+        ):
+            with self.subTest(overrides=overrides):
+                with self.assertRaises(ValueError):
+                    compile_profile(overrides)
+
+    def test_load_profile(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "profile.json")
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump({"PHONE_SEPARATOR_CHOICES": [".", "-", " "]}, f)
+            profile = load_profile(file_path)
+            self.assertEqual(profile["PHONE_SEPARATOR_CHOICES"], (".", "-", " "))
+
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump([1, 2], f)
+            with self.assertRaises(ValueError):
+                load_profile(file_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
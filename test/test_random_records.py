@@ -0,0 +1,129 @@
+# Unit tests
+import csv
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from random_data_generation.partition import stable_hash
+from random_data_generation.records import (
+    encode_csv,
+    encode_jsonl,
+    iter_unique_records,
+    write_records,
+)
+from random_data_generation.registry import BUILTIN_GENERATORS, load_generator
+from random_data_generation.currency import CURRENCY_RECORD_FIELDS
+from random_data_generation.date import DATE_RECORD_FIELDS
+from random_data_generation.license_plate import LICENSE_PLATE_RECORD_FIELDS
+from random_data_generation.numeric import NUMERIC_RECORD_FIELDS
+from random_data_generation.phone_number import PHONE_NUMBER_RECORD_FIELDS
+
+RECORD_FIELDS = {
+    "currency": CURRENCY_RECORD_FIELDS,
+    "numeric": NUMERIC_RECORD_FIELDS,
+    "date": DATE_RECORD_FIELDS,
+    "phone_number": PHONE_NUMBER_RECORD_FIELDS,
+    "license_plate": LICENSE_PLATE_RECORD_FIELDS,
+}
+
+
+class TestRecords(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_records_match_samples(self):
+        for data_type in BUILTIN_GENERATORS:
+            with self.subTest(data_type=data_type):
+                generator = load_generator(data_type)
+                sampler = generator.build_sampler()
+                random.seed(data_type)
+                expected = [sampler() for _ in range(500)]
+                random.seed(data_type)
+                records = generator.build_record_sampler()(500)
+                self.assertEqual([record["text"] for record in records], expected)
+                for record in records:
+                    self.assertEqual(list(record), ["text", *RECORD_FIELDS[data_type]])
+
+    def test_amounts_match_text(self):
+        random.seed(0)
+        records = load_generator("numeric").build_record_sampler()(500)
+        for record in records:
+            if not record["use_thai_numeral"]:
+                self.assertEqual(
+                    float(record["text"].replace(",", "")), record["amount"]
+                )
+
+    def test_phone_number_digits_appear(self):
+        random.seed(0)
+        for record in load_generator("phone_number").build_record_sampler()(500):
+            if not record["use_thai_numeral"]:
+                digits = "".join(filter(str.isdigit, record["text"]))
+                self.assertTrue(digits.endswith(record["number"]))
+
+    def test_iter_unique_records(self):
+        records = iter_unique_records("license_plate", batch_size=100)
+        texts = [next(records)["text"] for _ in range(1000)]
+        self.assertEqual(len(set(texts)), 1000)
+
+    def test_iter_unique_records_partition(self):
+        records = iter_unique_records("date", partition=(1, 3), batch_size=100)
+        for _ in range(100):
+            self.assertEqual(stable_hash(next(records)["text"]) % 3, 1)
+
+    def test_encode(self):
+        records = [{"text": "๑,๒๓๔", "amount": 1234, "prefix_num": None}]
+        self.assertEqual(
+            encode_jsonl(records),
+            ['{"text": "๑,๒๓๔", "amount": 1234, "prefix_num": null}'],
+        )
+        self.assertEqual(
+            encode_csv(records, ["text", "amount", "prefix_num"]), ['"๑,๒๓๔",1234,']
+        )
+
+    def test_encode_csv_line_break(self):
+        records = [
+            {"text": "12\n34", "separator": "\n"},
+            {"text": "5", "separator": ""},
+        ]
+        rows = encode_csv(records, ["text", "separator"])
+        self.assertEqual(rows, ['"12\n34","\n"', "5,"])
+        parsed = list(csv.reader(io.StringIO("\n".join(rows)), lineterminator="\n"))
+        self.assertEqual(parsed, [["12\n34", "\n"], ["5", ""]])
+
+    def test_write_jsonl(self):
+        file_path = os.path.join(self.temp_dir.name, "date.jsonl")
+        records = iter_unique_records("date")
+        self.assertEqual(
+            write_records(records, 1000, file_path, "jsonl", chunk_size=300), 1000
+        )
+        with open(file_path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual(len(rows), 1000)
+        self.assertEqual(len({row["text"] for row in rows}), 1000)
+
+    def test_write_csv(self):
+        file_path = os.path.join(self.temp_dir.name, "currency.csv")
+        records = iter_unique_records("currency")
+        self.assertEqual(
+            write_records(records, 1000, file_path, "csv", chunk_size=300), 1000
+        )
+        with open(file_path, encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 1000)
+        self.assertEqual(list(rows[0]), ["text", *CURRENCY_RECORD_FIELDS])
+
+    def test_write_unknown_format(self):
+        file_path = os.path.join(self.temp_dir.name, "date.xml")
+        with self.assertRaises(ValueError):
+            write_records(iter([]), 0, file_path, "xml")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+# Unit tests
+import io
+import os
+import subprocess
+import sys
+import types
+import unittest
+from unittest.mock import patch
+
+from random_data_generation import registry
+from random_data_generation.registry import (
+    BUILTIN_GENERATORS,
+    IMPORT_DEBUG_ENV,
+    generate_unique,
+    get_generator_types,
+    is_generator_type,
+    load_generator,
+    set_import_debug,
+)
+from random_data_generation.stream import build_sampler
+
+
+def build_letter_sampler():
+    letters = iter("abcdefghij")
+    return lambda: next(letters)
+
+
+class FakeEntryPoint:
+
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+    def load(self):
+        return self.value
+
+
+class TestRegistry(unittest.TestCase):
+
+    def setUp(self):
+        plugins = {"letter": FakeEntryPoint("letter", build_letter_sampler)}
+        patcher = patch.object(registry, "_plugin_entry_points", plugins)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(registry._LOADED_GENERATORS.pop, "letter", None)
+
+    def test_get_generator_types(self):
+        self.assertEqual(get_generator_types(), [*BUILTIN_GENERATORS, "letter"])
+
+    def test_is_generator_type(self):
+        self.assertTrue(is_generator_type("currency"))
+        self.assertTrue(is_generator_type("letter"))
+        self.assertFalse(is_generator_type("unknown"))
+
+    def test_load_builtin_generator(self):
+        generator = load_generator("date")
+        self.assertIs(load_generator("date"), generator)
+        self.assertEqual(len(generator.generate(10)), 10)
+
+    def test_load_plugin_generator(self):
+        generator = load_generator("letter")
+        self.assertEqual(generator.generate(3), ["a", "b", "c"])
+        self.assertEqual(build_sampler("letter")(), "a")
+        record_sampler = generator.build_record_sampler()
+        self.assertEqual(record_sampler(2), [{"text": "a"}, {"text": "b"}])
+
+    def test_load_plugin_module(self):
+        plugin = types.SimpleNamespace(
+            build_sampler=build_letter_sampler, STRATA={"letter": 0}
+        )
+        registry._plugin_entry_points["module"] = FakeEntryPoint("module", plugin)
+        self.addCleanup(registry._plugin_entry_points.pop, "module")
+        self.addCleanup(registry._LOADED_GENERATORS.pop, "module", None)
+        generator = load_generator("module")
+        self.assertEqual(generator.strata, {"letter": 0})
+        self.assertEqual(generator.build_batch_sampler()(3), ["a", "b", "c"])
+        self.assertIsNone(load_generator("letter").strata)
+
+    def test_load_unknown_generator(self):
+        with self.assertRaises(ValueError):
+            load_generator("unknown")
+
+    def test_generate_unique(self):
+        self.assertEqual(generate_unique(build_letter_sampler, 0), [])
+        self.assertEqual(len(generate_unique(build_letter_sampler, 10)), 10)
+
+    def test_import_debug(self):
+        set_import_debug(True)
+        self.addCleanup(set_import_debug, False)
+        self.assertEqual(os.environ[IMPORT_DEBUG_ENV], "1")
+        with patch("sys.stderr", new=io.StringIO()) as stderr:
+            load_generator("letter")
+        self.assertIn("Imported letter generator in", stderr.getvalue())
+
+    def test_generators_imported_on_demand(self):
+        code = (
+            "import sys\n"
+            "from random_data_generation.stream import build_sampler\n"
+            "build_sampler('date')\n"
+            "print(sorted(m for m in sys.modules if m.startswith('random_data_generation.')))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertIn("random_data_generation.date", output)
+        for module_name, *_ in BUILTIN_GENERATORS.values():
+            if module_name != ".date":
+                self.assertNotIn(f"random_data_generation{module_name}'", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+# Unit tests
+import asyncio
+import unittest
+
+from random_data_generation.server import (
+    GenerationServer,
+    encode_request,
+    encode_rows,
+    fetch_rows,
+    parse_request,
+)
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+
+    def test_parse_request(self):
+        self.assertEqual(parse_request(encode_request("date", 10)[4:]), ("date", 10))
+        for body in (b"unknown 10", b"date -1", b"date ten", b"date"):
+            with self.assertRaises(ValueError):
+                parse_request(body)
+
+    def test_encode_rows(self):
+        self.assertEqual(
+            encode_rows(["ab", "๑"]),
+            b"\x00\x00\x00\x02\x00\x00\x00\x02ab\x00\x00\x00\x03" + "๑".encode(),
+        )
+
+    async def test_fetch_rows(self):
+        async with GenerationServer(jobs=1, batch_size=100, prefetch=2) as server:
+            listener = await server.start()
+            host, port = listener.sockets[0].getsockname()[:2]
+            reader, writer = await asyncio.open_connection(host, port)
+
+            rows = await fetch_rows(reader, writer, "date", 250)
+            self.assertEqual(len(rows), 250)
+            self.assertTrue(all(isinstance(row, str) and row for row in rows))
+            # A single batch holds unique samples
+            self.assertEqual(len(set(rows[:100])), 100)
+
+            rows = await fetch_rows(reader, writer, "license_plate", 5)
+            self.assertEqual(len(rows), 5)
+            self.assertEqual(await fetch_rows(reader, writer, "currency", 0), [])
+
+            with self.assertRaises(ValueError):
+                await fetch_rows(reader, writer, "unknown", 5)
+
+            writer.close()
+            await writer.wait_closed()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+# Unit tests
+import itertools
+import json
+import os
+import tempfile
+import unittest
+
+from random_data_generation.shards import (
+    iter_parallel_unique,
+    shard_file_name,
+    write_shards,
+)
+from random_data_generation.stream import iter_unique_samples
+
+
+class TestShards(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_shard_file_name(self):
+        self.assertEqual(shard_file_name("currency", 1), "currency-00001.txt")
+        self.assertEqual(shard_file_name("date", 12, "txt.gz"), "date-00012.txt.gz")
+
+    def test_write_shards(self):
+        manifest = write_shards(
+            iter_unique_samples("numeric"), "numeric", 2500, self.temp_dir.name, 1000
+        )
+        self.assertEqual(manifest["rows"], 2500)
+        self.assertEqual(
+            [shard["rows"] for shard in manifest["shards"]], [1000, 1000, 500]
+        )
+
+        rows = []
+        for shard in manifest["shards"]:
+            file_path = os.path.join(self.temp_dir.name, shard["file"])
+            self.assertEqual(os.path.getsize(file_path), shard["bytes"])
+            with open(file_path, encoding="utf-8") as f:
+                rows.extend(f.read().split("\n"))
+        self.assertEqual(len(rows), 2500)
+        self.assertEqual(len(set(rows)), 2500, "Rows are not unique across shards")
+
+        with open(os.path.join(self.temp_dir.name, "numeric-manifest.json")) as f:
+            self.assertEqual(json.load(f), manifest)
+
+    def test_iter_parallel_unique(self):
+        samples = iter_parallel_unique("license_plate", jobs=2, batch_size=500)
+        result = list(itertools.islice(samples, 3000))
+        samples.close()
+        self.assertEqual(len(set(result)), 3000)
+
+
+if __name__ == "__main__":
+    unittest.main()
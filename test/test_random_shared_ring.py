@@ -0,0 +1,86 @@
+# Unit tests
+import multiprocessing
+import unittest
+
+from random_data_generation.shared_ring import SharedRing, produce
+
+
+def consume(name, results, lock=None):
+    with SharedRing.attach(name, lock) as ring:
+        results.put(list(ring))
+
+
+class TestSharedRing(unittest.TestCase):
+
+    def setUp(self):
+        self.ring = SharedRing.create(slot_count=4, slot_size=64)
+
+    def tearDown(self):
+        self.ring.__exit__(None, None, None)
+
+    def test_put_and_iterate(self):
+        rows = ["01/08/2024", "๑๕ มิถุนายน ๒๕๖๗", "1/8/67"]
+        self.ring.put(rows)
+        self.ring.close_writing()
+        with SharedRing.attach(self.ring.name) as consumer:
+            self.assertEqual(list(consumer), rows)
+
+    def test_rows_spread_over_slots(self):
+        rows = ["x" * 20, "y" * 20, "z" * 20]
+        self.assertEqual(self.ring.try_put([row.encode() for row in rows]), 2)
+        self.assertEqual(len(self.ring), 1)
+
+    def test_full_ring(self):
+        for _ in range(4):
+            self.assertEqual(self.ring.try_put([b"a"]), 1)
+        self.assertEqual(self.ring.try_put([b"a"]), 0)
+
+    def test_get_batch_in_place(self):
+        self.ring.put(["ab", "c"])
+        offsets, blob = self.ring.get_batch()
+        self.assertEqual(list(offsets), [0, 2, 3])
+        self.assertEqual(bytes(blob), b"abc")
+        offsets.release()
+        blob.release()
+        self.ring.release_batch()
+        self.assertEqual(len(self.ring), 0)
+
+    def test_row_too_large(self):
+        with self.assertRaises(ValueError):
+            self.ring.try_put([b"x" * 64])
+
+    def test_produce(self):
+        results = multiprocessing.Queue()
+        consumer = multiprocessing.Process(
+            target=consume, args=(self.ring.name, results)
+        )
+        consumer.start()
+        self.assertEqual(produce("license_plate", [self.ring], 100, batch_size=7), 100)
+        rows = results.get(timeout=30)
+        consumer.join()
+        self.assertEqual(len(rows), 100)
+
+    def test_produce_with_lock(self):
+        lock = multiprocessing.Lock()
+        results = multiprocessing.Queue()
+        with SharedRing.create(slot_count=2, slot_size=256, lock=lock) as ring:
+            consumer = multiprocessing.Process(
+                target=consume, args=(ring.name, results, lock)
+            )
+            consumer.start()
+            self.assertEqual(produce("date", [ring], 50, batch_size=7), 50)
+            rows = results.get(timeout=30)
+            consumer.join()
+        self.assertEqual(len(rows), 50)
+
+    def test_produce_without_consumer(self):
+        with self.assertRaises(TimeoutError):
+            produce("date", [self.ring], 1000, timeout=0.05)
+
+    def test_put_without_consumer(self):
+        with self.assertRaises(TimeoutError):
+            self.ring.put(["x" * 40] * 5, timeout=0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+# Unit tests
+import os
+import tempfile
+import unittest
+
+from random_data_generation.splits import (
+    iter_splits,
+    parse_splits,
+    split_sizes,
+    write_splits,
+)
+from random_data_generation.stream import iter_unique_samples
+
+
+class TestSplits(unittest.TestCase):
+
+    def test_parse_splits(self):
+        self.assertEqual(parse_splits("0.9,0.05,0.05"), [0.9, 0.05, 0.05])
+        self.assertEqual(parse_splits("0.8,0.2"), [0.8, 0.2])
+
+    def test_parse_splits_invalid(self):
+        for value in ("1", "0.5,0.2", "0.5,0.5,0.5,-0.5", "1.2,-0.2", "a,b"):
+            with self.assertRaises(ValueError):
+                parse_splits(value)
+
+    def test_split_sizes(self):
+        self.assertEqual(split_sizes(100, [0.9, 0.05, 0.05]), [90, 5, 5])
+        self.assertEqual(split_sizes(10, [1 / 3, 1 / 3, 1 / 3]), [4, 3, 3])
+        self.assertEqual(sum(split_sizes(12345, [0.7, 0.2, 0.1])), 12345)
+
+    def test_iter_splits(self):
+        result = list(iter_splits(iter(range(20)), [10, 0, 5]))
+        self.assertEqual(len(result), 15)
+        self.assertEqual(sum(1 for split_index, _ in result if split_index == 0), 10)
+        self.assertEqual(sum(1 for split_index, _ in result if split_index == 2), 5)
+        self.assertEqual([sample for _, sample in result], list(range(15)))
+
+    def test_write_splits(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = write_splits(
+                iter_unique_samples("date"),
+                "date",
+                1000,
+                temp_dir,
+                [0.9, 0.05, 0.05],
+                chunk_size=64,
+            )
+            self.assertEqual(
+                result,
+                {"date.train.txt": 900, "date.val.txt": 50, "date.test.txt": 50},
+            )
+
+            samples = set()
+            for file_name, rows in result.items():
+                with open(os.path.join(temp_dir, file_name), encoding="utf-8") as f:
+                    lines = f.read().split("\n")
+                self.assertEqual(len(lines), rows)
+                samples.update(lines)
+            self.assertEqual(len(samples), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+# Unit tests
+import collections
+import functools
+import itertools
+import random
+import types
+import unittest
+from unittest.mock import patch
+
+from random_data_generation import registry
+from random_data_generation.stratified import (
+    allocate_quotas,
+    generate_stratified,
+    iter_interleaved,
+    iter_stratified,
+    get_strata_fields,
+    plan_strata,
+)
+
+
+class TestStratified(unittest.TestCase):
+
+    def test_allocate_quotas(self):
+        self.assertEqual(allocate_quotas([0.5, 0.3, 0.2], 10), [5, 3, 2])
+        self.assertEqual(allocate_quotas([0.98, 0.01, 0.01], 10), [8, 1, 1])
+        self.assertEqual(
+            allocate_quotas([0.98, 0.01, 0.01], 10, min_count=0), [10, 0, 0]
+        )
+        self.assertEqual(sum(allocate_quotas([0.7, 0.2, 0.1], 7)), 7)
+        with self.assertRaises(ValueError):
+            allocate_quotas([0.5, 0.5], 3, min_count=2)
+
+    def test_get_strata_fields(self):
+        self.assertEqual(
+            get_strata_fields("license_plate"),
+            ["prefix_type", "separator", "use_thai_numeral"],
+        )
+        with self.assertRaises(ValueError):
+            get_strata_fields("mixed")
+
+    def test_plan_strata(self):
+        strata = plan_strata("license_plate", 1000, ["prefix_type", "use_thai_numeral"])
+        self.assertEqual(len(strata), 8)
+        self.assertEqual(sum(stratum.quota for stratum in strata), 1000)
+        self.assertAlmostEqual(sum(stratum.probability for stratum in strata), 1)
+        rare = {"prefix_type": "1a", "use_thai_numeral": True}
+        self.assertIn(rare, [stratum.options for stratum in strata])
+
+    def test_plan_strata_unknown_option(self):
+        with self.assertRaises(ValueError):
+            plan_strata("numeric", 10, ["format"])
+
+    def test_generate_stratified_quotas(self):
+        random.seed(0)
+        fields = ["format", "year_type", "year_digit"]
+        strata = plan_strata("date", 500, fields, min_count=5)
+        records = generate_stratified("date", 500, fields, min_count=5, records=True)
+        self.assertEqual(len({record["text"] for record in records}), 500)
+        counts = collections.Counter(
+            tuple(record[field] for field in fields) for record in records
+        )
+        for stratum in strata:
+            key = tuple(stratum.options[field] for field in fields)
+            self.assertEqual(counts[key], stratum.quota)
+            self.assertGreaterEqual(counts[key], 5)
+
+    def test_generate_stratified_samples(self):
+        random.seed(0)
+        samples = generate_stratified("phone_number", 300)
+        self.assertEqual(len(set(samples)), 300)
+        self.assertTrue(all(isinstance(sample, str) for sample in samples))
+
+    def test_generate_stratified_seeded(self):
+        random.seed(1)
+        first = generate_stratified("currency", 200)
+        random.seed(1)
+        self.assertEqual(generate_stratified("currency", 200), first)
+
+    def test_iter_interleaved(self):
+        random.seed(0)
+        order = list(iter_interleaved([3, 0, 5, 1, 1]))
+        self.assertEqual(len(order), 10)
+        self.assertEqual(collections.Counter(order), {0: 3, 2: 5, 3: 1, 4: 1})
+        self.assertEqual(list(iter_interleaved([])), [])
+
+    def test_iter_interleaved_is_random(self):
+        random.seed(1)
+        firsts = collections.Counter(
+            next(iter_interleaved([1, 3])) for _ in range(4000)
+        )
+        self.assertAlmostEqual(firsts[1] / 4000, 0.75, delta=0.03)
+
+    def test_iter_stratified_is_lazy(self):
+        self.use_pair_plugin()
+        random.seed(0)
+        samples = iter_stratified("pair", 1000, batch_size=10)
+        first = list(itertools.islice(samples, 20))
+        self.assertEqual(len(set(first)), 20)
+        # Only a few batches per stratum have been drawn, not the 1000 samples
+        self.assertLess(len(DRAWN), 100)
+
+    def test_generate_stratified_plugin(self):
+        self.use_pair_plugin()
+        random.seed(0)
+        samples = generate_stratified("pair", 12)
+        self.assertEqual(len(set(samples)), 12)
+        self.assertEqual(sum(sample.startswith("b") for sample in samples), 3)
+
+    def use_pair_plugin(self):
+        DRAWN.clear()
+        plugin = types.SimpleNamespace(
+            build_sampler=build_pair_sampler,
+            build_batch_sampler=lambda: functools.partial(
+                sample_pairs, *build_pair_sampler().args
+            ),
+            STRATA={"letter": 0},
+        )
+        plugins = {"pair": FakeEntryPoint("pair", plugin)}
+        patcher = patch.object(registry, "_plugin_entry_points", plugins)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(registry._LOADED_GENERATORS.pop, "pair", None)
+
+
+class FakeEntryPoint:
+
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+    def load(self):
+        return self.value
+
+
+# Samples drawn by the pair plugin
+DRAWN = []
+
+
+def sample_pair(letters, digits):
+    DRAWN.append(random.choice(letters) + "".join(random.choices(digits, k=2)))
+    return DRAWN[-1]
+
+
+def sample_pairs(letters, digits, number_of_generated_sample):
+    return [sample_pair(letters, digits) for _ in range(number_of_generated_sample)]
+
+
+def build_pair_sampler():
+    return functools.partial(sample_pair, ["a", "a", "a", "b"], "0123456789")
+
+
+if __name__ == "__main__":
+    unittest.main()
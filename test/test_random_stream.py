@@ -0,0 +1,44 @@
+# Unit tests
+import unittest
+import itertools
+
+from random_data_generation.stream import (
+    iter_chunks,
+    iter_unique,
+    iter_unique_samples,
+)
+
+
+class TestStream(unittest.TestCase):
+
+    def test_iter_unique(self):
+        samples = iter(["a", "b", "a", "c", "b", "d"])
+        result = list(itertools.islice(iter_unique(lambda: next(samples)), 4))
+        self.assertEqual(result, ["a", "b", "c", "d"])
+
+    def test_iter_unique_seen(self):
+        samples = iter(["a", "b", "c"])
+        seen = {"a"}
+        result = list(itertools.islice(iter_unique(lambda: next(samples), seen), 2))
+        self.assertEqual(result, ["b", "c"])
+        self.assertEqual(seen, {"a", "b", "c"})
+
+    def test_iter_unique_samples(self):
+        result = list(itertools.islice(iter_unique_samples("license_plate"), 1000))
+        self.assertEqual(len(set(result)), 1000)
+
+    def test_iter_unique_samples_unknown_type(self):
+        with self.assertRaises(ValueError):
+            iter_unique_samples("unknown")
+
+    def test_iter_chunks(self):
+        result = list(iter_chunks(iter(range(10)), 7, 3))
+        self.assertEqual(result, [[0, 1, 2], [3, 4, 5], [6]])
+
+    def test_iter_chunks_short_input(self):
+        result = list(iter_chunks(iter(range(4)), 10, 3))
+        self.assertEqual(result, [[0, 1, 2], [3]])
+
+
+if __name__ == "__main__":
+    unittest.main()
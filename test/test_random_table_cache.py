@@ -0,0 +1,78 @@
+# Unit tests
+import os
+import tempfile
+import unittest
+
+from random_data_generation import table_cache
+from random_data_generation.table_cache import (
+    TABLE_CACHE_ENV,
+    get_cache_dir,
+    load_array_table,
+    load_object_table,
+    set_cache_dir,
+)
+
+
+class TestTableCache(unittest.TestCase):
+
+    def setUp(self):
+        self.previous_cache_dir = get_cache_dir()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        set_cache_dir(self.temp_dir.name)
+        self.builds = []
+
+    def tearDown(self):
+        set_cache_dir(self.previous_cache_dir)
+        self.temp_dir.cleanup()
+
+    def build_object(self):
+        self.builds.append(None)
+        return {("THB", True): ("฿", ",.2f", "", True)}
+
+    def build_array(self):
+        self.builds.append(None)
+        return table_cache.np.array([str(value) for value in range(1000)])
+
+    def test_set_cache_dir(self):
+        self.assertEqual(os.environ[TABLE_CACHE_ENV], self.temp_dir.name)
+        set_cache_dir(None)
+        self.assertIsNone(get_cache_dir())
+
+    def test_object_table(self):
+        first = load_object_table("plans", {"THB": ["฿", "THB"]}, self.build_object)
+        second = load_object_table("plans", {"THB": ["฿", "THB"]}, self.build_object)
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.builds), 1)
+
+        # Different sources are cached separately
+        load_object_table("plans", {"USD": ["$", "USD"]}, self.build_object)
+        self.assertEqual(len(self.builds), 2)
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 2)
+
+    def test_array_table(self):
+        if table_cache.np is None:
+            self.skipTest("NumPy is not installed")
+        first = load_array_table("groups", "0123456789", self.build_array)
+        second = load_array_table("groups", "0123456789", self.build_array)
+        self.assertEqual(len(self.builds), 1)
+        self.assertIsInstance(second, table_cache.np.memmap)
+        self.assertEqual(second.tolist(), first.tolist())
+
+    def test_corrupt_table_is_rebuilt(self):
+        load_object_table("plans", 1, self.build_object)
+        (file_name,) = os.listdir(self.temp_dir.name)
+        with open(os.path.join(self.temp_dir.name, file_name), "wb") as f:
+            f.write(b"not a pickle")
+        self.assertEqual(
+            load_object_table("plans", 1, self.build_object), self.build_object()
+        )
+
+    def test_without_cache(self):
+        set_cache_dir(None)
+        load_object_table("plans", 1, self.build_object)
+        load_object_table("plans", 1, self.build_object)
+        self.assertEqual(len(self.builds), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+# Unit tests
+import os
+import subprocess
+import sys
+import unittest
+
+from random_data_generation.unique import UniqueCollector
+
+
+class TestUniqueCollector(unittest.TestCase):
+
+    def test_add(self):
+        output = UniqueCollector()
+        self.assertTrue(output.add("b"))
+        self.assertTrue(output.add("a"))
+        self.assertFalse(output.add("b"))
+        self.assertEqual(len(output), 2)
+        self.assertIn("a", output)
+        self.assertNotIn("c", output)
+        self.assertEqual(output.to_list(), ["b", "a"])
+
+    def test_update_keeps_first_occurrences(self):
+        output = UniqueCollector()
+        self.assertEqual(output.update(["c", "a", "b"]), 3)
+        self.assertEqual(output.update(["d", "e", "d"]), 2)
+        self.assertEqual(output.update(["a", "f", "f", "c", "g"]), 2)
+        self.assertEqual(output.update([]), 0)
+        self.assertEqual(list(output), ["c", "a", "b", "d", "e", "f", "g"])
+
+    def test_generation_order_ignores_hash_seed(self):
+        code = (
+            "import random\n"
+            "from random_data_generation.registry import load_generator\n"
+            "for data_type in ['currency', 'date', 'license_plate']:\n"
+            "    random.seed(0)\n"
+            "    print(*load_generator(data_type).generate(200))\n"
+        )
+        outputs = [
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+                env={**os.environ, "PYTHONHASHSEED": hash_seed},
+            ).stdout
+            for hash_seed in ("1", "2")
+        ]
+        self.assertEqual(outputs[0], outputs[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
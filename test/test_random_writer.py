@@ -0,0 +1,64 @@
+# Unit tests
+import gzip
+import lzma
+import bz2
+import os
+import tempfile
+import unittest
+
+from random_data_generation.writer import BackgroundWriter, open_output
+
+
+class TestBackgroundWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_write_plain(self):
+        file_path = os.path.join(self.temp_dir.name, "data.txt")
+        with BackgroundWriter(file_path, max_queued_chunks=1) as writer:
+            writer.write(["01/08/2024", "๑๕ มิถุนายน ๒๕๖๗"])
+            writer.write([])
+            writer.write(["$ 1,234.56"])
+        self.assertEqual(writer.rows_written, 3)
+        with open(file_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "01/08/2024\n๑๕ มิถุนายน ๒๕๖๗\n$ 1,234.56")
+
+    def test_write_compressed(self):
+        for compression, opener in (
+            ("gzip", gzip.open),
+            ("xz", lzma.open),
+            ("bz2", bz2.open),
+        ):
+            file_path = os.path.join(self.temp_dir.name, f"data.{compression}")
+            with BackgroundWriter(file_path, compression) as writer:
+                writer.write(["a", "b"])
+                writer.write(["ค"])
+            with opener(file_path, "rt", encoding="utf-8") as f:
+                self.assertEqual(f.read(), "a\nb\nค")
+
+    def test_gzip_is_reproducible(self):
+        file_path = os.path.join(self.temp_dir.name, "data.gz")
+        with BackgroundWriter(file_path, "gzip") as writer:
+            writer.write(["a", "b"])
+        with open(file_path, "rb") as f:
+            # The modification time field of the header is zeroed
+            self.assertEqual(f.read(8)[4:], bytes(4))
+
+    def test_unknown_compression(self):
+        with self.assertRaises(ValueError):
+            open_output(os.path.join(self.temp_dir.name, "data"), "zip")
+
+    def test_writer_error_is_raised(self):
+        file_path = os.path.join(self.temp_dir.name, "data.txt")
+        writer = BackgroundWriter(file_path)
+        writer.write([object()])
+        with self.assertRaises(TypeError):
+            writer.close()
+
+
+if __name__ == "__main__":
+    unittest.main()